@@ -1,39 +1,37 @@
 """
 Script per aggiungere il parametro FixedCost_Annual_Growth all'Excel v7.
+
+La logica è in apply_all_param_updates.add_fixed_cost_growth; per applicare
+tutti gli aggiornamenti con un solo load/save usare apply_all_param_updates.py.
 """
-import pandas as pd
-from openpyxl import load_workbook
+import logging
+
+from apply_all_param_updates import (
+    add_fixed_cost_growth, invalidate_probe_cache, load_model_workbook,
+    log, params_all_present, probe_model, save_workbook_atomic
+)
 
 excel_path = 'ai_finance_dynamic_model_v7_channels.xlsx'
 
-# Carica il workbook
-wb = load_workbook(excel_path)
-ws = wb['Model']
+logging.basicConfig(format='%(message)s')
 
-# Trova l'ultima riga delle assumptions (cerca BaseFixedCost e aggiungi dopo)
-target_row = None
-for row in range(4, 100):
-    cell_value = ws.cell(row=row, column=2).value  # Column B = Parameter
-    if cell_value == 'BaseFixedCost':
-        target_row = row + 1
-        break
+# Parametro già presente: esci prima di toccare il file
+if params_all_present(excel_path, ['FixedCost_Annual_Growth']):
+    log.info("✓ FixedCost_Annual_Growth già presente, nessun salvataggio")
+    exit(0)
 
-if target_row is None:
-    print("ERROR: Parametro BaseFixedCost non trovato!")
-    exit(1)
-
-# Sposta tutte le righe successive in giù di 1
-ws.insert_rows(target_row)
+# Individua le righe in streaming, poi carica il workbook per le modifiche
+probe = probe_model(excel_path)
+wb = load_model_workbook(excel_path)
+ws = wb['Model']
 
-# Aggiungi il nuovo parametro
-ws.cell(row=target_row, column=1, value='Costs')  # Category
-ws.cell(row=target_row, column=2, value='FixedCost_Annual_Growth')  # Parameter
-ws.cell(row=target_row, column=3, value=0.05)  # Value (5%)
-ws.cell(row=target_row, column=4, value='% annual')  # Unit
-ws.cell(row=target_row, column=5, value='Annual growth rate of fixed costs (e.g., 0.05 = 5%)')  # Notes
+added = add_fixed_cost_growth(ws, probe)
+if added:
+    # Salva
+    save_workbook_atomic(wb, excel_path)
+    invalidate_probe_cache()
 
-print(f"✓ Aggiunto parametro 'FixedCost_Annual_Growth' alla riga {target_row}")
+if not added:
+    exit(1)
 
-# Salva
-wb.save(excel_path)
-print(f"✓ Salvato {excel_path}")
+log.info("✓ Salvato %s", excel_path)
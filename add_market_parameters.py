@@ -7,109 +7,43 @@ Aggiunge nella sezione Assumptions:
 - Market_Max_PayingUsers_Local (2000)
 - Market_Max_PayingUsers_Global (25000)
 - Follower_Adoption_Ramp_Months (24)
+
+La logica è in apply_all_param_updates.add_market_parameters; per applicare
+tutti gli aggiornamenti con un solo load/save usare apply_all_param_updates.py.
 """
 
-import openpyxl
+import logging
+
+from apply_all_param_updates import (
+    add_market_parameters as add_market_parameters_to_sheet, invalidate_probe_cache, load_model_workbook, log, MARKET_PARAMS, params_all_present, probe_model,
+    save_workbook_atomic
+)
 
 def add_market_parameters():
     excel_path = r'c:\Users\simia\Desktop\Business_analysis\ai_finance_dynamic_model_v7_channels.xlsx'
     
-    print(f"Opening Excel file: {excel_path}")
-    wb = openpyxl.load_workbook(excel_path)
-    ws = wb['Model']
-    
-    # Trova l'ultima riga delle assumptions (prima della sezione vuota)
-    last_assumption_row = None
-    for row_idx in range(3, 100):
-        cell_b = ws.cell(row=row_idx, column=2)  # Column B = Parameter
-        if cell_b.value is None or str(cell_b.value).strip() == '':
-            last_assumption_row = row_idx - 1
-            break
+    log.info("Opening Excel file: %s", excel_path)
     
-    if last_assumption_row is None:
-        print("ERROR: Could not find end of assumptions section")
+    if params_all_present(excel_path, (p[1] for p in MARKET_PARAMS)):
+        log.info("All parameters already exist in Excel. Nothing to add.")
         return
     
-    print(f"Last assumption row: {last_assumption_row}")
-    
-    # Controlla se i parametri esistono già
-    existing_params = set()
-    for row_idx in range(3, last_assumption_row + 1):
-        param = ws.cell(row=row_idx, column=2).value
-        if param:
-            existing_params.add(param)
-    
-    # Parametri da aggiungere
-    new_params = [
-        {
-            'category': 'MarketCaps',
-            'parameter': 'Market_Max_Followers_Local',
-            'value': 50000,
-            'unit': 'followers',
-            'notes': 'Max follower raggiungibili nel mercato nicchia Zurigo/Svizzera'
-        },
-        {
-            'category': 'MarketCaps',
-            'parameter': 'Market_Max_Followers_Global',
-            'value': 1000000,
-            'unit': 'followers',
-            'notes': 'Max follower raggiungibili a livello internazionale (espansione)'
-        },
-        {
-            'category': 'MarketCaps',
-            'parameter': 'Market_Max_PayingUsers_Local',
-            'value': 2000,
-            'unit': 'users',
-            'notes': 'Max paying users nel mercato nicchia Zurigo/Svizzera (~10-20% hardcore)'
-        },
-        {
-            'category': 'MarketCaps',
-            'parameter': 'Market_Max_PayingUsers_Global',
-            'value': 25000,
-            'unit': 'users',
-            'notes': 'Max paying users a livello internazionale'
-        },
-        {
-            'category': 'MarketCaps',
-            'parameter': 'Follower_Adoption_Ramp_Months',
-            'value': 24,
-            'unit': 'months',
-            'notes': 'Mesi necessari per raggiungere il massimo potenziale di crescita (brand nuovo)'
-        }
-    ]
+    probe = probe_model(excel_path)
+    wb = load_model_workbook(excel_path)
+    ws = wb['Model']
     
-    # Filtra parametri già esistenti
-    params_to_add = [p for p in new_params if p['parameter'] not in existing_params]
+    added = add_market_parameters_to_sheet(ws, probe)
     
-    if not params_to_add:
-        print("\nAll parameters already exist in Excel. Nothing to add.")
+    if not added:
         wb.close()
         return
     
-    print(f"\nAdding {len(params_to_add)} new parameters:")
-    
-    # Inserisci nuovi parametri dopo l'ultimo esistente
-    insert_row = last_assumption_row + 1
-    
-    for param in params_to_add:
-        print(f"  Row {insert_row}: {param['parameter']} = {param['value']}")
-        
-        ws.cell(row=insert_row, column=1, value=param['category'])  # A: Category
-        ws.cell(row=insert_row, column=2, value=param['parameter'])  # B: Parameter
-        ws.cell(row=insert_row, column=3, value=param['value'])      # C: Value
-        ws.cell(row=insert_row, column=4, value=param['unit'])       # D: Unit
-        ws.cell(row=insert_row, column=5, value=param['notes'])      # E: Notes
-        
-        insert_row += 1
-    
     # Salva
-    print(f"\nSaving Excel file...")
-    wb.save(excel_path)
-    wb.close()
-    
-    print(f"\n✓ Successfully added {len(params_to_add)} new TAM/SAM/SOM parameters!")
-    print(f"  Total assumptions now: {last_assumption_row - 2 + len(params_to_add)}")
+    log.info("Saving Excel file...")
+    save_workbook_atomic(wb, excel_path)
+    invalidate_probe_cache()
 
 
 if __name__ == "__main__":
+    logging.basicConfig(format='%(message)s')
     add_market_parameters()
@@ -10,121 +10,46 @@ NUOVI PARAMETRI DA AGGIUNGERE:
 
 PARAMETRI DA MANTENERE MA NON MODIFICABILI:
 - Inf_Visitors_per_Collab (sarà calcolato, non editabile)
+
+La logica è in apply_all_param_updates.add_new_parameters; per applicare
+tutti gli aggiornamenti con un solo load/save usare apply_all_param_updates.py.
 """
 
-import openpyxl
-from openpyxl.styles import Alignment
+import logging
 import sys
 
+from apply_all_param_updates import (
+    FOLLOWER_THRESHOLD_PARAM, NEW_PARAMS, add_new_parameters, invalidate_probe_cache,
+    load_model_workbook, log, params_all_present, probe_model, save_workbook_atomic
+)
+
 def add_parameters_to_excel(filepath: str):
     """Aggiungi i nuovi parametri all'Excel v7."""
     
     try:
-        wb = openpyxl.load_workbook(filepath)
-        # Il file ha un solo sheet 'Model' con tutto dentro
-        ws = wb.active
-        
-        print(f"📂 Caricato: {filepath}")
-        print(f"   Sheet: {ws.title}")
-        print(f"   Available sheets: {wb.sheetnames}")
-        
-        # Trova l'ultima riga con dati
-        last_row = ws.max_row
-        print(f"   Ultima riga: {last_row}")
-        
-        # Parametri da aggiungere
-        new_params = [
-            {
-                'Category': 'Influencer',
-                'Parameter': 'Inf_Avg_Followers',
-                'Value': 50000,
-                'Unit': 'followers',
-                'Notes': 'Average follower count of influencers (for calculation)'
-            },
-            {
-                'Category': 'Influencer',
-                'Parameter': 'Inf_Reach_Rate',
-                'Value': 0.3,
-                'Unit': 'decimal',
-                'Notes': 'Reach rate of influencer posts (30%)'
-            },
-            {
-                'Category': 'Influencer',
-                'Parameter': 'Inf_Click_Rate',
-                'Value': 0.02,
-                'Unit': 'decimal',
-                'Notes': 'Click-through rate from influencer posts to site (2%)'
-            },
-            {
-                'Category': 'Ads',
-                'Parameter': 'FollowerAds_CTR_to_Site',
-                'Value': 0.01,
-                'Unit': 'decimal',
-                'Notes': 'CTR from Follower Ads campaigns to website (1%)'
-            },
-        ]
+        output_path = filepath.replace('.xlsx', '_UPDATED.xlsx')
         
-        # Verifica se i parametri esistono già
-        existing_params = set()
-        for row in range(2, last_row + 1):
-            param_name = ws.cell(row=row, column=2).value
-            if param_name:
-                existing_params.add(param_name)
+        if params_all_present(filepath, [p[1] for p in NEW_PARAMS + [FOLLOWER_THRESHOLD_PARAM]]):
+            print(f"\n✅ Nessun parametro da aggiungere, Excel già aggiornato")
+            return True
         
-        print(f"\n📊 Parametri esistenti: {len(existing_params)}")
+        probe = probe_model(filepath)
+        wb = load_model_workbook(filepath)
+        # Il file ha un solo sheet 'Model' con tutto dentro
+        ws = wb.active
         
-        # Aggiungi i nuovi parametri
-        current_row = last_row + 1
-        added_count = 0
+        log.info("📂 Caricato: %s", filepath)
+        log.info("   Sheet: %s", ws.title)
+        log.info("   Available sheets: %s", wb.sheetnames)
         
-        for param in new_params:
-            if param['Parameter'] in existing_params:
-                print(f"⚠️  {param['Parameter']} - GIÀ ESISTENTE, salto")
-                continue
-            
-            # Aggiungi riga
-            ws.cell(row=current_row, column=1, value=param['Category'])
-            ws.cell(row=current_row, column=2, value=param['Parameter'])
-            ws.cell(row=current_row, column=3, value=param['Value'])
-            ws.cell(row=current_row, column=4, value=param['Unit'])
-            ws.cell(row=current_row, column=5, value=param['Notes'])
-            
-            # Allineamento
-            for col in range(1, 6):
-                ws.cell(row=current_row, column=col).alignment = Alignment(
-                    horizontal='left',
-                    vertical='center'
-                )
-            
-            print(f"✓ Riga {current_row}: {param['Parameter']} = {param['Value']}")
-            current_row += 1
-            added_count += 1
-        
-        # Verifica Follower_Threshold_For_Click_Ads
-        print("\n🔍 Verifico Follower_Threshold_For_Click_Ads...")
-        if 'Follower_Threshold_For_Click_Ads' in existing_params:
-            print("✓ Follower_Threshold_For_Click_Ads - GIÀ ESISTENTE")
-        else:
-            # Aggiungi anche questo
-            ws.cell(row=current_row, column=1, value='Ads')
-            ws.cell(row=current_row, column=2, value='Follower_Threshold_For_Click_Ads')
-            ws.cell(row=current_row, column=3, value=20000)
-            ws.cell(row=current_row, column=4, value='followers')
-            ws.cell(row=current_row, column=5, value='Threshold to switch from Follower Ads to Click Ads')
-            
-            for col in range(1, 6):
-                ws.cell(row=current_row, column=col).alignment = Alignment(
-                    horizontal='left',
-                    vertical='center'
-                )
-            
-            print(f"✓ Riga {current_row}: Follower_Threshold_For_Click_Ads = 20000")
-            added_count += 1
+        added_count = add_new_parameters(ws, probe)
         
         # Salva il file aggiornato
         if added_count > 0:
-            output_path = filepath.replace('.xlsx', '_UPDATED.xlsx')
-            wb.save(output_path)
+            save_workbook_atomic(wb, output_path)
+            invalidate_probe_cache()
+        
+        if added_count > 0:
             print(f"\n✅ Excel aggiornato con successo!")
             print(f"   File salvato come: {output_path}")
             print(f"   Parametri aggiunti: {added_count}")
@@ -135,13 +60,12 @@ def add_parameters_to_excel(filepath: str):
         return True
         
     except Exception as e:
-        print(f"\n❌ ERRORE: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        log.exception("❌ ERRORE: %s", e)
         return False
 
 
 if __name__ == '__main__':
+    logging.basicConfig(format='%(message)s')
     excel_file = 'ai_finance_dynamic_model_v7_channels.xlsx'
     
     print("=" * 80)
@@ -1,84 +1,50 @@
 #!/usr/bin/env python3
 """
 Script per aggiungere i nuovi parametri Paid Ads nell'Excel v7
+
+La logica è in apply_all_param_updates.add_paid_ads; per applicare tutti
+gli aggiornamenti con un solo load/save usare apply_all_param_updates.py.
 """
 
-import pandas as pd
-import openpyxl
-from openpyxl import load_workbook
+import logging
+
+from apply_all_param_updates import (
+    add_paid_ads, invalidate_probe_cache, load_model_workbook,
+    PAID_ADS_PARAMS, log, params_all_present, probe_model, save_workbook_atomic
+)
 
 excel_path = 'ai_finance_dynamic_model_v7_channels.xlsx'
 
+logging.basicConfig(format='%(message)s')
+
 print("=" * 80)
 print("AGGIORNAMENTO EXCEL v7 - NUOVI PARAMETRI PAID ADS")
 print("=" * 80)
 
-# Carica workbook
-print(f"\nCaricamento {excel_path}...")
-wb = load_workbook(excel_path)
-sheet = wb['Model']
-
-# Trova l'ultima riga con assumptions (dovrebbe essere riga 46)
-last_assumption_row = 46
-
-# Nuovi parametri da aggiungere
-new_params = [
-    {
-        'Category': 'Paid Social Ads',
-        'Parameter': 'ClickAds_CPC_EUR',
-        'Value': 2.0,
-        'Unit': 'EUR per click',
-        'Notes': 'Costo medio per click per campagne link-click (Fase 2)'
-    },
-    {
-        'Category': 'Paid Social Ads',
-        'Parameter': 'Follower_Threshold_For_Click_Ads',
-        'Value': 20000,
-        'Unit': 'followers',
-        'Notes': 'Soglia followers per switch da Follower Ads (Fase 1) a Click Ads (Fase 2)'
-    }
-]
-
-# Controlla se i parametri esistono già
-print("\nVerifica parametri esistenti...")
-existing_params = []
-for row in range(4, 50):  # Scansiona righe assumptions
-    param_name = sheet.cell(row, 2).value
-    if param_name:
-        existing_params.append(str(param_name))
+output_path = 'ai_finance_dynamic_model_v7_channels_updated.xlsx'
 
-params_to_add = []
-for param in new_params:
-    if param['Parameter'] not in existing_params:
-        params_to_add.append(param)
-        print(f"  ✓ {param['Parameter']} - DA AGGIUNGERE")
-    else:
-        print(f"  → {param['Parameter']} - GIÀ PRESENTE")
-
-if not params_to_add:
-    print("\n✓ Tutti i parametri sono già presenti nell'Excel!")
+# Carica workbook
+log.info("Caricamento %s...", excel_path)
+added = None
+if params_all_present(excel_path, (p[1] for p in PAID_ADS_PARAMS)):
+    # Nessun parametro mancante: niente load openpyxl
+    added = 0
+
+if added is None:
+    probe = probe_model(excel_path)
+    wb = load_model_workbook(excel_path)
+    sheet = wb['Model']
+    
+    added = add_paid_ads(sheet, probe)
+    if added:
+        # Salva il file
+        log.info("Salvataggio in %s...", output_path)
+        save_workbook_atomic(wb, output_path)
+        invalidate_probe_cache()
+
+if not added:
     print("Nessuna modifica necessaria.")
 else:
-    print(f"\nAggiunta di {len(params_to_add)} nuovi parametri...")
-    
-    # Aggiungi i nuovi parametri dopo l'ultima assumption
-    current_row = last_assumption_row + 1
-    
-    for param in params_to_add:
-        sheet.cell(current_row, 1).value = param['Category']
-        sheet.cell(current_row, 2).value = param['Parameter']
-        sheet.cell(current_row, 3).value = param['Value']
-        sheet.cell(current_row, 4).value = param['Unit']
-        sheet.cell(current_row, 5).value = param['Notes']
-        
-        print(f"  ✓ Riga {current_row}: {param['Parameter']} = {param['Value']}")
-        current_row += 1
-    
-    # Salva il file
-    output_path = 'ai_finance_dynamic_model_v7_channels_updated.xlsx'
-    print(f"\nSalvataggio in {output_path}...")
-    wb.save(output_path)
-    
     print(f"\n✅ Excel aggiornato con successo!")
     print(f"\nFile creato: {output_path}")
     print("\nProssimi passi:")
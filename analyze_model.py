@@ -9,85 +9,218 @@ performs sanity checks, and creates investor-ready visualizations.
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Charts are only saved to file: skip GUI backend initialisation
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.ticker import StrMethodFormatter
 import seaborn as sns
 from openpyxl import load_workbook
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+import hashlib
+import io
+import sys
 import warnings
-import xlwings as xw
-warnings.filterwarnings('ignore')
+
+from excel_engine import EXCEL_ENGINE
+
+# openpyxl warns about unsupported extensions/validation in every workbook; keep other warnings visible
+warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
 
 # Set visualization style
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
 plt.rcParams['font.size'] = 10
+# Simplify line paths aggressively when rasterising (sub-pixel vertices are dropped)
+plt.rcParams.update({'path.simplify': True, 'path.simplify_threshold': 1.0, 'agg.path.chunksize': 10000})
+
+# Tick formatters shared by every chart (StrMethodFormatter keeps no per-axis state)
+EUR_FMT = StrMethodFormatter('€{x:,.0f}')
+INT_FMT = StrMethodFormatter('{x:,.0f}')
 
 # Flag to use xlwings for formula evaluation (Windows only)
 USE_XLWINGS = False  # Set to True if xlwings is available and Excel is installed
+if USE_XLWINGS:
+    import xlwings as xw  # imported only when enabled: the COM/DLL probe is slow
+
+# openpyxl load options for every workbook read here: stream cells, cached values only,
+# no external links (same keys pandas accepts as read_excel(engine_kwargs=...))
+OPENPYXL_KW = {'read_only': True, 'data_only': True, 'keep_links': False}
+
+# Parsed-sheet cache (disable with --no-cache), keyed by the hash of the xlsx contents plus the
+# reader that parsed it. Only the raw sheet is stored: assumptions and tables are always extracted
+# from it by the current code. Kept next to this script, not in the working directory
+CACHE_DIR = Path(__file__).resolve().parent / '.cache'
+
+# Static narrative pieces, built once at import
+RULE = "=" * 80
+NL_RULE = "\n" + RULE
+SECTION_RULE = "-" * 40
+NARRATIVE_FOOTER = (f"\n{RULE}\n"
+                    "\n*This analysis is based on the assumptions in the financial model.*\n"
+                    "*Actual results may vary based on market conditions and execution.*\n"
+                    f"\n{RULE}")
+
+# Key groups tested with a single subset check against the assumptions dict / frame columns
+CONV_KEYS = frozenset(('ConvVS', 'ConvSP'))
+CHURN_KEYS = frozenset(('ChurnY1', 'ChurnY2', 'ChurnY3'))
+VISITOR_COLS = frozenset(('Visitors_Total', 'Visitors_from_Social', 'Inf_Visitors'))
+FUNNEL_COLS = frozenset(('Social_Views', 'Visitors_Total', 'New_Paying_Users'))
+UNIT_ECON_COLS = frozenset(('Year', 'Average_CAC_EUR', 'LTV_EUR'))
+LTV_CAC_COLS = frozenset(('Average_CAC_EUR', 'LTV_EUR', 'LTV_CAC_Ratio'))
+
+
+def fmt_eur(x):
+    """'€1,234' via integer grouping (cheaper than float ',.0f'); NaN/inf keep the float formatter."""
+    if not np.isfinite(x):
+        return f"€{x:,.0f}"
+    return f"€{int(round(x)):,}"
+
+
+def format_numbers(series, fmt):
+    """Format a numeric column with fmt (e.g. '{:,.0f}'), NaN -> ''; loops over the raw array, no Series boxing."""
+    values = series.to_numpy()
+    missing = pd.isna(values)
+    return [('' if na else fmt.format(v)) for v, na in zip(values, missing)]
+
+
+def shrink_dtypes(df, key_cols=()):
+    """Downcast numeric columns to the smallest dtype that holds them.
+    
+    Float columns go to float32 only when every value round-trips exactly; rates and shares
+    that float32 cannot represent stay float64. key_cols (e.g. Year/Month) are cast to compact
+    integers once, when every value is a whole number.
+    """
+    df = df.copy()
+    for col in key_cols:
+        if col in df.columns:
+            keys = pd.to_numeric(df[col], errors='coerce')
+            if keys.notna().all() and (keys % 1 == 0).all():
+                df[col] = keys.astype('int64')
+    for col in df.select_dtypes(include='float').columns:
+        values = df[col]
+        small = values.astype(np.float32)
+        if ((small.astype(np.float64) == values) | values.isna()).all():
+            df[col] = small
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    return df
+
 
 class FinancialModelAnalyzer:
     """Analyzes Excel financial model with assumptions, monthly projections, and yearly summaries."""
     
-    def __init__(self, filepath):
+    def __init__(self, filepath, use_cache=True):
         self.filepath = filepath
+        self.use_cache = use_cache
         self.workbook = None
         self.sheet = None
         self.assumptions = {}
         self.monthly_df = None
         self.yearly_df = None
+        self._xl = None
+        self._df_full = None
+        self._sheet_name = None
+        self._row_text_cache = None
+        self._summaries = None
         
     def load_excel(self):
         """Load Excel file and identify the Model sheet."""
-        print("=" * 80)
+        print(RULE)
         print("STEP 1: LOADING AND PARSING EXCEL FILE")
-        print("=" * 80)
-        
-        # Load with openpyxl to preserve formulas
-        self.workbook = load_workbook(self.filepath, data_only=True)
+        print(RULE)
+        
+        # Warm run: same file contents already parsed -> skip openpyxl entirely
+        cache_hash = hashlib.blake2b(Path(self.filepath).read_bytes(), digest_size=16)
+        cache_hash.update(repr((EXCEL_ENGINE, pd.__version__)).encode())
+        frame_cache = CACHE_DIR / f"{cache_hash.hexdigest()}.pkl"
+        if self.use_cache and frame_cache.exists():
+            cached = pd.read_pickle(frame_cache)
+            self._sheet_name, self._df_full = cached['sheet_name'], cached['frame']
+            print(f"✓ Loaded cached sheet '{self._sheet_name}' ({frame_cache})")
+            print(f"  Max row: {self._df_full.shape[0]}, Max column: {self._df_full.shape[1]}")
+            return
         
-        # Find the Model sheet
-        if "Model" in self.workbook.sheetnames:
-            self.sheet = self.workbook["Model"]
+        if EXCEL_ENGINE == 'calamine':
+            # Native reader: cached cell values straight into pandas, no openpyxl cell objects
+            self._xl = pd.ExcelFile(self.filepath, engine='calamine')
+            sheetnames = self._xl.sheet_names
+        else:
+            # Streaming (read_only) load: the analysis only reads cached cell values.
+            # pandas reuses this workbook instead of opening the file again
+            self.workbook = load_workbook(self.filepath, **OPENPYXL_KW)
+            sheetnames = self.workbook.sheetnames
+            self._xl = pd.ExcelFile(self.workbook, engine="openpyxl")
+        
+        # Resolve the Model sheet once (fallback: first sheet); everything below uses self._sheet_name
+        self._sheet_name = "Model" if "Model" in sheetnames else sheetnames[0]
+        if self.workbook is not None:
+            self.sheet = self.workbook[self._sheet_name]
+        if self._sheet_name == "Model":
             print(f"✓ Found 'Model' sheet")
         else:
-            # Try first sheet
-            self.sheet = self.workbook[self.workbook.sheetnames[0]]
-            print(f"⚠ Using first sheet: {self.workbook.sheetnames[0]}")
+            print(f"⚠ Using first sheet: {self._sheet_name}")
+        
+        # Parse the sheet ONCE; the extract_* methods slice this cached frame
+        self._df_full = self._xl.parse(self._sheet_name, header=None)
+        
+        print(f"✓ Workbook loaded successfully ({EXCEL_ENGINE})")
+        print(f"  Sheet name: {self._sheet_name}")
+        # read_only sheets have no reliable max_row/max_column: use the parsed frame
+        print(f"  Max row: {self._df_full.shape[0]}, Max column: {self._df_full.shape[1]}")
+        
+        if self.use_cache:
+            CACHE_DIR.mkdir(exist_ok=True)
+            pd.to_pickle({'sheet_name': self._sheet_name, 'frame': self._df_full}, frame_cache)
+    
+    def _row_text(self):
+        """Lower-cased text of every sheet row (non-empty cells joined by spaces), built column-wise once."""
+        if self._row_text_cache is None:
+            cells = self._df_full.fillna('').astype(str)
+            self._row_text_cache = reduce(lambda a, b: a + ' ' + b,
+                                          (cells[col] for col in cells.columns)).str.lower()
+        return self._row_text_cache
+    
+    def _first_row(self, mask):
+        """Index of the first row where mask is True, or None."""
+        hits = mask.index[mask.to_numpy()]
+        return hits[0] if len(hits) else None
+    
+    def _table_from_header(self, header_idx):
+        """Build a table from the cached sheet using row header_idx as header (like read_excel(header=...)).
         
-        print(f"✓ Workbook loaded successfully")
-        print(f"  Sheet name: {self.sheet.title}")
-        print(f"  Max row: {self.sheet.max_row}, Max column: {self.sheet.max_column}")
+        Slices the frame parsed once in load_excel, so no extractor re-opens the workbook.
+        """
+        header = self._df_full.iloc[header_idx]
+        df = self._df_full.iloc[header_idx + 1:].reset_index(drop=True)
+        df.columns = [str(h) if pd.notna(h) else f"Unnamed: {i}" for i, h in enumerate(header)]
+        return df.infer_objects()
         
     def extract_assumptions(self):
         """Extract assumptions from the top section of the sheet."""
-        print("\n" + "=" * 80)
+        print(NL_RULE)
         print("STEP 2: EXTRACTING ASSUMPTIONS")
-        print("=" * 80)
-        
-        # Read the entire sheet as a DataFrame to analyze structure
-        df_full = pd.read_excel(self.filepath, sheet_name="Model" if "Model" in pd.ExcelFile(self.filepath).sheet_names else 0, header=None)
+        print(RULE)
         
         # Find assumptions table (look for "Category", "Parameter", "Value" headers)
-        assumptions_start = None
-        for idx, row in df_full.iterrows():
-            row_str = ' '.join([str(x).lower() for x in row.values if pd.notna(x)])
-            if 'category' in row_str and 'parameter' in row_str and 'value' in row_str:
-                assumptions_start = idx
-                print(f"✓ Found assumptions header at row {idx}")
-                break
-        
+        text = self._row_text()
+        assumptions_start = self._first_row(text.str.contains('category', regex=False)
+                                            & text.str.contains('parameter', regex=False)
+                                            & text.str.contains('value', regex=False))
         if assumptions_start is not None:
-            # Read assumptions table
-            assumptions_df = pd.read_excel(self.filepath, sheet_name="Model" if "Model" in pd.ExcelFile(self.filepath).sheet_names else 0, 
-                                          header=assumptions_start)
-            
-            # Extract key-value pairs (Parameter -> Value)
-            for idx, row in assumptions_df.iterrows():
-                if pd.notna(row.get('Parameter')) and pd.notna(row.get('Value')):
-                    param = str(row['Parameter']).strip()
-                    value = row['Value']
-                    if param and param != 'Parameter':  # Skip header repeats
-                        self.assumptions[param] = value
+            print(f"✓ Found assumptions header at row {assumptions_start}")
+            # Slice assumptions table from the cached sheet
+            assumptions_df = self._table_from_header(assumptions_start)
+            
+            # Extract key-value pairs (Parameter -> Value) in one vectorized pass
+            if {'Parameter', 'Value'} <= set(assumptions_df.columns):
+                params = assumptions_df['Parameter'].astype(str).str.strip()
+                mask = (assumptions_df['Parameter'].notna() & assumptions_df['Value'].notna()
+                        & (params != '') & (params != 'Parameter'))  # Skip blanks and header repeats
+                self.assumptions.update(zip(params[mask].to_numpy(),
+                                            assumptions_df.loc[mask, 'Value'].to_numpy()))
             
             print(f"✓ Extracted {len(self.assumptions)} assumptions")
             
@@ -95,32 +228,25 @@ class FinancialModelAnalyzer:
     
     def extract_monthly_model(self):
         """Extract 36-month projections."""
-        print("\n" + "=" * 80)
+        print(NL_RULE)
         print("STEP 2B: EXTRACTING MONTHLY MODEL (36 months)")
-        print("=" * 80)
-        
-        # Read the entire sheet
-        df_full = pd.read_excel(self.filepath, sheet_name="Model" if "Model" in pd.ExcelFile(self.filepath).sheet_names else 0, header=None)
+        print(RULE)
         
         # Find monthly model header (look for "Year", "Month", "Social_Views", etc.)
-        monthly_start = None
-        for idx, row in df_full.iterrows():
-            row_str = ' '.join([str(x).lower() for x in row.values if pd.notna(x)])
-            if 'month' in row_str and ('social_views' in row_str or 'visitors' in row_str or 'mrr' in row_str):
-                monthly_start = idx
-                print(f"✓ Found monthly model header at row {idx}")
-                break
-        
+        text = self._row_text()
+        monthly_start = self._first_row(text.str.contains('month', regex=False)
+                                        & text.str.contains('social_views|visitors|mrr', regex=True))
         if monthly_start is not None:
-            # Read monthly data
-            self.monthly_df = pd.read_excel(self.filepath, sheet_name="Model" if "Model" in pd.ExcelFile(self.filepath).sheet_names else 0,
-                                           header=monthly_start)
+            print(f"✓ Found monthly model header at row {monthly_start}")
+            # Slice monthly data from the cached sheet
+            self.monthly_df = self._table_from_header(monthly_start)
             
             # Clean column names
             self.monthly_df.columns = self.monthly_df.columns.str.strip()
             
             # Filter to 36 rows (3 years)
-            self.monthly_df = self.monthly_df[self.monthly_df['Year'].notna()].head(36)
+            self.monthly_df = shrink_dtypes(self.monthly_df.dropna(subset=['Year']).head(36),
+                                            key_cols=('Year', 'Month'))
             
             print(f"✓ Extracted {len(self.monthly_df)} months of data")
             print(f"✓ Columns: {', '.join(self.monthly_df.columns[:8])}...")
@@ -129,32 +255,25 @@ class FinancialModelAnalyzer:
     
     def extract_yearly_summary(self):
         """Extract yearly summary table."""
-        print("\n" + "=" * 80)
+        print(NL_RULE)
         print("STEP 2C: EXTRACTING YEARLY SUMMARY")
-        print("=" * 80)
-        
-        # Read the entire sheet
-        df_full = pd.read_excel(self.filepath, sheet_name="Model" if "Model" in pd.ExcelFile(self.filepath).sheet_names else 0, header=None)
+        print(RULE)
         
         # Find yearly summary (look for headers like "End_Paying_Users", "ARR_EUR", etc.)
-        yearly_start = None
-        for idx, row in df_full.iterrows():
-            row_str = ' '.join([str(x).lower() for x in row.values if pd.notna(x)])
-            if 'arr_eur' in row_str or ('ltv' in row_str and 'cac' in row_str):
-                yearly_start = idx
-                print(f"✓ Found yearly summary header at row {idx}")
-                break
-        
+        text = self._row_text()
+        yearly_start = self._first_row(text.str.contains('arr_eur', regex=False)
+                                       | (text.str.contains('ltv', regex=False)
+                                          & text.str.contains('cac', regex=False)))
         if yearly_start is not None:
-            # Read yearly data
-            self.yearly_df = pd.read_excel(self.filepath, sheet_name="Model" if "Model" in pd.ExcelFile(self.filepath).sheet_names else 0,
-                                          header=yearly_start)
+            print(f"✓ Found yearly summary header at row {yearly_start}")
+            # Slice yearly data from the cached sheet
+            self.yearly_df = self._table_from_header(yearly_start)
             
             # Clean column names
             self.yearly_df.columns = self.yearly_df.columns.str.strip()
             
             # Filter to 3 years
-            self.yearly_df = self.yearly_df[self.yearly_df['Year'].notna()].head(3)
+            self.yearly_df = shrink_dtypes(self.yearly_df.dropna(subset=['Year']).head(3), key_cols=('Year',))
             
             print(f"✓ Extracted {len(self.yearly_df)} years of summary data")
             print(f"✓ Columns: {', '.join(self.yearly_df.columns[:8])}...")
@@ -163,9 +282,9 @@ class FinancialModelAnalyzer:
     
     def sanity_checks(self):
         """Perform data validation checks."""
-        print("\n" + "=" * 80)
+        print(NL_RULE)
         print("STEP 3: SANITY CHECKS")
-        print("=" * 80)
+        print(RULE)
         
         issues = []
         
@@ -184,11 +303,13 @@ class FinancialModelAnalyzer:
         # Check 2: Months are sequential
         print("\n2. Checking months are sequential (1-12 per year)...")
         if self.monthly_df is not None:
+            # One groupby pass instead of three boolean masks over the frame
+            months_by_year = {year: sorted(group.to_numpy())
+                              for year, group in self.monthly_df.groupby('Year')['Month']}
+            expected = list(range(1, 13))
             for year in [1, 2, 3]:
-                year_data = self.monthly_df[self.monthly_df['Year'] == year]
-                months = sorted(year_data['Month'].values)
-                expected = list(range(1, 13))
-                if list(months) != expected:
+                months = months_by_year.get(year, [])
+                if months != expected:
                     issues.append(f"Year {year} months are not 1-12: {months}")
                     print(f"  ⚠ Year {year}: {months}")
                 else:
@@ -197,9 +318,10 @@ class FinancialModelAnalyzer:
         # Check 3: Cumulative cash consistency
         print("\n3. Checking cumulative cash consistency...")
         if self.monthly_df is not None and 'Net_Cash_Flow' in self.monthly_df.columns and 'Cumulative_Cash' in self.monthly_df.columns:
-            calc_cumulative = self.monthly_df['Net_Cash_Flow'].cumsum()
-            actual_cumulative = self.monthly_df['Cumulative_Cash']
-            max_diff = abs(calc_cumulative - actual_cumulative).max()
+            # Raw float64 arrays: no index alignment, one contiguous pass
+            net_cash = self.monthly_df['Net_Cash_Flow'].to_numpy(dtype=float)
+            actual_cumulative = self.monthly_df['Cumulative_Cash'].to_numpy(dtype=float)
+            max_diff = np.fmax.reduce(np.abs(np.nancumsum(net_cash) - actual_cumulative))  # NaN-skipping, NaN if nothing to compare
             if max_diff > 1.0:  # Allow 1 EUR rounding error
                 issues.append(f"Cumulative cash mismatch (max diff: {max_diff:.2f} EUR)")
                 print(f"  ⚠ Max difference: {max_diff:.2f} EUR")
@@ -209,11 +331,10 @@ class FinancialModelAnalyzer:
         # Check 4: Visitors total = Visitors_from_Social + Inf_Visitors
         print("\n4. Checking visitor totals...")
         if self.monthly_df is not None:
-            required_cols = ['Visitors_Total', 'Visitors_from_Social', 'Inf_Visitors']
-            if all(col in self.monthly_df.columns for col in required_cols):
-                calc_total = self.monthly_df['Visitors_from_Social'] + self.monthly_df['Inf_Visitors']
-                actual_total = self.monthly_df['Visitors_Total']
-                max_diff = abs(calc_total - actual_total).max()
+            if VISITOR_COLS.issubset(self.monthly_df.columns):
+                social, influencer, actual_total = (self.monthly_df[col].to_numpy(dtype=float)
+                                                    for col in ['Visitors_from_Social', 'Inf_Visitors', 'Visitors_Total'])
+                max_diff = np.fmax.reduce(np.abs(social + influencer - actual_total))
                 if max_diff > 1.0:
                     issues.append(f"Visitor totals mismatch (max diff: {max_diff:.2f})")
                     print(f"  ⚠ Max difference: {max_diff:.2f}")
@@ -233,9 +354,9 @@ class FinancialModelAnalyzer:
     
     def create_key_assumptions_table(self):
         """Generate markdown table of key assumptions."""
-        print("\n" + "=" * 80)
+        print(NL_RULE)
         print("STEP 4A: KEY ASSUMPTIONS TABLE")
-        print("=" * 80)
+        print(RULE)
         
         # Key parameters to display
         key_params = [
@@ -263,23 +384,28 @@ class FinancialModelAnalyzer:
             ('Broker_TargetCapital', 'Capital'),
         ]
         
-        table_data = []
-        for param, category in key_params:
-            if param in self.assumptions:
-                value = self.assumptions[param]
-                # Format value
-                if isinstance(value, (int, float)):
-                    if param.startswith('Conv') or param.endswith('Rate') or 'Margin' in param:
-                        formatted = f"{value:.2%}" if value < 1 else f"{value:.4f}"
-                    elif 'Churn' in param:
-                        formatted = f"{value:.2%}"
-                    else:
-                        formatted = f"{value:,.2f}"
-                else:
-                    formatted = str(value)
-                table_data.append([category, param, formatted])
-        
-        df_table = pd.DataFrame(table_data, columns=['Category', 'Parameter', 'Value'])
+        # Lookup frame joined to the assumptions dict (object dtype keeps the raw Python values)
+        spec = pd.DataFrame(key_params, columns=['Parameter', 'Category'])
+        spec = spec[spec['Parameter'].isin(self.assumptions.keys())].reset_index(drop=True)
+        values = pd.Series([self.assumptions[p] for p in spec['Parameter']], dtype=object)
+        
+        # Pick the format family once per parameter, then format in a single pass
+        names = spec['Parameter'].str
+        is_number = values.map(lambda v: isinstance(v, (int, float))).to_numpy(dtype=bool)
+        kind = np.select(
+            [~is_number,
+             (names.startswith('Conv') | names.endswith('Rate') | names.contains('Margin')).to_numpy(),
+             names.contains('Churn').to_numpy()],
+            ['text', 'ratio', 'pct'], default='amount')
+        formatters = {
+            'text': str,
+            'ratio': lambda v: f"{v:.2%}" if v < 1 else f"{v:.4f}",
+            'pct': lambda v: f"{v:.2%}",
+            'amount': lambda v: f"{v:,.2f}",
+        }
+        spec['Value'] = [formatters[k](v) for k, v in zip(kind, values)]
+        
+        df_table = spec[['Category', 'Parameter', 'Value']]
         
         print("\n" + df_table.to_string(index=False))
         
@@ -287,9 +413,9 @@ class FinancialModelAnalyzer:
     
     def create_yearly_summary_table(self):
         """Generate clean yearly summary table."""
-        print("\n" + "=" * 80)
+        print(NL_RULE)
         print("STEP 4B: YEARLY SUMMARY TABLE")
-        print("=" * 80)
+        print(RULE)
         
         if self.yearly_df is not None:
             # Select key columns
@@ -302,15 +428,11 @@ class FinancialModelAnalyzer:
             available_cols = [col for col in key_cols if col in self.yearly_df.columns]
             df_summary = self.yearly_df[available_cols].copy()
             
-            # Format numeric columns
-            for col in df_summary.columns:
-                if col != 'Year' and df_summary[col].dtype in ['float64', 'int64']:
-                    if 'Ratio' in col or 'Share' in col:
-                        df_summary[col] = df_summary[col].apply(lambda x: f"{x:.2f}" if pd.notna(x) else '')
-                    elif 'EUR' in col or 'Marketing' in col or 'Cash' in col:
-                        df_summary[col] = df_summary[col].apply(lambda x: f"{x:,.0f}" if pd.notna(x) else '')
-                    else:
-                        df_summary[col] = df_summary[col].apply(lambda x: f"{x:,.0f}" if pd.notna(x) else '')
+            # Format numeric columns: ratios/shares with 2 decimals, everything else as integers
+            numeric_cols = df_summary.select_dtypes(include='number').columns.drop('Year', errors='ignore')
+            for col in numeric_cols:
+                fmt = '{:.2f}' if ('Ratio' in col or 'Share' in col) else '{:,.0f}'
+                df_summary[col] = format_numbers(df_summary[col], fmt)
             
             print("\n" + df_summary.to_string(index=False))
             
@@ -320,9 +442,9 @@ class FinancialModelAnalyzer:
     
     def create_monthly_funnel_table(self):
         """Generate compact monthly funnel table."""
-        print("\n" + "=" * 80)
+        print(NL_RULE)
         print("STEP 4C: MONTHLY FUNNEL TABLE (First 12 months sample)")
-        print("=" * 80)
+        print(RULE)
         
         if self.monthly_df is not None:
             # Select key columns
@@ -335,12 +457,9 @@ class FinancialModelAnalyzer:
             df_funnel = self.monthly_df[available_cols].head(12).copy()
             
             # Format numeric columns
-            for col in df_funnel.columns:
-                if col not in ['Year', 'Month'] and df_funnel[col].dtype in ['float64', 'int64']:
-                    if 'MRR' in col or 'Cash' in col:
-                        df_funnel[col] = df_funnel[col].apply(lambda x: f"{x:,.0f}" if pd.notna(x) else '')
-                    else:
-                        df_funnel[col] = df_funnel[col].apply(lambda x: f"{x:,.0f}" if pd.notna(x) else '')
+            numeric_cols = df_funnel.select_dtypes(include='number').columns.drop(['Year', 'Month'], errors='ignore')
+            for col in numeric_cols:
+                df_funnel[col] = format_numbers(df_funnel[col], '{:,.0f}')
             
             print("\n" + df_funnel.to_string(index=False))
             print("\n(Showing first 12 months only; full dataset has 36 months)")
@@ -349,52 +468,53 @@ class FinancialModelAnalyzer:
         
         return None
     
-    def create_visualizations(self):
-        """Create all required charts."""
-        print("\n" + "=" * 80)
-        print("STEP 5: CREATING VISUALIZATIONS")
-        print("=" * 80)
+    def create_visualizations(self, log=print):
+        """Create all required charts (progress messages go through log, print by default)."""
+        log(NL_RULE)
+        log("STEP 5: CREATING VISUALIZATIONS")
+        log(RULE)
         
         if self.monthly_df is None:
-            print("⚠ Cannot create visualizations: monthly data not available")
+            log("⚠ Cannot create visualizations: monthly data not available")
             return
         
-        # Create month index for x-axis
-        self.monthly_df['MonthIndex'] = range(1, len(self.monthly_df) + 1)
+        # Month index for the x-axis, kept local: the narrative reads monthly_df on the main thread
+        months = np.arange(1, len(self.monthly_df) + 1)
         
-        # Create figure with subplots
-        fig = plt.figure(figsize=(16, 12))
+        def monthly(col):
+            """Column as a float array: matplotlib gets plain NumPy, no pandas conversion per plot."""
+            return self.monthly_df[col].to_numpy(dtype=float)
+        
+        # Standalone Figure (not registered with pyplot, so safe off the main thread) and all six
+        # axes in one call; constrained layout replaces tight_layout
+        fig = Figure(figsize=(16, 12), constrained_layout=True)
+        ((ax1, ax2), (ax3, ax4), (ax5, ax6)) = fig.subplots(3, 2)
         
         # 1. MRR over time
-        print("\n1. Creating MRR over time chart...")
-        ax1 = plt.subplot(3, 2, 1)
+        log("\n1. Creating MRR over time chart...")
         if 'MRR' in self.monthly_df.columns:
-            ax1.plot(self.monthly_df['MonthIndex'], self.monthly_df['MRR'], 
-                    marker='o', linewidth=2, markersize=4, color='#2E86AB')
+            ax1.plot(months, monthly('MRR'), 
+                    linewidth=2, color='#2E86AB')
             ax1.set_title('Monthly Recurring Revenue (MRR) - 36 Months', fontweight='bold', fontsize=12)
             ax1.set_xlabel('Month')
             ax1.set_ylabel('MRR (EUR)')
-            ax1.grid(True, alpha=0.3)
-            ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+            ax1.yaxis.set_major_formatter(EUR_FMT)
         
         # 2. Paying users over time
-        print("2. Creating paying users chart...")
-        ax2 = plt.subplot(3, 2, 2)
+        log("2. Creating paying users chart...")
         if 'Paying_Users_End' in self.monthly_df.columns:
-            ax2.plot(self.monthly_df['MonthIndex'], self.monthly_df['Paying_Users_End'], 
-                    marker='o', linewidth=2, markersize=4, color='#A23B72')
+            ax2.plot(months, monthly('Paying_Users_End'), 
+                    linewidth=2, color='#A23B72')
             ax2.set_title('Paying Users Growth', fontweight='bold', fontsize=12)
             ax2.set_xlabel('Month')
             ax2.set_ylabel('Paying Users')
-            ax2.grid(True, alpha=0.3)
-            ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'))
+            ax2.yaxis.set_major_formatter(INT_FMT)
         
         # 3. Cumulative cash over time
-        print("3. Creating cumulative cash chart...")
-        ax3 = plt.subplot(3, 2, 3)
+        log("3. Creating cumulative cash chart...")
         if 'Cumulative_Cash' in self.monthly_df.columns:
-            ax3.plot(self.monthly_df['MonthIndex'], self.monthly_df['Cumulative_Cash'], 
-                    marker='o', linewidth=2, markersize=4, color='#F18F01')
+            ax3.plot(months, monthly('Cumulative_Cash'), 
+                    linewidth=2, color='#F18F01')
             ax3.axhline(y=0, color='red', linestyle='--', alpha=0.5, label='Break-even')
             
             # Add Broker_TargetCapital line if available
@@ -406,25 +526,23 @@ class FinancialModelAnalyzer:
             ax3.set_title('Cumulative Cash Flow', fontweight='bold', fontsize=12)
             ax3.set_xlabel('Month')
             ax3.set_ylabel('Cumulative Cash (EUR)')
-            ax3.grid(True, alpha=0.3)
             ax3.legend()
-            ax3.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+            ax3.yaxis.set_major_formatter(EUR_FMT)
         
         # 4. Pipeline funnel: Social views → Visitors → Paying users
-        print("4. Creating pipeline funnel chart...")
-        ax4 = plt.subplot(3, 2, 4)
-        if all(col in self.monthly_df.columns for col in ['Social_Views', 'Visitors_Total', 'New_Paying_Users']):
+        log("4. Creating pipeline funnel chart...")
+        if FUNNEL_COLS.issubset(self.monthly_df.columns):
             ax4_twin1 = ax4.twinx()
             ax4_twin2 = ax4.twinx()
             
             # Offset the right spine
             ax4_twin2.spines['right'].set_position(('outward', 60))
             
-            p1 = ax4.plot(self.monthly_df['MonthIndex'], self.monthly_df['Social_Views'], 
+            p1 = ax4.plot(months, monthly('Social_Views'), 
                          label='Social Views', color='#C9ADA7', linewidth=2)
-            p2 = ax4_twin1.plot(self.monthly_df['MonthIndex'], self.monthly_df['Visitors_Total'], 
+            p2 = ax4_twin1.plot(months, monthly('Visitors_Total'), 
                                label='Total Visitors', color='#6A4C93', linewidth=2)
-            p3 = ax4_twin2.plot(self.monthly_df['MonthIndex'], self.monthly_df['New_Paying_Users'], 
+            p3 = ax4_twin2.plot(months, monthly('New_Paying_Users'), 
                                label='New Paying Users', color='#22223B', linewidth=2)
             
             ax4.set_xlabel('Month')
@@ -444,11 +562,10 @@ class FinancialModelAnalyzer:
             ax4.legend(lines, labels, loc='upper left')
         
         # 5. Channel contribution (influencers vs social)
-        print("5. Creating channel contribution chart...")
-        ax5 = plt.subplot(3, 2, 5)
+        log("5. Creating channel contribution chart...")
         if self.yearly_df is not None and 'Share_Visitors_from_Influencers' in self.yearly_df.columns:
-            years = self.yearly_df['Year'].values
-            inf_share = self.yearly_df['Share_Visitors_from_Influencers'].values
+            years = self.yearly_df['Year'].to_numpy(dtype=float)
+            inf_share = self.yearly_df['Share_Visitors_from_Influencers'].to_numpy(dtype=float)
             social_share = 1 - inf_share
             
             x = np.arange(len(years))
@@ -464,16 +581,15 @@ class FinancialModelAnalyzer:
             ax5.set_xticks(x)
             ax5.set_xticklabels([f'Year {int(y)}' for y in years])
             ax5.legend()
-            ax5.grid(True, alpha=0.3, axis='y')
+            ax5.grid(False, axis='x')  # whitegrid already draws the y grid
         
         # 6. Unit economics (CAC vs LTV)
-        print("6. Creating unit economics chart...")
-        ax6 = plt.subplot(3, 2, 6)
+        log("6. Creating unit economics chart...")
         if self.yearly_df is not None:
-            if all(col in self.yearly_df.columns for col in ['Year', 'Average_CAC_EUR', 'LTV_EUR']):
-                years = self.yearly_df['Year'].values
-                cac = self.yearly_df['Average_CAC_EUR'].values
-                ltv = self.yearly_df['LTV_EUR'].values
+            if UNIT_ECON_COLS.issubset(self.yearly_df.columns):
+                years = self.yearly_df['Year'].to_numpy(dtype=float)
+                cac = self.yearly_df['Average_CAC_EUR'].to_numpy(dtype=float)
+                ltv = self.yearly_df['LTV_EUR'].to_numpy(dtype=float)
                 
                 x = np.arange(len(years))
                 width = 0.35
@@ -487,8 +603,8 @@ class FinancialModelAnalyzer:
                 ax6.set_xticks(x)
                 ax6.set_xticklabels([f'Year {int(y)}' for y in years])
                 ax6.legend()
-                ax6.grid(True, alpha=0.3, axis='y')
-                ax6.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+                ax6.grid(False, axis='x')
+                ax6.yaxis.set_major_formatter(EUR_FMT)
                 
                 # Add LTV/CAC ratios as text
                 for i, (c, l) in enumerate(zip(cac, ltv)):
@@ -497,206 +613,200 @@ class FinancialModelAnalyzer:
                         ax6.text(i, max(c, l) * 1.05, f'{ratio:.1f}x', 
                                 ha='center', va='bottom', fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig('financial_model_analysis.png', dpi=300, bbox_inches='tight')
-        print("\n✓ Visualizations saved to: financial_model_analysis.png")
-        plt.close()
+        # Save without bbox_inches='tight' (it forces an extra render pass);
+        # 150 dpi is plenty for the report and a quarter of the pixels of 300 dpi
+        fig.savefig('financial_model_analysis.png', dpi=150, pil_kwargs={'optimize': True})
+        log("\n✓ Visualizations saved to: financial_model_analysis.png")
+    
+    def _compute_summaries(self):
+        """Figures derived from the model frames, computed once and shared by the narrative sections."""
+        summaries = {'yearly_rows': self.yearly_df.to_dict('records') if self.yearly_df is not None else []}
+        if self.monthly_df is not None and 'Cumulative_Cash' in self.monthly_df.columns:
+            cash = self.monthly_df['Cumulative_Cash'].to_numpy(dtype=float)
+            nonneg = cash >= 0
+            summaries['final_cash'] = self.monthly_df['Cumulative_Cash'].to_numpy()[-1]
+            summaries['min_cash'] = np.fmin.reduce(cash)  # NaN-skipping min straight on the buffer
+            summaries['break_even_month'] = int(np.argmax(nonneg)) + 1 if nonneg.any() else None
+        self._summaries = summaries
+        return summaries
     
     def generate_investor_narrative(self):
         """Generate investor-ready narrative summary."""
-        print("\n" + "=" * 80)
+        print(NL_RULE)
         print("STEP 6: INVESTOR NARRATIVE")
-        print("=" * 80)
+        print(RULE)
+        
+        # Local names for everything read repeatedly below
+        assumptions = self.assumptions
+        monthly_df = self.monthly_df
+        yearly_df = self.yearly_df
         
-        narrative = []
-        narrative.append("\n# FINANCIAL MODEL ANALYSIS - EXECUTIVE SUMMARY")
-        narrative.append("=" * 80)
+        # Shared figures (computed once per analysis run; on demand when called on its own)
+        summaries = self._summaries if self._summaries is not None else self._compute_summaries()
+        yearly_rows = summaries['yearly_rows']
+        
+        # Stream the text into one buffer (every write ends with its own newline)
+        buf = io.StringIO()
+        w = buf.write
         
         # Business Model Overview
-        narrative.append("\n## 1. BUSINESS MODEL DYNAMICS")
-        narrative.append("-" * 40)
-        
-        if 'Social_View_to_Visit_Conv' in self.assumptions:
-            conv_rate = self.assumptions['Social_View_to_Visit_Conv']
-            narrative.append(f"\n**Acquisition Funnel:**")
-            narrative.append(f"- Social views convert to website visits at {conv_rate:.2%}")
-            narrative.append(f"  (e.g., 100 social views → {conv_rate*100:.0f} site visits)")
-        
-        if all(k in self.assumptions for k in ['ConvVS', 'ConvSP']):
-            conv_vs = self.assumptions['ConvVS']
-            conv_sp = self.assumptions['ConvSP']
+        w(f"\n# FINANCIAL MODEL ANALYSIS - EXECUTIVE SUMMARY\n{RULE}\n"
+          f"\n## 1. BUSINESS MODEL DYNAMICS\n{SECTION_RULE}\n")
+        
+        if 'Social_View_to_Visit_Conv' in assumptions:
+            conv_rate = assumptions['Social_View_to_Visit_Conv']
+            w(f"\n**Acquisition Funnel:**\n"
+              f"- Social views convert to website visits at {conv_rate:.2%}\n"
+              f"  (e.g., 100 social views → {conv_rate*100:.0f} site visits)\n")
+        
+        if CONV_KEYS <= assumptions.keys():
+            conv_vs = assumptions['ConvVS']
+            conv_sp = assumptions['ConvSP']
             overall_conv = conv_vs * conv_sp
-            narrative.append(f"\n- Website visitors → Signups: {conv_vs:.2%}")
-            narrative.append(f"- Signups → Paying users: {conv_sp:.2%}")
-            narrative.append(f"- **Overall visitor-to-paid conversion: {overall_conv:.2%}**")
+            w(f"\n- Website visitors → Signups: {conv_vs:.2%}\n"
+              f"- Signups → Paying users: {conv_sp:.2%}\n"
+              f"- **Overall visitor-to-paid conversion: {overall_conv:.2%}**\n")
         
         # Influencer strategy
-        narrative.append(f"\n**Influencer Marketing Strategy:**")
-        if 'Inf_Avg_Followers' in self.assumptions:
-            followers = self.assumptions['Inf_Avg_Followers']
-            narrative.append(f"- Average influencer has {followers:,.0f} followers")
+        w("\n**Influencer Marketing Strategy:**\n")
+        if 'Inf_Avg_Followers' in assumptions:
+            followers = assumptions['Inf_Avg_Followers']
+            w(f"- Average influencer has {followers:,.0f} followers\n")
         
-        if 'Inf_Visitors_per_Collab' in self.assumptions:
-            visitors_per = self.assumptions['Inf_Visitors_per_Collab']
-            narrative.append(f"- Each collaboration generates ~{visitors_per:.0f} website visitors")
+        if 'Inf_Visitors_per_Collab' in assumptions:
+            visitors_per = assumptions['Inf_Visitors_per_Collab']
+            w(f"- Each collaboration generates ~{visitors_per:.0f} website visitors\n")
         
-        if self.yearly_df is not None and 'Share_Visitors_from_Influencers' in self.yearly_df.columns:
-            inf_shares = self.yearly_df['Share_Visitors_from_Influencers'].values
-            narrative.append(f"- Influencers contribute {inf_shares[0]:.1%} (Y1) → {inf_shares[-1]:.1%} (Y3) of total visitors")
+        if yearly_df is not None and 'Share_Visitors_from_Influencers' in yearly_df.columns:
+            inf_shares = yearly_df['Share_Visitors_from_Influencers'].to_numpy(dtype=float)
+            w(f"- Influencers contribute {inf_shares[0]:.1%} (Y1) → {inf_shares[-1]:.1%} (Y3) of total visitors\n")
         
         # Growth trajectory
-        narrative.append("\n\n## 2. GROWTH TRAJECTORY (3-YEAR OUTLOOK)")
-        narrative.append("-" * 40)
-        
-        if self.yearly_df is not None:
-            for idx, row in self.yearly_df.iterrows():
-                year = int(row['Year'])
-                narrative.append(f"\n**Year {year}:**")
-                
-                if 'End_Paying_Users' in row:
-                    narrative.append(f"- Paying users: {row['End_Paying_Users']:,.0f}")
-                
-                if 'End_MRR_EUR' in row:
-                    narrative.append(f"- MRR: €{row['End_MRR_EUR']:,.0f}")
-                
-                if 'ARR_EUR' in row:
-                    narrative.append(f"- ARR: €{row['ARR_EUR']:,.0f}")
-                
-                if 'Total_New_Customers' in row:
-                    narrative.append(f"- New customers acquired: {row['Total_New_Customers']:,.0f}")
-                
-                if 'Total_Marketing_Spend_EUR' in row:
-                    narrative.append(f"- Marketing spend: €{row['Total_Marketing_Spend_EUR']:,.0f}")
+        w(f"\n\n## 2. GROWTH TRAJECTORY (3-YEAR OUTLOOK)\n{SECTION_RULE}\n")
+        
+        # (column, line template) pairs, filtered once against the available columns
+        growth_lines = [(col, template) for col, template in [
+            ('End_Paying_Users', "- Paying users: {:,.0f}\n"),
+            ('End_MRR_EUR', "- MRR: €{:,.0f}\n"),
+            ('ARR_EUR', "- ARR: €{:,.0f}\n"),
+            ('Total_New_Customers', "- New customers acquired: {:,.0f}\n"),
+            ('Total_Marketing_Spend_EUR', "- Marketing spend: €{:,.0f}\n"),
+        ] if yearly_df is not None and col in yearly_df.columns]
+        for row in yearly_rows:
+            w(f"\n**Year {int(row['Year'])}:**\n")
+            for col, template in growth_lines:
+                w(template.format(row[col]))
         
         # Cash flow analysis
-        narrative.append("\n\n## 3. CASH FLOW & CAPITAL REQUIREMENTS")
-        narrative.append("-" * 40)
+        w(f"\n\n## 3. CASH FLOW & CAPITAL REQUIREMENTS\n{SECTION_RULE}\n")
         
-        if self.monthly_df is not None and 'Cumulative_Cash' in self.monthly_df.columns:
-            final_cash = self.monthly_df['Cumulative_Cash'].iloc[-1]
-            min_cash = self.monthly_df['Cumulative_Cash'].min()
-            
-            # Find break-even month
-            break_even_month = None
-            for idx, row in self.monthly_df.iterrows():
-                if row['Cumulative_Cash'] >= 0:
-                    break_even_month = idx + 1
-                    break
+        if monthly_df is not None and 'Cumulative_Cash' in monthly_df.columns:
+            final_cash = summaries['final_cash']
+            min_cash = summaries['min_cash']
+            break_even_month = summaries['break_even_month']
             
-            narrative.append(f"\n- **Minimum cash position: €{min_cash:,.0f}** (capital requirement)")
+            w(f"\n- **Minimum cash position: €{min_cash:,.0f}** (capital requirement)\n")
             if break_even_month:
-                narrative.append(f"- **Break-even achieved: Month {break_even_month}**")
+                w(f"- **Break-even achieved: Month {break_even_month}**\n")
             else:
-                narrative.append(f"- **Break-even: Not achieved within 36 months**")
-            narrative.append(f"- **Cumulative cash at end of Year 3: €{final_cash:,.0f}**")
+                w("- **Break-even: Not achieved within 36 months**\n")
+            w(f"- **Cumulative cash at end of Year 3: €{final_cash:,.0f}**\n")
             
-            if 'Broker_TargetCapital' in self.assumptions:
-                target = self.assumptions['Broker_TargetCapital']
-                narrative.append(f"\n- Broker target capital: €{target:,.0f}")
+            if 'Broker_TargetCapital' in assumptions:
+                target = assumptions['Broker_TargetCapital']
+                w(f"\n- Broker target capital: €{target:,.0f}\n")
                 if final_cash >= target:
-                    narrative.append(f"  ✓ **Target achieved** (surplus: €{final_cash - target:,.0f})")
+                    w(f"  ✓ **Target achieved** (surplus: €{final_cash - target:,.0f})\n")
                 else:
-                    narrative.append(f"  ⚠ **Target not met** (shortfall: €{target - final_cash:,.0f})")
+                    w(f"  ⚠ **Target not met** (shortfall: €{target - final_cash:,.0f})\n")
         
         # Unit economics
-        narrative.append("\n\n## 4. UNIT ECONOMICS & SUSTAINABILITY")
-        narrative.append("-" * 40)
-        
-        if 'ARPU' in self.assumptions:
-            arpu = self.assumptions['ARPU']
-            narrative.append(f"\n- **ARPU (Average Revenue Per User): €{arpu:,.2f}** per month")
-        
-        if self.yearly_df is not None and all(col in self.yearly_df.columns for col in ['Average_CAC_EUR', 'LTV_EUR', 'LTV_CAC_Ratio']):
-            narrative.append(f"\n**CAC and LTV Evolution:**")
-            for idx, row in self.yearly_df.iterrows():
-                year = int(row['Year'])
-                cac = row['Average_CAC_EUR']
-                ltv = row['LTV_EUR']
-                ratio = row['LTV_CAC_Ratio']
-                narrative.append(f"- Year {year}: CAC = €{cac:,.0f}, LTV = €{ltv:,.0f}, **LTV/CAC = {ratio:.2f}x**")
+        w(f"\n\n## 4. UNIT ECONOMICS & SUSTAINABILITY\n{SECTION_RULE}\n")
+        
+        if 'ARPU' in assumptions:
+            arpu = assumptions['ARPU']
+            w(f"\n- **ARPU (Average Revenue Per User): €{arpu:,.2f}** per month\n")
+        
+        if yearly_df is not None and LTV_CAC_COLS.issubset(yearly_df.columns):
+            w("\n**CAC and LTV Evolution:**\n")
+            for row in yearly_rows:
+                w(f"- Year {int(row['Year'])}: CAC = €{row['Average_CAC_EUR']:,.0f}, "
+                  f"LTV = €{row['LTV_EUR']:,.0f}, **LTV/CAC = {row['LTV_CAC_Ratio']:.2f}x**\n")
             
             # Health assessment
-            final_ratio = self.yearly_df['LTV_CAC_Ratio'].iloc[-1]
-            narrative.append(f"\n**Unit Economics Assessment:**")
+            final_ratio = yearly_rows[-1]['LTV_CAC_Ratio']
+            w("\n**Unit Economics Assessment:**\n")
             if final_ratio >= 3.0:
-                narrative.append(f"✓ **HEALTHY** - LTV/CAC ratio of {final_ratio:.1f}x indicates sustainable growth")
-                narrative.append(f"  Industry benchmark: 3x or higher is considered healthy")
+                w(f"✓ **HEALTHY** - LTV/CAC ratio of {final_ratio:.1f}x indicates sustainable growth\n"
+                  "  Industry benchmark: 3x or higher is considered healthy\n")
             elif final_ratio >= 2.0:
-                narrative.append(f"⚠ **MODERATE** - LTV/CAC ratio of {final_ratio:.1f}x is acceptable but could be optimized")
-                narrative.append(f"  Recommendation: Focus on retention or reducing CAC")
+                w(f"⚠ **MODERATE** - LTV/CAC ratio of {final_ratio:.1f}x is acceptable but could be optimized\n"
+                  "  Recommendation: Focus on retention or reducing CAC\n")
             else:
-                narrative.append(f"⚠ **CONCERN** - LTV/CAC ratio of {final_ratio:.1f}x is below healthy threshold")
-                narrative.append(f"  Action required: Improve retention or significantly reduce acquisition costs")
+                w(f"⚠ **CONCERN** - LTV/CAC ratio of {final_ratio:.1f}x is below healthy threshold\n"
+                  "  Action required: Improve retention or significantly reduce acquisition costs\n")
         
         # Retention & churn
-        narrative.append("\n\n## 5. RETENTION DYNAMICS")
-        narrative.append("-" * 40)
-        
-        if all(k in self.assumptions for k in ['ChurnY1', 'ChurnY2', 'ChurnY3']):
-            churn_y1 = self.assumptions['ChurnY1']
-            churn_y2 = self.assumptions['ChurnY2']
-            churn_y3 = self.assumptions['ChurnY3']
-            narrative.append(f"\n**Monthly Churn Rates:**")
-            narrative.append(f"- Year 1: {churn_y1:.2%} (early adopters, higher churn)")
-            narrative.append(f"- Year 2: {churn_y2:.2%} (improved product-market fit)")
-            narrative.append(f"- Year 3: {churn_y3:.2%} (mature customer base)")
-            
-            # Calculate retention
-            retention_y3 = 1 - churn_y3
-            narrative.append(f"\n- Year 3 monthly retention: {retention_y3:.2%}")
-            narrative.append(f"- Implied annual retention: {retention_y3**12:.2%}")
-        
-        # Key risks & opportunities
-        narrative.append("\n\n## 6. KEY ASSUMPTIONS & SENSITIVITIES")
-        narrative.append("-" * 40)
+        w(f"\n\n## 5. RETENTION DYNAMICS\n{SECTION_RULE}\n")
         
-        narrative.append("\n**Critical Success Factors:**")
-        narrative.append("1. Social media conversion rate maintaining at assumed levels")
-        narrative.append("2. Influencer collaborations delivering expected reach and engagement")
-        narrative.append("3. Churn rates improving as product matures")
-        narrative.append("4. Marketing efficiency (CAC) staying within projected bounds")
-        
-        narrative.append("\n**Recommended Sensitivity Analysis:**")
-        narrative.append("- Test scenarios with ±20% variation in conversion rates")
-        narrative.append("- Model impact of ±10% variation in churn rates")
-        narrative.append("- Assess effect of ±25% variation in CAC")
-        narrative.append("- Evaluate influencer collaboration volume changes")
+        if CHURN_KEYS <= assumptions.keys():
+            churn_y1 = assumptions['ChurnY1']
+            churn_y2 = assumptions['ChurnY2']
+            churn_y3 = assumptions['ChurnY3']
+            retention_y3 = 1 - churn_y3
+            annual_retention = retention_y3 ** 12
+            w(f"\n**Monthly Churn Rates:**\n"
+              f"- Year 1: {churn_y1:.2%} (early adopters, higher churn)\n"
+              f"- Year 2: {churn_y2:.2%} (improved product-market fit)\n"
+              f"- Year 3: {churn_y3:.2%} (mature customer base)\n"
+              f"\n- Year 3 monthly retention: {retention_y3:.2%}\n"
+              f"- Implied annual retention: {annual_retention:.2%}\n")
+        
+        # Key risks & opportunities (static text)
+        w(f"\n\n## 6. KEY ASSUMPTIONS & SENSITIVITIES\n{SECTION_RULE}\n"
+          "\n**Critical Success Factors:**\n"
+          "1. Social media conversion rate maintaining at assumed levels\n"
+          "2. Influencer collaborations delivering expected reach and engagement\n"
+          "3. Churn rates improving as product matures\n"
+          "4. Marketing efficiency (CAC) staying within projected bounds\n"
+          "\n**Recommended Sensitivity Analysis:**\n"
+          "- Test scenarios with ±20% variation in conversion rates\n"
+          "- Model impact of ±10% variation in churn rates\n"
+          "- Assess effect of ±25% variation in CAC\n"
+          "- Evaluate influencer collaboration volume changes\n")
         
         # Conclusion
-        narrative.append("\n\n## 7. INVESTMENT SUMMARY")
-        narrative.append("-" * 40)
-        
-        if self.monthly_df is not None and self.yearly_df is not None:
-            final_mrr = self.yearly_df['End_MRR_EUR'].iloc[-1]
-            final_arr = self.yearly_df['ARR_EUR'].iloc[-1]
-            final_users = self.yearly_df['End_Paying_Users'].iloc[-1]
-            final_cash = self.monthly_df['Cumulative_Cash'].iloc[-1]
-            
-            narrative.append(f"\n**By end of Year 3, under these assumptions:**")
-            narrative.append(f"- The business reaches **€{final_mrr:,.0f} MRR** (€{final_arr:,.0f} ARR)")
-            narrative.append(f"- Serving **{final_users:,.0f} paying customers**")
-            narrative.append(f"- Cumulative cash position: **€{final_cash:,.0f}**")
-            
-            if 'Broker_TargetCapital' in self.assumptions:
-                target = self.assumptions['Broker_TargetCapital']
+        w(f"\n\n## 7. INVESTMENT SUMMARY\n{SECTION_RULE}\n")
+        
+        if monthly_df is not None and yearly_df is not None:
+            last_year = yearly_rows[-1]
+            final_mrr = last_year['End_MRR_EUR']
+            final_arr = last_year['ARR_EUR']
+            final_users = last_year['End_Paying_Users']
+            final_cash = summaries['final_cash']
+            
+            w(f"\n**By end of Year 3, under these assumptions:**\n"
+              f"- The business reaches **{fmt_eur(final_mrr)} MRR** ({fmt_eur(final_arr)} ARR)\n"
+              f"- Serving **{final_users:,.0f} paying customers**\n"
+              f"- Cumulative cash position: **{fmt_eur(final_cash)}**\n")
+            
+            if 'Broker_TargetCapital' in assumptions:
+                target = assumptions['Broker_TargetCapital']
                 if final_cash >= target:
-                    narrative.append(f"- **Capital target of €{target:,.0f} is ACHIEVED**")
+                    w(f"- **Capital target of {fmt_eur(target)} is ACHIEVED**\n")
                 else:
-                    capital_needed = abs(min_cash)
-                    narrative.append(f"- Initial capital requirement: ~€{capital_needed:,.0f}")
-                    narrative.append(f"- Additional capital may be needed to reach €{target:,.0f} target")
+                    capital_needed = abs(summaries['min_cash'])
+                    w(f"- Initial capital requirement: ~{fmt_eur(capital_needed)}\n"
+                      f"- Additional capital may be needed to reach {fmt_eur(target)} target\n")
         
-        narrative.append("\n" + "=" * 80)
-        narrative.append("\n*This analysis is based on the assumptions in the financial model.*")
-        narrative.append("*Actual results may vary based on market conditions and execution.*")
-        narrative.append("\n" + "=" * 80)
+        w(NARRATIVE_FOOTER)
         
-        full_narrative = '\n'.join(narrative)
-        print(full_narrative)
+        full_narrative = buf.getvalue()
         
-        # Save to file
-        with open('investor_narrative.txt', 'w', encoding='utf-8') as f:
-            f.write(full_narrative)
+        # Save to file, echoing to the console only for interactive runs (batch runs read the file)
+        Path('investor_narrative.txt').write_text(full_narrative, encoding='utf-8')
+        if sys.stdout.isatty():
+            sys.stdout.write(full_narrative + "\n")
         
         print("\n✓ Narrative saved to: investor_narrative.txt")
         
@@ -709,22 +819,32 @@ class FinancialModelAnalyzer:
         self.extract_monthly_model()
         self.extract_yearly_summary()
         self.sanity_checks()
+        self._compute_summaries()
         self.create_key_assumptions_table()
         self.create_yearly_summary_table()
         self.create_monthly_funnel_table()
-        self.create_visualizations()
-        self.generate_investor_narrative()
         
-        print("\n" + "=" * 80)
+        # Render the charts on a worker thread while the narrative is written (Agg releases the
+        # GIL while rasterising/encoding); chart messages are replayed once rendering is done
+        chart_log = []
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            charts = pool.submit(self.create_visualizations, log=lambda *args: chart_log.append(args))
+            self.generate_investor_narrative()
+            charts.result()
+        for args in chart_log:
+            print(*args)
+        
+        print(NL_RULE)
         print("✓ ANALYSIS COMPLETE")
-        print("=" * 80)
+        print(RULE)
         print("\nGenerated files:")
         print("  1. financial_model_analysis.png - All visualizations")
         print("  2. investor_narrative.txt - Executive summary")
-        print("\n" + "=" * 80)
+        print(NL_RULE)
 
 
 if __name__ == "__main__":
-    # Run the analysis
-    analyzer = FinancialModelAnalyzer('ai_finance_dynamic_model_v6_social_views.xlsx')
+    # Run the analysis (--no-cache forces a fresh parse of the Excel file)
+    analyzer = FinancialModelAnalyzer('ai_finance_dynamic_model_v6_social_views.xlsx',
+                                      use_cache='--no-cache' not in sys.argv)
     analyzer.run_full_analysis()
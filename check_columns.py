@@ -1,25 +1,23 @@
 """Check all columns in monthly model"""
 import pandas as pd
-from openpyxl import load_workbook
 
 filepath = 'ai_finance_dynamic_model_v6_social_views.xlsx'
-wb = load_workbook(filepath, data_only=True)
-sheet = wb["Model"]
+# Only the header (row 52) and the first data row (row 53) are parsed
+rows = pd.read_excel(filepath, sheet_name="Model", header=None, skiprows=51, nrows=2, engine='openpyxl')
+header_row, data_row = rows.iloc[0], rows.iloc[1]
 
 print("=" * 80)
 print("ROW 52 - ALL COLUMNS (Monthly Model Header)")
 print("=" * 80)
 
-for col_idx in range(1, sheet.max_column + 1):
-    cell = sheet.cell(row=52, column=col_idx)
-    if cell.value:
-        print(f"Column {col_idx}: {cell.value}")
+for col_idx, value in enumerate(header_row, start=1):
+    if pd.notna(value) and value:
+        print(f"Column {col_idx}: {value}")
 
 print("\n" + "=" * 80)
 print("ROW 53 - FIRST DATA ROW (All columns)")
 print("=" * 80)
 
-for col_idx in range(1, sheet.max_column + 1):
-    cell = sheet.cell(row=53, column=col_idx)
-    if cell.value is not None:
-        print(f"Column {col_idx}: {cell.value}")
+for col_idx, value in enumerate(data_row, start=1):
+    if pd.notna(value):
+        print(f"Column {col_idx}: {value}")
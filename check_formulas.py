@@ -3,36 +3,37 @@ from openpyxl import load_workbook
 
 filepath = 'ai_finance_dynamic_model_v6_social_views.xlsx'
 
-# Load WITHOUT data_only to see formulas
-wb = load_workbook(filepath, data_only=False)
+# Derived assumptions that should be Excel formulas rather than typed-in values
+DERIVED_PARAMS = frozenset({'Base_Visitor_to_Paid_Conv', 'Share_Sum_Y1', 'CAC_Y1', 'Inf_Visitors_per_Collab'})
+
+# Load WITHOUT data_only to see formulas; read_only streams the XML and skips styles
+wb = load_workbook(filepath, read_only=True, data_only=False)
 sheet = wb["Model"]
+# Rows 4-53, columns A-V in one sweep (rows[0] is row 4)
+rows = list(sheet.iter_rows(min_row=4, max_row=53, max_col=22, values_only=True))
+wb.close()
+header_row, data_row = rows[48], rows[49]  # rows 52-53
 
 print("=" * 80)
 print("CHECKING FOR FORMULAS IN ROW 53")
 print("=" * 80)
 
-for col_idx in range(1, 23):
-    cell = sheet.cell(row=53, column=col_idx)
-    header = sheet.cell(row=52, column=col_idx).value
-    
-    if cell.value is not None:
+for header, value in zip(header_row, data_row):
+    if value is not None:
         # Check if it's a formula
-        if isinstance(cell.value, str) and cell.value.startswith('='):
-            print(f"{header:25s} : FORMULA = {cell.value[:80]}")
+        if isinstance(value, str) and value.startswith('='):
+            print(f"{header:25s} : FORMULA = {value[:80]}")
         else:
-            print(f"{header:25s} : VALUE = {cell.value}")
+            print(f"{header:25s} : VALUE = {value}")
 
 print("\n" + "=" * 80)
 print("CHECKING DERIVED ASSUMPTIONS (formulas)")
 print("=" * 80)
 
 # Check some derived parameters
-for row_idx in range(4, 50):
-    param_cell = sheet.cell(row=row_idx, column=2)
-    value_cell = sheet.cell(row=row_idx, column=3)
-    
-    if param_cell.value in ['Base_Visitor_to_Paid_Conv', 'Share_Sum_Y1', 'CAC_Y1', 'Inf_Visitors_per_Collab']:
-        if isinstance(value_cell.value, str) and value_cell.value.startswith('='):
-            print(f"{param_cell.value:30s} : {value_cell.value}")
+for param, value in (row[1:3] for row in rows[:46]):  # rows 4-49, columns B-C
+    if param in DERIVED_PARAMS:
+        if isinstance(value, str) and value.startswith('='):
+            print(f"{param:30s} : {value}")
         else:
-            print(f"{param_cell.value:30s} : {value_cell.value} (static value)")
+            print(f"{param:30s} : {value} (static value)")
@@ -7,7 +7,10 @@ print("Year 3 Summary:")
 print(yearly_updated.iloc[2])
 
 print("\nYear 3 Monthly Data:")
-y3 = monthly_updated[monthly_updated['Year'] == 3]
-print(f"Total New Customers: {y3['New_Paying_Users'].sum():.2f}")
-print(f"Total Marketing Spend: {y3['Marketing_Spend'].sum():.2f}")
-print(f"Calculated avg CAC: {y3['Marketing_Spend'].sum() / y3['New_Paying_Users'].sum():.2f}")
+# Both Year 3 totals from one selection and one sum
+y3_totals = monthly_updated.loc[monthly_updated['Year'] == 3, ['New_Paying_Users', 'Marketing_Spend']].sum()
+new_customers = y3_totals['New_Paying_Users']
+marketing_spend = y3_totals['Marketing_Spend']
+print(f"Total New Customers: {new_customers:.2f}")
+print(f"Total Marketing Spend: {marketing_spend:.2f}")
+print(f"Calculated avg CAC: {marketing_spend / new_customers:.2f}")
@@ -0,0 +1,15 @@
+"""
+Excel reader engine shared by analyze_model.py and financial_model_app_v2.py.
+
+EXCEL_ENGINE is the value to pass as pd.read_excel(engine=...): the Rust-based
+calamine engine when python-calamine is installed and pandas accepts it
+(engine='calamine' needs pandas >= 2.2), otherwise openpyxl.
+"""
+import pandas as pd
+
+try:
+    import python_calamine  # noqa: F401
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+else:
+    EXCEL_ENGINE = 'calamine' if tuple(map(int, pd.__version__.split('.')[:2])) >= (2, 2) else 'openpyxl'
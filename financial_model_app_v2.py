@@ -5,13 +5,14 @@ AI Finance Platform - Interactive Financial Model Desktop App v2 (Updated for Ex
 COMPLETE INTERACTIVE DESKTOP APP with:
 - Excel-like GUI (editable tables)
 - Automatic recalculation engine
-- Interactive charts with hover tooltips (mplcursors) and zoom/pan (NavigationToolbar)
+- Interactive charts with hover tooltips and zoom/pan (NavigationToolbar)
 - Social Ads channel with monthly budget and CPC
 - JSON persistence (Excel used only first time)
 - SUPPORTS EXCEL v7 FORMAT with flexible column structure
 
 INSTALLATION:
-    pip install pandas openpyxl matplotlib pyqt6 mplcursors
+    pip install pandas openpyxl matplotlib pyqt6
+    (optional: pip install python-calamine for faster Excel loading, needs pandas >= 2.2)
 
 USAGE:
     python financial_model_app_v2.py
@@ -24,12 +25,9 @@ from pathlib import Path
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
-from matplotlib.figure import Figure
-import mplcursors
 
+# matplotlib is imported by ChartsWidget when the charts are built, so scripts that only
+# use the loader/model functions don't pay for it (the widget base classes need PyQt6 here)
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QTableWidget, QTableWidgetItem, QPushButton, QLabel, QTabWidget,
@@ -38,6 +36,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont, QColor, QBrush
 
+from excel_engine import EXCEL_ENGINE
+
 
 # =====================
 # EXCEL v7 LOADER
@@ -66,7 +66,7 @@ def load_from_excel_v7(excel_path: str) -> dict:
     print(f"Loading Excel v7 file: {excel_path}")
     
     # Read the Model sheet
-    df = pd.read_excel(excel_path, sheet_name='Model', header=None)
+    df = pd.read_excel(excel_path, sheet_name='Model', header=None, engine=EXCEL_ENGINE)
     
     # ===== PARSE ASSUMPTIONS =====
     # Row 3 is header (0-indexed: 2), skip it
@@ -233,396 +233,235 @@ def parse_assumptions(df: pd.DataFrame) -> dict:
     return params
 
 
-def recalc_model(assumptions_df: pd.DataFrame, 
-                 monthly_df: pd.DataFrame,
-                 n_years: int = 3) -> tuple:
+# Monthly columns returned by simulate_months, in order (Year, Month and Market_Phase are added by recalc_model)
+MONTHLY_COLUMNS = (
+    'Followers_Start', 'Followers_End',
+    # === MARKET PHASE TRACKING (LOCAL → GLOBAL) ===
+    'Market_Saturation_Pct',  # % del mercato CORRENTE (local o global) raggiunto
+    'Ads_Saturation_Factor',  # Fattore saturazione per gli ads
+    # ===========================
+    'Posts', 'Impr_Followers', 'Impr_NonFollowers', 'Social_Views', 'NewUnique_NonFollowers',
+    'Org_Visitors', 'Inf_Visitors', 'Other_Visitors',
+    # === PAID ADS COLUMNS ===
+    'FollowerAds_Spend', 'ClickAds_Spend',
+    'Annual_PaidAds_Spend',  # Budget speso nell'anno corrente
+    'Cumulative_PaidAds_Spend',  # Budget speso cumulativo (lifetime)
+    'Paid_FollowerAds_Impressions', 'Paid_FollowerAds_Reach', 'Paid_FollowerAds_NewFollowers',
+    'Paid_FollowerAds_Visitors', 'Paid_ClickAds_Visitors',
+    'PaidAds_Visitors',  # Somma di entrambi
+    # ===========================
+    'Visitors_Total', 'Signups', 'Org_Signups', 'Inf_Signups', 'Other_Signups',
+    'PaidAds_Signups',  # NEW: signup da paid ads
+    # === NEW PAYERS BREAKDOWN (v7.4) ===
+    'New_Payers_from_New_Signups',  # Conversione immediata da nuovi signup
+    'New_Payers_from_Existing_Free',  # Conversione ritardata da free esistenti
+    'New_Payers_from_Referral',  # Da referral
+    'Referral_New_Payers',  # Legacy column (same as New_Payers_from_Referral)
+    # ===========================
+    'Org_New_Payers', 'Inf_New_Payers', 'Other_New_Payers',
+    'PaidAds_New_Payers',  # NEW: paying users da paid ads
+    'New_Paying_Users',  # UPDATED: ora include anche free esistenti convertiti
+    'Churn_Rate', 'Paying_Users_Start', 'Churned_Users', 'Paying_Users_End',
+    # === FREE USERS COLUMNS (v7.4) ===
+    'Cumulative_Signups', 'Free_Users_Start',
+    'Free_Active_Users',  # NEW: free users attivi (50% default)
+    'Free_Users_End', 'Total_Users_End',
+    # ===========================
+    'ARPU', 'MRR', 'Org_Marketing_Spend', 'Inf_Marketing_Spend', 'Other_Marketing_Spend',
+    'Referral_Marketing_Spend',
+    'PaidAds_Marketing_Spend',  # NEW
+    'Total_Marketing_Spend',
+    # === GROSS MARGIN COLUMNS (NEW) ===
+    'Direct_Costs', 'Gross_Profit', 'Gross_Margin_Month',
+    # ===========================
+    'DataSub_Cost', 'XAPI_Cost',
+    'Base_Fixed_Cost',  # Con crescita annuale applicata
+    'Total_Costs', 'Net_Cash_Flow', 'Cumulative_Cash',
+    # === CAC e LTV MENSILE ===
+    'Monthly_CAC', 'Cumulative_CAC', 'Monthly_LTV', 'LTV_CAC_Ratio',
+)
+
+
+def simulate_months(n_months, arpu, conv_vs, conv_sp, churn_rate,
+                    market_max_followers_local, market_max_followers_global,
+                    market_max_paying_local, market_max_paying_global,
+                    follower_adoption_ramp, global_adoption_ramp,
+                    followers_0, follower_growth, posts, reach_per_post, non_follower_multiplier,
+                    frequency, ctr, inf_vpc, inf_collabs, inf_reward, referral_rate, referral_reward,
+                    existing_free_to_paid_rate, free_active_share, org_cost_per_post, other_budget,
+                    base_fixed_cost, fixed_cost_annual_growth,
+                    datasub_fee, datasub_threshold, xapi_fee, xapi_threshold,
+                    paid_ads_monthly_budget, paid_ads_max_annual_budget, paid_ads_max_total_budget,
+                    follower_ads_cpm, follower_ads_reach_to_follower, follower_ads_ctr_to_site,
+                    click_ads_cpc, follower_threshold_for_clicks):
     """
-    Recalculate the financial model for Excel v7 format with dynamic duration.
-    
-    V7 has channel-specific breakdowns with social follower growth mechanics.
-    This function recalculates key metrics while preserving the v7 structure.
-    
-    NEW FEATURES (v7.1):
-    --------------------
-    
-    A) GROSS MARGIN DINAMICO:
-       - Direct_Costs = DataSub_Cost + XAPI_Cost (costi variabili SaaS)
-       - Gross_Profit = MRR - Direct_Costs
-       - Gross_Margin_Month = Gross_Profit / MRR (gestisce MRR=0)
-       - Yearly: Gross_Margin_Year = SUM(Gross_Profit) / SUM(MRR)
-       - LTV usa Gross_Margin_Year invece del parametro fisso GrossMargin
-    
-    B) PAID SOCIAL ADS - LOGICA BIFASE:
-       - FASE 1 (Followers < Soglia):
-         * Budget → Follower Ads (CPM-based)
-         * Genera: Impressions → Reach → NewFollowers
-         * Aumenta Followers_End
-    
-    NEW FEATURES (v7.2): CRESCITA AD S CON SATURAZIONE
-    ---------------------------------------------------
-    
-    C) MODELLO LOGISTICO PER FOLLOWER (no più crescita esponenziale infinita):
-       - Parametri TAM/SAM/SOM: tetti di mercato per followers e paying users
-       - Beachhead iniziale: Zurigo/Svizzera (max 50k followers, 2k paying users)
-       - Crescita ad S: lenta all'inizio (brand nuovo), rapida al centro, plateau al tetto
-       - Formula: Organic_NewFollowers = Followers × r_effective × (1 - Followers/Market_Max)
-       - Adoption Ramp: primi 24 mesi con crescita ridotta (r_effective < r_base)
-       - Cap sui paying users: non superano mai Market_Max_PayingUsers_Local
-    
-    NEW FEATURES (v7.3): NUOVA LOGICA REFERRAL
-    ------------------------------------------
-    
-    D) REFERRAL CON SATURAZIONE E PROBABILITÀ ONE-TIME:
-       - PRIMA: Referral_New_Payers = Paying_Users_Start × referral_rate
-         → Problema: ricalcolava la probabilità ogni mese sugli stessi utenti
-       
-       - ADESSO: Referral_New_Payers = Signups × referral_rate × referral_capacity
-         → Ogni NUOVO registrato ha 2% probabilità di invitare 1 amico (una volta sola)
-         → La saturazione di mercato frena i referral quando ci si avvicina al tetto
-       
-       - Parametri:
-         * Referral_Monthly_Rate (default 0.02): probabilità lifetime che un nuovo
-           utente registrato inviti un amico (applicata alla coorte del mese)
-         * referral_capacity = max(0, 1 - Paying_Users_Start / Market_Max_PayingUsers)
-           Frena i referral quando il mercato è quasi pieno
-    
-    NEW FEATURES (v7.4): CONVERSIONE DA FREE ESISTENTI A PAID
-    ---------------------------------------------------------
-    
-    E) SECONDA FONTE DI CONVERSIONE FREE → PAID:
-       - PRIMA: Solo i nuovi signup del mese potevano convertire a paid
-       
-       - ADESSO: Anche gli utenti free GIÀ ESISTENTI convertono ogni mese
-         → Una percentuale degli utenti free "attivi" diventa pagante
-         → Riflette la dinamica reale SaaS dove utenti upgrade dopo mesi di utilizzo
-       
-       - Nuovi parametri:
-         * Existing_Free_to_Paid_Monthly_Conv_Rate (default 0.0075): 0.75% al mese
-         * Free_Active_Share (default 0.5): 50% dei free users sono "attivi"
-       
-       - Formula:
-         * Free_Active_Users = Free_Users_Start × Free_Active_Share
-         * New_Payers_from_Existing_Free = Free_Active_Users × Conv_Rate
-       
-       - Nuove colonne output:
-         * New_Payers_from_New_Signups: conversione immediata da nuovi signup
-         * New_Payers_from_Existing_Free: conversione ritardata da free esistenti
-         * New_Payers_from_Referral: nuovi paganti da referral
-         * Free_Active_Users: utenti free attivi (50% default)
-       
-       - New_Paying_Users ora = somma delle 3 componenti sopra
+    Month-by-month simulation behind recalc_model (all parameters are floats).
 
-       - FASE 2 (Followers >= Soglia):
-         * Budget → Click Ads (CPC-based)
-         * Genera: Clicks → Visitors
-         * Aumenta Visitors_Total → entra nel funnel conversione
-       
-       - Parametri chiave:
-         * PaidAds_Monthly_Budget: budget mensile paid ads (uguale per tutti gli anni)
-         * PaidAds_Max_Total_Budget: budget complessivo massimo (0 = illimitato)
-           Quando raggiunto, le campagne si fermano automaticamente
-         * FollowerAds_CPM_EUR: costo per 1000 impressions
-         * FollowerAds_Reach_to_Follower_Rate: % reach che diventa follower
-         * ClickAds_CPC_EUR: costo per click
-         * Follower_Threshold_For_Click_Ads: soglia di switch (default 20k)
-    
-    Args:
-        assumptions_df: DataFrame with assumptions (single Value column)
-        monthly_df: DataFrame with monthly data (will be regenerated for n_years*12 months)
-        n_years: Number of years to simulate (default 3)
-    
-    Returns:
-        (monthly_df_recalc, yearly_df_recalc)
+    Returns (out, is_global): out has one row per month with the MONTHLY_COLUMNS values,
+    is_global flags the months in the GLOBAL market phase.
     """
-    # Parse assumptions
-    params = parse_assumptions(assumptions_df)
-    
-    # Extract core parameters (single value for all years)
-    arpu = params.get('ARPU', 20)
-    # NOTA: GrossMargin NON è più un parametro di input - è calcolato dinamicamente
-    #       Gross_Margin_Month = Gross_Profit / MRR (mensile)
-    #       Gross_Margin_Year = SUM(Gross_Profit) / SUM(MRR) (annuale)
-    conv_vs = params.get('ConvVS', 0.13)
-    conv_sp = params.get('ConvSP', 0.035)
-    
-    churn_y1 = params.get('Churn_Rate', params.get('ChurnY1', 0.06))  # Unified churn rate
-    churn_y2 = churn_y1  # Same for all years
-    churn_y3 = churn_y1  # Same for all years
-    
-    # ===== MARKET CAP PARAMETERS (TAM/SAM/SOM) - v7.2 =====
-    # Calibrati su beachhead iniziale: Zurigo/Svizzera (nicchia investitori + high earners)
-    # - Local: mercato di nicchia iniziale (hub finanziario come Zurigo)
-    # - Global: espansione internazionale (inglese, piattaforme globali)
-    market_max_followers_local = params.get('Market_Max_Followers_Local', 50000)
-    market_max_followers_global = params.get('Market_Max_Followers_Global', 1000000)
-    market_max_paying_local = params.get('Market_Max_PayingUsers_Local', 2000)
-    market_max_paying_global = params.get('Market_Max_PayingUsers_Global', 25000)
-    
-    # Per ora usiamo solo i tetti LOCAL (primi 3 anni = fase beachhead)
-    # NOTA: la logica passa automaticamente a GLOBAL quando i follower saturano il mercato locale
-    market_max_followers = market_max_followers_local
-    market_max_paying = market_max_paying_local
-    
-    # Adoption ramp: mesi necessari per raggiungere il massimo potenziale di crescita
-    # (rallenta la crescita iniziale perché brand è nuovo)
-    follower_adoption_ramp = params.get('Follower_Adoption_Ramp_Months', 24)
-    
-    # Global adoption ramp: quando si passa al mercato globale, la crescita riparte lentamente
-    global_adoption_ramp = params.get('Global_Adoption_Ramp_Months', 12)
-    
-    # Follower growth parameters
-    followers_0 = params.get('Followers_0', 1000)
-    follower_growth = params.get('Follower_Monthly_Growth', 0.08)  # r_base per crescita logistica
-    posts_per_month = params.get('Posts_per_Month_Y1', 120)  # Same for all years
-    reach_per_post = params.get('Reach_per_Post', 0.04)
-    non_follower_multiplier = params.get('NonFollower_Reach_Multiplier', 0.5)
-    frequency = params.get('Frequency_Impressions_per_User', 1.5)
-    ctr = params.get('Organic_CTR_to_Site', 0.015)
-    
-    # Influencer parameters
-    # NOTA: Inf_Visitors_per_Collab NON è più un parametro di input - è SEMPRE calcolato
-    #       Formula: Inf_Visitors_per_Collab = Inf_Avg_Followers × Inf_Reach_Rate × Inf_Click_Rate
-    #       Questo valore viene usato per calcolare Inf_Visitors = Inf_Collabs × inf_vpc
-    inf_avg_followers = params.get('Inf_Avg_Followers', 50000)
-    inf_reach_rate = params.get('Inf_Reach_Rate', 0.3)
-    inf_click_rate = params.get('Inf_Click_Rate', 0.02)
-    inf_vpc = inf_avg_followers * inf_reach_rate * inf_click_rate  # CALCOLATO DINAMICAMENTE
-    inf_collabs = params.get('Inf_Collabs_Y1', 1)  # Same for all years
-    inf_reward = params.get('Influencer_Reward_per_Sub', 10)
-    
-    # Referral parameters
-    referral_rate = params.get('Referral_Monthly_Rate', 0.02)
-    referral_reward = params.get('Referral_Reward_per_Sub', 10)
-    
-    # ===== FREE TO PAID CONVERSION PARAMETERS =====
-    # Conversione da utenti free ESISTENTI a paganti (non solo nuovi signups)
-    existing_free_to_paid_rate = params.get('Existing_Free_to_Paid_Monthly_Conv_Rate', 0.0075)  # 0.75% al mese
-    free_active_share = params.get('Free_Active_Share', 0.5)  # 50% dei free users sono attivi
-    
-    # Other channel parameters
-    org_cost_per_post = params.get('Org_Cost_per_Post', 1)
-    other_budget = params.get('Other_Marketing_Budget', params.get('Other_Marketing_Budget_Y1', 200))  # Unified for all years
-    
-    # Cost parameters
-    base_fixed_cost = params.get('BaseFixedCost', 1000)
-    fixed_cost_annual_growth = params.get('FixedCost_Annual_Growth', 0.05)  # 5% crescita annua default
-    datasub_fee = params.get('DataSub_Fee', 2000)
-    datasub_threshold = params.get('DataSub_MRR_Threshold', 5000)
-    xapi_fee = params.get('XAPI_Fee', 5000)
-    xapi_threshold = params.get('XAPI_MRR_Threshold', 15000)
-    
-    # ===== PAID SOCIAL ADS PARAMETERS =====
-    # Budget mensile unico per tutte le campagne paid ads (uguale per tutti gli anni)
-    paid_ads_monthly_budget = params.get('PaidAds_Monthly_Budget', 500)
-    # Budget massimo ANNUALE: se > 0, le campagne si fermano quando raggiunto nell'anno
-    paid_ads_max_annual_budget = params.get('PaidAds_Max_Annual_Budget', 0)  # 0 = illimitato
-    # Budget massimo TOTALE (lifetime): se > 0, le campagne si fermano quando raggiunto complessivamente
-    paid_ads_max_total_budget = params.get('PaidAds_Max_Total_Budget', 0)  # 0 = illimitato
-    
-    # Follower Ads (Fase 1: ottimizzazione per impressions/followers)
-    follower_ads_cpm = params.get('FollowerAds_CPM_EUR', 7)
-    follower_ads_reach_to_follower = params.get('FollowerAds_Reach_to_Follower_Rate', 0.1)
-    follower_ads_ctr_to_site = params.get('FollowerAds_CTR_to_Site', 0.01)  # CTR follower ads → site
-    
-    # Click Ads (Fase 2: ottimizzazione per link click dopo soglia followers)
-    click_ads_cpc = params.get('ClickAds_CPC_EUR', 2.0)
-    follower_threshold_for_clicks = params.get('Follower_Threshold_For_Click_Ads', 20000)
-    
-    # Generate monthly data for n_years * 12 months
-    n_months = n_years * 12
-    monthly_data = []
-    
+    out = np.empty((n_months, len(MONTHLY_COLUMNS)))
+    is_global = np.zeros(n_months, dtype=np.bool_)
+
+    # Stato che passa da un mese al successivo
+    followers_start = followers_0
+    paying_start = 0.0
+    free_users_start = 0.0
+    cumulative_signups = 0.0
+    cumulative_cash = 0.0
+
     # Track cumulative paid ads spend for budget cap
     cumulative_paid_ads_spend = 0.0
-    
+
     # Track annual paid ads spend (resets each year)
     annual_paid_ads_spend = 0.0
     current_tracking_year = 1
-    
-    # Track when global market phase starts (month index when local market saturated)
-    global_phase_start_month = None
-    
+
+    # Track when global market phase starts (month index when local market saturated, 0 = not yet)
+    global_phase_start_month = 0
+
     # Track cumulative marketing spend and new customers for CAC calculation
     cumulative_marketing_spend = 0.0
-    cumulative_new_customers = 0
-    
+    cumulative_new_customers = 0.0
+
     # Calculate all months
     for i in range(n_months):
         year = (i // 12) + 1
-        month = (i % 12) + 1
-        
+
         # ===== FOLLOWER GROWTH MECHANICS (MODELLO AD S) =====
-        if i == 0:
-            followers_start = followers_0
-        else:
-            followers_start = monthly_data[i-1]['Followers_End']
-        
+        # followers_start = Followers_End del mese precedente (Followers_0 al primo mese)
+
         # Month index (1-based): 1, 2, 3, ..., n_months
         month_index = i + 1
-        
+
         # ===== DETECT LOCAL → GLOBAL MARKET TRANSITION =====
         # Quando i follower raggiungono ~95% del mercato locale, passiamo al mercato globale
         local_saturation_ratio = followers_start / market_max_followers_local
         is_in_global_phase = local_saturation_ratio >= 0.95
-        
+
         # Registra quando inizia la fase globale (una volta sola)
-        if is_in_global_phase and global_phase_start_month is None:
+        if is_in_global_phase and global_phase_start_month == 0:
             global_phase_start_month = month_index
-        
-        # ===== CALCOLA IL TETTO DI MERCATO CORRENTE PER GLI ADS =====
+
+        # ===== CALCOLA IL TETTO DI MERCATO CORRENTE (ads e crescita organica) =====
         # - LOCAL: usa market_max_followers_local
         # - GLOBAL: usa market_max_followers_global (espansione internazionale)
+        # NOTA: La crescita organica rallenta quando raggiungiamo il tetto locale,
+        # ma nel mercato globale c'è ancora spazio per crescere
         if is_in_global_phase:
-            ads_market_max = market_max_followers_global
+            current_market_cap = market_max_followers_global
+            # Tetto paying users corrente (LOCAL o GLOBAL)
+            current_paying_cap = market_max_paying_global
             # Mesi trascorsi dall'inizio della fase globale
             months_in_global = month_index - global_phase_start_month + 1
             # Nuova rampa di adozione per il mercato globale
-            ads_adoption_factor = min(months_in_global / global_adoption_ramp, 1.0)
-            # Saturazione rispetto al mercato GLOBALE
-            ads_saturation_factor = max(0.0, 1.0 - followers_start / ads_market_max)
+            adoption_factor = min(months_in_global / global_adoption_ramp, 1.0)
         else:
-            ads_market_max = market_max_followers_local
+            current_market_cap = market_max_followers_local
+            current_paying_cap = market_max_paying_local
             # Adoption factor normale (rampa locale)
-            ads_adoption_factor = min(month_index / follower_adoption_ramp, 1.0)
-            # Saturazione rispetto al mercato LOCALE
-            ads_saturation_factor = max(0.0, 1.0 - followers_start / ads_market_max)
-        
-        # ===== CRESCITA ORGANICA (sempre rispetto al tetto attuale) =====
-        # NOTA: La crescita organica rallenta quando raggiungiamo il tetto locale,
-        # ma nel mercato globale c'è ancora spazio per crescere
-        if is_in_global_phase:
-            # Nel mercato globale: crescita organica rispetto al tetto globale
-            organic_saturation_factor = max(0.0, 1.0 - followers_start / market_max_followers_global)
-            organic_adoption_factor = min(months_in_global / global_adoption_ramp, 1.0)
-        else:
-            # Nel mercato locale: crescita organica rispetto al tetto locale
-            organic_saturation_factor = max(0.0, 1.0 - followers_start / market_max_followers_local)
-            organic_adoption_factor = min(month_index / follower_adoption_ramp, 1.0)
-        
+            adoption_factor = min(month_index / follower_adoption_ramp, 1.0)
+        # Saturazione rispetto al mercato CORRENTE (LOCALE o GLOBALE), uguale per ads e organico
+        saturation_factor = max(0.0, 1.0 - followers_start / current_market_cap)
+
         # TASSO DI CRESCITA EFFETTIVO (modulato dalla rampa di adozione)
-        follower_growth_effective = follower_growth * organic_adoption_factor
-        
+        follower_growth_effective = follower_growth * adoption_factor
+
         # Nuovi follower organici del mese (crescita logistica ad S)
-        organic_follower_growth = followers_start * follower_growth_effective * organic_saturation_factor
-        
+        organic_follower_growth = followers_start * follower_growth_effective * saturation_factor
+
         # ===== PAID SOCIAL ADS - BIFASE LOGIC CON BUDGET CAP =====
         # Determina se siamo in Fase 1 (Follower Ads) o Fase 2 (Click Ads)
         # SPECIALE: Se follower_threshold_for_clicks = -1, rimani SEMPRE in Fase 1 (solo Follower Ads)
-        
+
         # Reset annual spend tracker at the start of each new year
         if year != current_tracking_year:
             annual_paid_ads_spend = 0.0
             current_tracking_year = year
-        
+
         # Calcola quanto budget è ancora disponibile questo mese
         # Considera ENTRAMBI i limiti: annuale e totale (lifetime)
         budget_this_month = paid_ads_monthly_budget
-        
+
         # Applica limite ANNUALE (se configurato)
         if paid_ads_max_annual_budget > 0:
-            annual_remaining = paid_ads_max_annual_budget - annual_paid_ads_spend
-            budget_this_month = min(budget_this_month, max(0, annual_remaining))
-        
+            budget_this_month = min(budget_this_month, max(0.0, paid_ads_max_annual_budget - annual_paid_ads_spend))
+
         # Applica limite TOTALE lifetime (se configurato)
         if paid_ads_max_total_budget > 0:
-            total_remaining = paid_ads_max_total_budget - cumulative_paid_ads_spend
-            budget_this_month = min(budget_this_month, max(0, total_remaining))
-        
+            budget_this_month = min(budget_this_month, max(0.0, paid_ads_max_total_budget - cumulative_paid_ads_spend))
+
+        # Campagne ferme di default: le fasi sotto valorizzano solo la propria parte
+        follower_ads_spend = 0.0
+        click_ads_spend = 0.0
+        paid_follower_ads_impressions = 0.0
+        paid_follower_ads_reach = 0.0
+        paid_follower_ads_new_followers = 0.0
+        paid_follower_ads_visitors = 0.0
+        paid_click_ads_visitors = 0.0
+
         # STOP ADS SE MERCATO (corrente) È SATURO
-        # Se ads_saturation_factor < 5%, non ha senso spendere per acquisire follower
-        ads_market_saturated = ads_saturation_factor < 0.05
-        
-        if ads_market_saturated:
-            # MERCATO SATURO: ferma tutte le campagne paid ads
-            follower_ads_spend = 0.0
-            click_ads_spend = 0.0
-            paid_follower_ads_impressions = 0.0
-            paid_follower_ads_reach = 0.0
-            paid_follower_ads_new_followers = 0.0
-            paid_follower_ads_visitors = 0.0
-            paid_click_ads_visitors = 0.0
-        elif budget_this_month > 0 and (follower_threshold_for_clicks < 0 or followers_start < follower_threshold_for_clicks):
-            # FASE 1: Budget per acquisire followers/impressions
+        # Se saturation_factor < 5%, non ha senso spendere per acquisire follower.
+        # Anche con BUDGET ESAURITO le campagne restano ferme
+        if saturation_factor < 0.05 or budget_this_month <= 0:
+            pass
+        elif follower_threshold_for_clicks < 0 or followers_start < follower_threshold_for_clicks:
+            # FASE 1: Budget per acquisire followers/impressions (click ads = 0)
             follower_ads_spend = budget_this_month
-            click_ads_spend = 0.0
-            
+
             # Calcola impressions generate dalle campagne follower
             paid_follower_ads_impressions = (follower_ads_spend / follower_ads_cpm) * 1000.0
-            
+
             # Calcola reach unica (dividi per frequenza)
             paid_follower_ads_reach = paid_follower_ads_impressions / frequency
-            
+
             # Nuovi followers acquisiti dalle campagne paid
             paid_follower_ads_new_followers = paid_follower_ads_reach * follower_ads_reach_to_follower
-            
+
             # Anche le follower ads generano visitors (CTR verso sito)
             paid_follower_ads_visitors = paid_follower_ads_reach * follower_ads_ctr_to_site
-            
-            # Click ads = 0 in Fase 1
-            paid_click_ads_visitors = 0.0
-        elif budget_this_month > 0:
-            # FASE 2: Budget per generare click/visitors
-            follower_ads_spend = 0.0
+        else:
+            # FASE 2: Budget per generare click/visitors (follower ads = 0)
             click_ads_spend = budget_this_month  # Stesso budget, diversa ottimizzazione
-            
-            # Follower ads = 0 in Fase 2
-            paid_follower_ads_impressions = 0.0
-            paid_follower_ads_reach = 0.0
-            paid_follower_ads_new_followers = 0.0
-            paid_follower_ads_visitors = 0.0
-            
+
             # Calcola visitors direttamente
             paid_click_ads_visitors = click_ads_spend / click_ads_cpc  # 1 click ≈ 1 visitor
-        else:
-            # BUDGET ESAURITO: campagne ferme
-            follower_ads_spend = 0.0
-            click_ads_spend = 0.0
-            paid_follower_ads_impressions = 0.0
-            paid_follower_ads_reach = 0.0
-            paid_follower_ads_new_followers = 0.0
-            paid_follower_ads_visitors = 0.0
-            paid_click_ads_visitors = 0.0
-        
+
         # Aggiorna spesa cumulativa (totale e annuale)
         month_ads_spend = follower_ads_spend + click_ads_spend
         cumulative_paid_ads_spend += month_ads_spend
         annual_paid_ads_spend += month_ads_spend
-        
+
         # Follower end = start + crescita organica (logistica) + paid followers
-        followers_end = followers_start + organic_follower_growth + paid_follower_ads_new_followers
-        
         # CAP: non superare mai il tetto di mercato corrente (LOCAL o GLOBAL)
-        current_market_cap = market_max_followers_global if is_in_global_phase else market_max_followers_local
-        followers_end = min(followers_end, current_market_cap)
-        
-        # Posts per month (same for all years now)
-        posts = posts_per_month
-        
+        followers_end = min(followers_start + organic_follower_growth + paid_follower_ads_new_followers,
+                            current_market_cap)
+
         # Social impressions and views
         avg_followers = (followers_start + followers_end) / 2
         impr_followers = avg_followers * posts * reach_per_post * frequency
         impr_non_followers = impr_followers * non_follower_multiplier
         social_views = impr_followers + impr_non_followers
         new_unique = impr_non_followers / frequency
-        
+
         # Organic visitors from social
         org_visitors = new_unique * ctr
-        
+
         # Influencer visitors (same for all years now)
         inf_visitors = inf_collabs * inf_vpc
-        
+
         # Other channel visitors (same for all years now)
         other_visitors = other_budget / 2.0
-        
+
         # FIX 3: Paid ads visitors (da ENTRAMBE le fasi: follower + click ads)
         paid_ads_visitors = paid_follower_ads_visitors + paid_click_ads_visitors
-        
+
         # Total visitors (now includes paid ads)
         visitors_total = org_visitors + inf_visitors + other_visitors + paid_ads_visitors
-        
+
         # Signups by channel
         signups_total = visitors_total * conv_vs
-        
+
         # Channel-specific signups (proportional to traffic)
         if visitors_total > 0:
             org_signups = signups_total * (org_visitors / visitors_total)
@@ -630,8 +469,8 @@ def recalc_model(assumptions_df: pd.DataFrame,
             other_signups = signups_total * (other_visitors / visitors_total)
             paid_ads_signups = signups_total * (paid_ads_visitors / visitors_total)  # NEW: signup da paid ads
         else:
-            org_signups = inf_signups = other_signups = paid_ads_signups = 0
-        
+            org_signups = inf_signups = other_signups = paid_ads_signups = 0.0
+
         # ===== REFERRAL - NUOVA LOGICA (v7.3) =====
         # Regole:
         # 1. Ogni NUOVO utente registrato (Signups) ha probabilità referral_rate di invitare 1 amico
@@ -642,54 +481,33 @@ def recalc_model(assumptions_df: pd.DataFrame,
         #
         # PRIMA (vecchia logica): Referral_New_Payers = Paying_Users_Start × referral_rate
         #   → Problema: ricalcolava la probabilità ogni mese sugli stessi utenti
-        
-        if i == 0:
-            paying_start = 0
-        else:
-            paying_start = monthly_data[i-1]['Paying_Users_End']
-        
-        # Tetto paying users corrente (LOCAL o GLOBAL)
-        current_paying_cap = market_max_paying_global if is_in_global_phase else market_max_paying_local
-        
+
         # Fattore di saturazione: quando il mercato è quasi pieno, i referral si spengono
         # referral_capacity ∈ [0, 1]: 1 = mercato vuoto, 0 = mercato pieno
         referral_capacity = max(0.0, 1.0 - paying_start / current_paying_cap) if current_paying_cap > 0 else 0.0
-        
+
         # Utenti "potenziali inviter": nuovi registrati del mese × probabilità di invitare
         # Nota: referral_rate è ora la probabilità lifetime che un nuovo utente inviti un amico
         potential_referral_inviters = signups_total * referral_rate
-        
+
         # Nuovi paying da referral = potenziali inviter × capacità di mercato residua
         referral_new_payers = potential_referral_inviters * referral_capacity
-        
+
         # Channel-specific new payers
         org_new_payers = org_signups * conv_sp
         inf_new_payers = inf_signups * conv_sp
         other_new_payers = other_signups * conv_sp
         paid_ads_new_payers = paid_ads_signups * conv_sp  # NEW: paying users da paid ads
-        
-        # Churn (cycle through Y1/Y2/Y3 rates)
-        year_mod = ((year - 1) % 3) + 1  # Cycles 1,2,3,1,2,3...
-        if year_mod == 1:
-            churn_rate = churn_y1
-        elif year_mod == 2:
-            churn_rate = churn_y2
-        else:
-            churn_rate = churn_y3
-        
+
+        # Churn unico per tutti gli anni (churn_rate già risolto da recalc_model)
         # User cohort dynamics - la parte di paying_end viene calcolata DOPO free users tracking
         churned = paying_start * churn_rate
-        
+
         # ===== FREE USERS TRACKING =====
         # Free users = utenti registrati che non pagano (ancora)
         # Signups cumulativi - Paying users = Free users
-        if i == 0:
-            cumulative_signups = signups_total
-            free_users_start = 0
-        else:
-            cumulative_signups = monthly_data[i-1]['Cumulative_Signups'] + signups_total
-            free_users_start = monthly_data[i-1]['Free_Users_End']
-        
+        cumulative_signups += signups_total
+
         # ===== CONVERSIONE DA FREE ESISTENTI A PAID (v7.4) =====
         # Logica: ogni mese, una percentuale degli utenti free ATTIVI converte a paid
         # Questo è ADDIZIONALE rispetto alla conversione immediata dei nuovi signup
@@ -699,186 +517,342 @@ def recalc_model(assumptions_df: pd.DataFrame,
         #
         # Esempio: 1000 free users, 50% attivi = 500 attivi
         #          500 × 0.75% = 3.75 → ~4 nuovi paying al mese da free esistenti
-        
         free_active_users = free_users_start * free_active_share
-        new_payers_from_existing_free = max(0, round(free_active_users * existing_free_to_paid_rate))
-        
+        new_payers_from_existing_free = max(0.0, np.rint(free_active_users * existing_free_to_paid_rate))
+
         # ===== COMPONENTI NUOVI PAGANTI SEPARATI =====
         # 1. Nuovi paganti da NUOVI signup (conversione immediata)
         new_payers_from_new_signups = org_new_payers + inf_new_payers + other_new_payers + paid_ads_new_payers
-        
-        # 2. Nuovi paganti da FREE ESISTENTI (conversione ritardata)
-        # Già calcolato sopra: new_payers_from_existing_free
-        
-        # 3. Nuovi paganti da REFERRAL (già calcolato)
-        new_payers_from_referral = referral_new_payers
-        
+
+        # 2. Nuovi paganti da FREE ESISTENTI (conversione ritardata): new_payers_from_existing_free
+        # 3. Nuovi paganti da REFERRAL: referral_new_payers
+
         # TOTALE nuovi paying users del mese
-        new_paying_total = new_payers_from_new_signups + new_payers_from_existing_free + new_payers_from_referral
-        
+        new_paying_total = new_payers_from_new_signups + new_payers_from_existing_free + referral_new_payers
+
         # Free users end = free users start + nuovi signups che NON convertono - free esistenti che convertono
         # - nuovi free = signups - nuovi paying da signups (quelli che convertono subito)
         # - sottrarre anche i free esistenti che convertono questo mese
         new_free_users = signups_total - new_payers_from_new_signups
-        free_users_end = max(0, free_users_start + new_free_users - new_payers_from_existing_free)
-        
+        free_users_end = max(0.0, free_users_start + new_free_users - new_payers_from_existing_free)
+
         # ===== PAYING USERS END (aggiornato con new_paying_total) =====
         # Ora include anche i paganti da free esistenti
-        paying_end = max(0, paying_start - churned + new_paying_total)
-        
         # CAP: non superare mai il tetto di mercato per paying users (LOCAL o GLOBAL)
-        paying_end = min(paying_end, current_paying_cap)
-        
+        paying_end = min(max(0.0, paying_start - churned + new_paying_total), current_paying_cap)
+
         # Total users = paying + free
         total_users_end = paying_end + free_users_end
-        
+
         # Revenue
         mrr = paying_end * arpu
-        
+
         # ===== MARKETING SPEND BY CHANNEL =====
         org_marketing = posts * org_cost_per_post
         inf_marketing = inf_new_payers * inf_reward
-        other_marketing = other_budget
         referral_marketing = referral_new_payers * referral_reward
         paid_ads_marketing = follower_ads_spend + click_ads_spend
-        total_marketing = org_marketing + inf_marketing + other_marketing + referral_marketing + paid_ads_marketing
-        
+        total_marketing = org_marketing + inf_marketing + other_budget + referral_marketing + paid_ads_marketing
+
         # ===== COSTS =====
-        datasub_cost = datasub_fee if mrr >= datasub_threshold else 0
-        xapi_cost = xapi_fee if mrr >= xapi_threshold else 0
-        
+        datasub_cost = datasub_fee if mrr >= datasub_threshold else 0.0
+        xapi_cost = xapi_fee if mrr >= xapi_threshold else 0.0
+
         # Fixed costs con crescita annuale
         # Anno 1: base_fixed_cost, Anno 2: base × (1+growth), Anno 3: base × (1+growth)^2, ...
-        current_fixed_cost = base_fixed_cost * ((1 + fixed_cost_annual_growth) ** (year - 1))
-        
+        current_fixed_cost = base_fixed_cost * ((1 + fixed_cost_annual_growth) ** float(year - 1))
+
         # ===== GROSS MARGIN DINAMICO (PARTE A) =====
         # Direct costs = costi variabili direttamente legati al servizio SaaS
         direct_costs = datasub_cost + xapi_cost
-        
+
         # Gross profit = MRR - Direct Costs
         gross_profit = mrr - direct_costs
-        
+
         # Gross margin mensile (gestisce divisione per zero)
         gross_margin_month = (gross_profit / mrr) if mrr > 0 else 0.0
-        
+
         # Total costs (include marketing + direct costs + fixed costs)
         total_costs = total_marketing + direct_costs + current_fixed_cost
-        
+
         # Cash flow
         net_cash_flow = mrr - total_costs
-        if i == 0:
-            cumulative_cash = net_cash_flow
-        else:
-            cumulative_cash = monthly_data[i-1]['Cumulative_Cash'] + net_cash_flow
-        
+        cumulative_cash += net_cash_flow
+
         # ===== CAC e LTV MENSILE (per grafici) =====
         # Aggiorna cumulativi
         cumulative_marketing_spend += total_marketing
         cumulative_new_customers += new_paying_total
-        
+
         # CAC cumulativo = totale speso / totale nuovi clienti
-        cumulative_cac = cumulative_marketing_spend / cumulative_new_customers if cumulative_new_customers > 0 else 0
-        
+        cumulative_cac = cumulative_marketing_spend / cumulative_new_customers if cumulative_new_customers > 0 else 0.0
+
         # CAC mensile = spesa marketing del mese / nuovi clienti del mese
-        monthly_cac = total_marketing / new_paying_total if new_paying_total > 0 else 0
-        
+        monthly_cac = total_marketing / new_paying_total if new_paying_total > 0 else 0.0
+
         # LTV = ARPU × Gross Margin / Churn (con gross margin mensile)
         # Se churn è 0, assumiamo cliente infinito ma cappato
         monthly_ltv = (arpu * gross_margin_month / churn_rate) if churn_rate > 0 else (arpu * gross_margin_month * 120)  # Cap a 10 anni
-        
+
         # LTV/CAC ratio
-        ltv_cac_ratio = monthly_ltv / cumulative_cac if cumulative_cac > 0 else 0
-        
-        # Store month data (includes all new Paid Ads and Gross Margin columns)
+        ltv_cac_ratio = monthly_ltv / cumulative_cac if cumulative_cac > 0 else 0.0
+
+        # Store month data (includes all new Paid Ads and Gross Margin columns), in MONTHLY_COLUMNS order
         # Calcola la saturazione rispetto al mercato CORRENTE (local o global)
-        current_market_max_for_display = market_max_followers_global if is_in_global_phase else market_max_followers_local
-        current_saturation_pct = (followers_start / current_market_max_for_display) * 100
-        
-        monthly_data.append({
-            'Year': year,
-            'Month': month,
-            'Followers_Start': followers_start,
-            'Followers_End': followers_end,
-            # === MARKET PHASE TRACKING (LOCAL → GLOBAL) ===
-            'Market_Phase': 'Global' if is_in_global_phase else 'Local',
-            'Market_Saturation_Pct': current_saturation_pct,  # % del mercato CORRENTE (local o global) raggiunto
-            'Ads_Saturation_Factor': ads_saturation_factor,  # Fattore saturazione per gli ads
-            # ===========================
-            'Posts': posts,
-            'Impr_Followers': impr_followers,
-            'Impr_NonFollowers': impr_non_followers,
-            'Social_Views': social_views,
-            'NewUnique_NonFollowers': new_unique,
-            'Org_Visitors': org_visitors,
-            'Inf_Visitors': inf_visitors,
-            'Other_Visitors': other_visitors,
-            # === PAID ADS COLUMNS ===
-            'FollowerAds_Spend': follower_ads_spend,
-            'ClickAds_Spend': click_ads_spend,
-            'Annual_PaidAds_Spend': annual_paid_ads_spend,  # Budget speso nell'anno corrente
-            'Cumulative_PaidAds_Spend': cumulative_paid_ads_spend,  # Budget speso cumulativo (lifetime)
-            'Paid_FollowerAds_Impressions': paid_follower_ads_impressions,
-            'Paid_FollowerAds_Reach': paid_follower_ads_reach,
-            'Paid_FollowerAds_NewFollowers': paid_follower_ads_new_followers,
-            'Paid_FollowerAds_Visitors': paid_follower_ads_visitors,
-            'Paid_ClickAds_Visitors': paid_click_ads_visitors,
-            'PaidAds_Visitors': paid_ads_visitors,  # Somma di entrambi
-            # ===========================
-            'Visitors_Total': visitors_total,
-            'Signups': signups_total,
-            'Org_Signups': org_signups,
-            'Inf_Signups': inf_signups,
-            'Other_Signups': other_signups,
-            'PaidAds_Signups': paid_ads_signups,  # NEW: signup da paid ads
-            # === NEW PAYERS BREAKDOWN (v7.4) ===
-            'New_Payers_from_New_Signups': new_payers_from_new_signups,  # Conversione immediata da nuovi signup
-            'New_Payers_from_Existing_Free': new_payers_from_existing_free,  # Conversione ritardata da free esistenti
-            'New_Payers_from_Referral': new_payers_from_referral,  # Da referral
-            'Referral_New_Payers': referral_new_payers,  # Legacy column (same as New_Payers_from_Referral)
-            # ===========================
-            'Org_New_Payers': org_new_payers,
-            'Inf_New_Payers': inf_new_payers,
-            'Other_New_Payers': other_new_payers,
-            'PaidAds_New_Payers': paid_ads_new_payers,  # NEW: paying users da paid ads
-            'New_Paying_Users': new_paying_total,  # UPDATED: ora include anche free esistenti convertiti
-            'Churn_Rate': churn_rate,
-            'Paying_Users_Start': paying_start,
-            'Churned_Users': churned,
-            'Paying_Users_End': paying_end,
-            # === FREE USERS COLUMNS (v7.4) ===
-            'Cumulative_Signups': cumulative_signups,
-            'Free_Users_Start': free_users_start,
-            'Free_Active_Users': free_active_users,  # NEW: free users attivi (50% default)
-            'Free_Users_End': free_users_end,
-            'Total_Users_End': total_users_end,
-            # ===========================
-            'ARPU': arpu,
-            'MRR': mrr,
-            'Org_Marketing_Spend': org_marketing,
-            'Inf_Marketing_Spend': inf_marketing,
-            'Other_Marketing_Spend': other_marketing,
-            'Referral_Marketing_Spend': referral_marketing,
-            'PaidAds_Marketing_Spend': paid_ads_marketing,  # NEW
-            'Total_Marketing_Spend': total_marketing,
-            # === GROSS MARGIN COLUMNS (NEW) ===
-            'Direct_Costs': direct_costs,
-            'Gross_Profit': gross_profit,
-            'Gross_Margin_Month': gross_margin_month,
-            # ===========================
-            'DataSub_Cost': datasub_cost,
-            'XAPI_Cost': xapi_cost,
-            'Base_Fixed_Cost': current_fixed_cost,  # Con crescita annuale applicata
-            'Total_Costs': total_costs,
-            'Net_Cash_Flow': net_cash_flow,
-            'Cumulative_Cash': cumulative_cash,
-            # === CAC e LTV MENSILE ===
-            'Monthly_CAC': monthly_cac,
-            'Cumulative_CAC': cumulative_cac,
-            'Monthly_LTV': monthly_ltv,
-            'LTV_CAC_Ratio': ltv_cac_ratio
-        })
+        current_saturation_pct = (followers_start / current_market_cap) * 100
+
+        is_global[i] = is_in_global_phase
+        out[i] = (
+            followers_start, followers_end, current_saturation_pct, saturation_factor,
+            posts, impr_followers, impr_non_followers, social_views, new_unique,
+            org_visitors, inf_visitors, other_visitors,
+            follower_ads_spend, click_ads_spend, annual_paid_ads_spend, cumulative_paid_ads_spend,
+            paid_follower_ads_impressions, paid_follower_ads_reach, paid_follower_ads_new_followers,
+            paid_follower_ads_visitors, paid_click_ads_visitors, paid_ads_visitors,
+            visitors_total, signups_total, org_signups, inf_signups, other_signups, paid_ads_signups,
+            new_payers_from_new_signups, new_payers_from_existing_free, referral_new_payers,
+            referral_new_payers, org_new_payers, inf_new_payers, other_new_payers, paid_ads_new_payers,
+            new_paying_total, churn_rate, paying_start, churned, paying_end,
+            cumulative_signups, free_users_start, free_active_users, free_users_end, total_users_end,
+            arpu, mrr, org_marketing, inf_marketing, other_budget,
+            referral_marketing, paid_ads_marketing, total_marketing,
+            direct_costs, gross_profit, gross_margin_month,
+            datasub_cost, xapi_cost, current_fixed_cost, total_costs, net_cash_flow, cumulative_cash,
+            monthly_cac, cumulative_cac, monthly_ltv, ltv_cac_ratio,
+        )
+
+        # Il mese successivo parte da qui
+        followers_start = followers_end
+        paying_start = paying_end
+        free_users_start = free_users_end
+
+    return out, is_global
+
+
+def recalc_model(assumptions_df: pd.DataFrame, 
+                 monthly_df: pd.DataFrame,
+                 n_years: int = 3) -> tuple:
+    """
+    Recalculate the financial model for Excel v7 format with dynamic duration.
+    
+    V7 has channel-specific breakdowns with social follower growth mechanics.
+    This function recalculates key metrics while preserving the v7 structure.
+    
+    NEW FEATURES (v7.1):
+    --------------------
+    
+    A) GROSS MARGIN DINAMICO:
+       - Direct_Costs = DataSub_Cost + XAPI_Cost (costi variabili SaaS)
+       - Gross_Profit = MRR - Direct_Costs
+       - Gross_Margin_Month = Gross_Profit / MRR (gestisce MRR=0)
+       - Yearly: Gross_Margin_Year = SUM(Gross_Profit) / SUM(MRR)
+       - LTV usa Gross_Margin_Year invece del parametro fisso GrossMargin
+    
+    B) PAID SOCIAL ADS - LOGICA BIFASE:
+       - FASE 1 (Followers < Soglia):
+         * Budget → Follower Ads (CPM-based)
+         * Genera: Impressions → Reach → NewFollowers
+         * Aumenta Followers_End
+    
+    NEW FEATURES (v7.2): CRESCITA AD S CON SATURAZIONE
+    ---------------------------------------------------
+    
+    C) MODELLO LOGISTICO PER FOLLOWER (no più crescita esponenziale infinita):
+       - Parametri TAM/SAM/SOM: tetti di mercato per followers e paying users
+       - Beachhead iniziale: Zurigo/Svizzera (max 50k followers, 2k paying users)
+       - Crescita ad S: lenta all'inizio (brand nuovo), rapida al centro, plateau al tetto
+       - Formula: Organic_NewFollowers = Followers × r_effective × (1 - Followers/Market_Max)
+       - Adoption Ramp: primi 24 mesi con crescita ridotta (r_effective < r_base)
+       - Cap sui paying users: non superano mai Market_Max_PayingUsers_Local
+    
+    NEW FEATURES (v7.3): NUOVA LOGICA REFERRAL
+    ------------------------------------------
+    
+    D) REFERRAL CON SATURAZIONE E PROBABILITÀ ONE-TIME:
+       - PRIMA: Referral_New_Payers = Paying_Users_Start × referral_rate
+         → Problema: ricalcolava la probabilità ogni mese sugli stessi utenti
+       
+       - ADESSO: Referral_New_Payers = Signups × referral_rate × referral_capacity
+         → Ogni NUOVO registrato ha 2% probabilità di invitare 1 amico (una volta sola)
+         → La saturazione di mercato frena i referral quando ci si avvicina al tetto
+       
+       - Parametri:
+         * Referral_Monthly_Rate (default 0.02): probabilità lifetime che un nuovo
+           utente registrato inviti un amico (applicata alla coorte del mese)
+         * referral_capacity = max(0, 1 - Paying_Users_Start / Market_Max_PayingUsers)
+           Frena i referral quando il mercato è quasi pieno
+    
+    NEW FEATURES (v7.4): CONVERSIONE DA FREE ESISTENTI A PAID
+    ---------------------------------------------------------
+    
+    E) SECONDA FONTE DI CONVERSIONE FREE → PAID:
+       - PRIMA: Solo i nuovi signup del mese potevano convertire a paid
+       
+       - ADESSO: Anche gli utenti free GIÀ ESISTENTI convertono ogni mese
+         → Una percentuale degli utenti free "attivi" diventa pagante
+         → Riflette la dinamica reale SaaS dove utenti upgrade dopo mesi di utilizzo
+       
+       - Nuovi parametri:
+         * Existing_Free_to_Paid_Monthly_Conv_Rate (default 0.0075): 0.75% al mese
+         * Free_Active_Share (default 0.5): 50% dei free users sono "attivi"
+       
+       - Formula:
+         * Free_Active_Users = Free_Users_Start × Free_Active_Share
+         * New_Payers_from_Existing_Free = Free_Active_Users × Conv_Rate
+       
+       - Nuove colonne output:
+         * New_Payers_from_New_Signups: conversione immediata da nuovi signup
+         * New_Payers_from_Existing_Free: conversione ritardata da free esistenti
+         * New_Payers_from_Referral: nuovi paganti da referral
+         * Free_Active_Users: utenti free attivi (50% default)
+       
+       - New_Paying_Users ora = somma delle 3 componenti sopra
+
+       - FASE 2 (Followers >= Soglia):
+         * Budget → Click Ads (CPC-based)
+         * Genera: Clicks → Visitors
+         * Aumenta Visitors_Total → entra nel funnel conversione
+       
+       - Parametri chiave:
+         * PaidAds_Monthly_Budget: budget mensile paid ads (uguale per tutti gli anni)
+         * PaidAds_Max_Total_Budget: budget complessivo massimo (0 = illimitato)
+           Quando raggiunto, le campagne si fermano automaticamente
+         * FollowerAds_CPM_EUR: costo per 1000 impressions
+         * FollowerAds_Reach_to_Follower_Rate: % reach che diventa follower
+         * ClickAds_CPC_EUR: costo per click
+         * Follower_Threshold_For_Click_Ads: soglia di switch (default 20k)
+    
+    Args:
+        assumptions_df: DataFrame with assumptions (single Value column)
+        monthly_df: DataFrame with monthly data (will be regenerated for n_years*12 months)
+        n_years: Number of years to simulate (default 3)
+    
+    Returns:
+        (monthly_df_recalc, yearly_df_recalc)
+    """
+    # Parse assumptions
+    params = parse_assumptions(assumptions_df)
+    
+    # Extract core parameters (single value for all years)
+    arpu = params.get('ARPU', 20)
+    # NOTA: GrossMargin NON è più un parametro di input - è calcolato dinamicamente
+    #       Gross_Margin_Month = Gross_Profit / MRR (mensile)
+    #       Gross_Margin_Year = SUM(Gross_Profit) / SUM(MRR) (annuale)
+    conv_vs = params.get('ConvVS', 0.13)
+    conv_sp = params.get('ConvSP', 0.035)
+    
+    churn_y1 = params.get('Churn_Rate', params.get('ChurnY1', 0.06))  # Unified churn rate
+    churn_y2 = churn_y1  # Same for all years
+    churn_y3 = churn_y1  # Same for all years
+    
+    # ===== MARKET CAP PARAMETERS (TAM/SAM/SOM) - v7.2 =====
+    # Calibrati su beachhead iniziale: Zurigo/Svizzera (nicchia investitori + high earners)
+    # - Local: mercato di nicchia iniziale (hub finanziario come Zurigo)
+    # - Global: espansione internazionale (inglese, piattaforme globali)
+    market_max_followers_local = params.get('Market_Max_Followers_Local', 50000)
+    market_max_followers_global = params.get('Market_Max_Followers_Global', 1000000)
+    market_max_paying_local = params.get('Market_Max_PayingUsers_Local', 2000)
+    market_max_paying_global = params.get('Market_Max_PayingUsers_Global', 25000)
+    
+    # Per ora usiamo solo i tetti LOCAL (primi 3 anni = fase beachhead)
+    # NOTA: la logica passa automaticamente a GLOBAL quando i follower saturano il mercato locale
+    market_max_followers = market_max_followers_local
+    market_max_paying = market_max_paying_local
+    
+    # Adoption ramp: mesi necessari per raggiungere il massimo potenziale di crescita
+    # (rallenta la crescita iniziale perché brand è nuovo)
+    follower_adoption_ramp = params.get('Follower_Adoption_Ramp_Months', 24)
     
-    monthly = pd.DataFrame(monthly_data)
+    # Global adoption ramp: quando si passa al mercato globale, la crescita riparte lentamente
+    global_adoption_ramp = params.get('Global_Adoption_Ramp_Months', 12)
+    
+    # Follower growth parameters
+    followers_0 = params.get('Followers_0', 1000)
+    follower_growth = params.get('Follower_Monthly_Growth', 0.08)  # r_base per crescita logistica
+    posts_per_month = params.get('Posts_per_Month_Y1', 120)  # Same for all years
+    reach_per_post = params.get('Reach_per_Post', 0.04)
+    non_follower_multiplier = params.get('NonFollower_Reach_Multiplier', 0.5)
+    frequency = params.get('Frequency_Impressions_per_User', 1.5)
+    ctr = params.get('Organic_CTR_to_Site', 0.015)
+    
+    # Influencer parameters
+    # NOTA: Inf_Visitors_per_Collab NON è più un parametro di input - è SEMPRE calcolato
+    #       Formula: Inf_Visitors_per_Collab = Inf_Avg_Followers × Inf_Reach_Rate × Inf_Click_Rate
+    #       Questo valore viene usato per calcolare Inf_Visitors = Inf_Collabs × inf_vpc
+    inf_avg_followers = params.get('Inf_Avg_Followers', 50000)
+    inf_reach_rate = params.get('Inf_Reach_Rate', 0.3)
+    inf_click_rate = params.get('Inf_Click_Rate', 0.02)
+    inf_vpc = inf_avg_followers * inf_reach_rate * inf_click_rate  # CALCOLATO DINAMICAMENTE
+    inf_collabs = params.get('Inf_Collabs_Y1', 1)  # Same for all years
+    inf_reward = params.get('Influencer_Reward_per_Sub', 10)
+    
+    # Referral parameters
+    referral_rate = params.get('Referral_Monthly_Rate', 0.02)
+    referral_reward = params.get('Referral_Reward_per_Sub', 10)
+    
+    # ===== FREE TO PAID CONVERSION PARAMETERS =====
+    # Conversione da utenti free ESISTENTI a paganti (non solo nuovi signups)
+    existing_free_to_paid_rate = params.get('Existing_Free_to_Paid_Monthly_Conv_Rate', 0.0075)  # 0.75% al mese
+    free_active_share = params.get('Free_Active_Share', 0.5)  # 50% dei free users sono attivi
+    
+    # Other channel parameters
+    org_cost_per_post = params.get('Org_Cost_per_Post', 1)
+    other_budget = params.get('Other_Marketing_Budget', params.get('Other_Marketing_Budget_Y1', 200))  # Unified for all years
+    
+    # Cost parameters
+    base_fixed_cost = params.get('BaseFixedCost', 1000)
+    fixed_cost_annual_growth = params.get('FixedCost_Annual_Growth', 0.05)  # 5% crescita annua default
+    datasub_fee = params.get('DataSub_Fee', 2000)
+    datasub_threshold = params.get('DataSub_MRR_Threshold', 5000)
+    xapi_fee = params.get('XAPI_Fee', 5000)
+    xapi_threshold = params.get('XAPI_MRR_Threshold', 15000)
+    
+    # ===== PAID SOCIAL ADS PARAMETERS =====
+    # Budget mensile unico per tutte le campagne paid ads (uguale per tutti gli anni)
+    paid_ads_monthly_budget = params.get('PaidAds_Monthly_Budget', 500)
+    # Budget massimo ANNUALE: se > 0, le campagne si fermano quando raggiunto nell'anno
+    paid_ads_max_annual_budget = params.get('PaidAds_Max_Annual_Budget', 0)  # 0 = illimitato
+    # Budget massimo TOTALE (lifetime): se > 0, le campagne si fermano quando raggiunto complessivamente
+    paid_ads_max_total_budget = params.get('PaidAds_Max_Total_Budget', 0)  # 0 = illimitato
+    
+    # Follower Ads (Fase 1: ottimizzazione per impressions/followers)
+    follower_ads_cpm = params.get('FollowerAds_CPM_EUR', 7)
+    follower_ads_reach_to_follower = params.get('FollowerAds_Reach_to_Follower_Rate', 0.1)
+    follower_ads_ctr_to_site = params.get('FollowerAds_CTR_to_Site', 0.01)  # CTR follower ads → site
+    
+    # Click Ads (Fase 2: ottimizzazione per link click dopo soglia followers)
+    click_ads_cpc = params.get('ClickAds_CPC_EUR', 2.0)
+    follower_threshold_for_clicks = params.get('Follower_Threshold_For_Click_Ads', 20000)
+    
+    # Generate monthly data for n_years * 12 months
+    # (parameters passed as floats: Excel/JSON values may be ints, the simulation works in float64)
+    n_months = n_years * 12
+    out, is_global = simulate_months(n_months, *map(float, (
+        arpu, conv_vs, conv_sp, churn_y1,
+        market_max_followers_local, market_max_followers_global,
+        market_max_paying_local, market_max_paying_global,
+        follower_adoption_ramp, global_adoption_ramp,
+        followers_0, follower_growth, posts_per_month, reach_per_post, non_follower_multiplier,
+        frequency, ctr, inf_vpc, inf_collabs, inf_reward, referral_rate, referral_reward,
+        existing_free_to_paid_rate, free_active_share, org_cost_per_post, other_budget,
+        base_fixed_cost, fixed_cost_annual_growth,
+        datasub_fee, datasub_threshold, xapi_fee, xapi_threshold,
+        paid_ads_monthly_budget, paid_ads_max_annual_budget, paid_ads_max_total_budget,
+        follower_ads_cpm, follower_ads_reach_to_follower, follower_ads_ctr_to_site,
+        click_ads_cpc, follower_threshold_for_clicks)))
+    
+    months = np.arange(n_months)
+    columns = dict(zip(MONTHLY_COLUMNS, out.T))
+    # Payers converted from existing free users are whole numbers (rounded in the loop)
+    columns['New_Payers_from_Existing_Free'] = columns['New_Payers_from_Existing_Free'].astype(np.int64)
+    monthly = pd.DataFrame({
+        'Year': months // 12 + 1,
+        'Month': months % 12 + 1,
+        'Followers_Start': columns.pop('Followers_Start'),
+        'Followers_End': columns.pop('Followers_End'),
+        'Market_Phase': np.where(is_global, 'Global', 'Local'),
+        **columns,
+    })
     
     # Recalculate yearly summary for n_years
     yearly_data = []
@@ -1353,6 +1327,9 @@ class ChartsWidget(QWidget):
         super().__init__()
         
         from PyQt6.QtWidgets import QScrollArea
+        from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
+        from matplotlib.figure import Figure
         
         # Main layout
         main_layout = QVBoxLayout()
@@ -1461,6 +1438,8 @@ class ChartsWidget(QWidget):
     
     def update_charts(self, monthly_df: pd.DataFrame):
         """Update all charts with new data and hover support."""
+        from matplotlib.ticker import FuncFormatter
+        
         self.monthly_df = monthly_df  # Store for hover tooltips
         self.figure.clear()
         
@@ -1485,7 +1464,7 @@ class ChartsWidget(QWidget):
         ax1.set_xlabel('Month', fontsize=8)
         ax1.set_ylabel('MRR (EUR)', fontsize=8)
         ax1.grid(True, alpha=0.3)
-        ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+        ax1.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'€{x:,.0f}'))
         ax1.tick_params(axis='both', labelsize=7)
         
         # Linea verticale quando ARR raggiunge €1M (MRR >= 83,333)
@@ -1536,7 +1515,7 @@ class ChartsWidget(QWidget):
         ax3.set_xlabel('Month', fontsize=8)
         ax3.set_ylabel('Cash (EUR)', fontsize=8)
         ax3.grid(True, alpha=0.3)
-        ax3.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+        ax3.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'€{x:,.0f}'))
         ax3.legend(fontsize=7)
         ax3.tick_params(axis='both', labelsize=7)
         
@@ -1560,7 +1539,7 @@ class ChartsWidget(QWidget):
         ax4.set_xlabel('Month', fontsize=8)
         ax4.set_ylabel('Spend (EUR)', fontsize=8)
         ax4.grid(True, alpha=0.3)
-        ax4.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+        ax4.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'€{x:,.0f}'))
         ax4.legend(loc='upper left', fontsize=6)
         ax4.tick_params(axis='both', labelsize=7)
         
@@ -1595,7 +1574,7 @@ class ChartsWidget(QWidget):
         ax6b.axhline(y=0, color='black', linestyle='--', linewidth=0.5, alpha=0.5)
         ax6b.set_ylabel('Net Cash Flow (EUR)', color='#c0392b', fontsize=8)
         ax6b.tick_params(axis='y', labelcolor='#c0392b', labelsize=7)
-        ax6b.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+        ax6b.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'€{x:,.0f}'))
         
         ax6.set_title('Unit Economics: Gross Margin & Cash Flow', fontweight='bold', fontsize=10)
         ax6.set_xlabel('Month', fontsize=8)
@@ -1635,7 +1614,7 @@ class ChartsWidget(QWidget):
         ax7.set_xlabel('Month', fontsize=8)
         ax7.set_ylabel('EUR', fontsize=8)
         ax7.grid(True, alpha=0.3)
-        ax7.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+        ax7.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'€{x:,.0f}'))
         ax7.legend(fontsize=7, loc='upper left')
         ax7.tick_params(axis='both', labelsize=7)
         
@@ -1708,7 +1687,7 @@ class ChartsWidget(QWidget):
             ax10.set_xlabel('Month', fontsize=8)
             ax10.set_ylabel('EUR', fontsize=8, color='#2c3e50')
             ax10.grid(True, alpha=0.3)
-            ax10.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+            ax10.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'€{x:,.0f}'))
             ax10.tick_params(axis='both', labelsize=7)
             
             # Asse secondario per LTV/CAC ratio
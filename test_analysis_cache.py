@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test: a warm run (sheet read from .cache) gives exactly the same results as a cold run,
+for both analyze_model.py and analyze_model_v2.py.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import Workbook
+
+import analyze_model
+import analyze_model_v2
+
+# Small workbook with the Model sheet layout both analyzers expect
+ASSUMPTIONS = {
+    'ConvVS': 0.05, 'ConvSP': 0.2,
+    'Org_Share_Y1': 0.4, 'Org_Share_Y2': 0.35, 'Org_Share_Y3': 0.3,
+    'Inf_Share_Y1': 0.3, 'Inf_Share_Y2': 0.35, 'Inf_Share_Y3': 0.4,
+    'Ref_Share_Y1': 0.2, 'Ref_Share_Y2': 0.2, 'Ref_Share_Y3': 0.2,
+    'Other_Share_Y1': 0.1, 'Other_Share_Y2': 0.1, 'Other_Share_Y3': 0.1,
+    'CAC_Org': 20, 'CAC_Inf': 35.5, 'CAC_Ref': 10, 'CAC_Other': 50,
+    'Inf_Avg_Followers': 50000, 'Inf_Reach_Rate': 0.1, 'Inf_Click_Rate': 0.02,
+    'Social_View_to_Visit_Conv': 0.015,
+    'Inf_Collabs_Y1': 2, 'Inf_Collabs_Y2': 5, 'Inf_Collabs_Y3': 9,
+    'ChurnY1': 0.08, 'ChurnY2': 0.05, 'ChurnY3': 0.03,
+    'ARPU': 19.9, 'GrossMargin': 0.8, 'BaseFixedCost': 1500,
+    'DataSub_MRR_Threshold': 5000, 'DataSub_Fee': 300,
+    'XAPI_MRR_Threshold': 12000, 'XAPI_Fee': 200,
+}
+MONTHLY_HEADERS = ['Year', 'Month', 'Social_Views', 'Visitors_from_Social', 'Inf_Visitors', 'Visitors_Total',
+                   'Signups', 'New_Paying_Users', 'Paying_Users_Start', 'Churn_Rate', 'Churned_Users',
+                   'Paying_Users_End', 'CAC_per_New_User', 'Marketing_Spend', 'ARPU', 'MRR', 'DataSub_Cost',
+                   'XAPI_Cost', 'Base_Fixed_Cost', 'Total_Costs', 'Net_Cash_Flow', 'Cumulative_Cash']
+
+
+def make_workbook(path):
+    """Assumptions in rows 4-38 (header in row 3), monthly header in row 52, 36 months below."""
+    wb = Workbook()
+    ws = wb.active
+    ws.title = 'Model'
+    for col, header in enumerate(('Category', 'Parameter', 'Value'), start=1):
+        ws.cell(row=3, column=col, value=header)
+    for row, (param, value) in enumerate(ASSUMPTIONS.items(), start=4):
+        ws.cell(row=row, column=1, value='Test')
+        ws.cell(row=row, column=2, value=param)
+        ws.cell(row=row, column=3, value=value)
+    for col, header in enumerate(MONTHLY_HEADERS, start=1):
+        ws.cell(row=52, column=col, value=header)
+    for month in range(36):
+        ws.cell(row=53 + month, column=1, value=month // 12 + 1)
+        ws.cell(row=53 + month, column=2, value=month % 12 + 1)
+        ws.cell(row=53 + month, column=3, value=int(20000 * 1.12 ** month))
+    wb.save(path)
+
+
+def no_workbook(*args, **kwargs):
+    raise AssertionError("warm run opened the workbook instead of reading the cache")
+
+
+def run_v1(path):
+    analyzer = analyze_model.FinancialModelAnalyzer(str(path))
+    analyzer.load_excel()
+    analyzer.extract_assumptions()
+    analyzer.extract_monthly_model()
+    analyzer.extract_yearly_summary()
+    return analyzer
+
+
+def run_v2(path):
+    analyzer = analyze_model_v2.FinancialModelAnalyzer(str(path))
+    analyzer.load_and_calculate()
+    return analyzer
+
+
+def check_warm_matches_cold(module, run):
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        xlsx = tmp / 'model.xlsx'
+        make_workbook(xlsx)
+
+        original_dir, original_loader = module.CACHE_DIR, module.load_workbook
+        module.CACHE_DIR = tmp / '.cache'
+        try:
+            cold = run(xlsx)
+            assert len(list(module.CACHE_DIR.iterdir())) == 1, "cold run did not write the sheet cache"
+
+            module.load_workbook = no_workbook
+            warm = run(xlsx)
+        finally:
+            module.CACHE_DIR, module.load_workbook = original_dir, original_loader
+
+    assert warm.assumptions == cold.assumptions
+    pd.testing.assert_frame_equal(warm.monthly_df, cold.monthly_df)
+    if cold.yearly_df is None:
+        assert warm.yearly_df is None
+    else:
+        pd.testing.assert_frame_equal(warm.yearly_df, cold.yearly_df)
+
+
+def test_analyze_model_cache():
+    check_warm_matches_cold(analyze_model, run_v1)
+
+
+def test_analyze_model_v2_cache():
+    check_warm_matches_cold(analyze_model_v2, run_v2)
+
+
+if __name__ == '__main__':
+    test_analyze_model_cache()
+    test_analyze_model_v2_cache()
+    print("\n✅ Warm runs reproduce cold runs")
@@ -14,9 +14,8 @@ ws = wb['Model']
 # Cerca e modifica i parametri
 changes_made = []
 
-for row in range(4, 100):
-    param = ws.cell(row=row, column=2).value  # Column B = Parameter
-    
+# Un solo passaggio iter_rows sulla colonna B (Parameter), righe 4-99
+for row, (param,) in enumerate(ws.iter_rows(min_row=4, max_row=99, min_col=2, max_col=2, values_only=True), start=4):
     if param is None:
         continue
     